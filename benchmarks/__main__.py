@@ -0,0 +1,321 @@
+"""Benchmark the repositories, application handlers and GraphQL API.
+
+    python -m benchmarks run --sizes 1000,100000 --output results.json
+    python -m benchmarks run --baseline baseline.json   # run, then compare
+    python -m benchmarks compare baseline.json results.json
+    python -m benchmarks load --size 10000 --rate 200 --duration 30
+    python -m benchmarks replay capture.jsonl --database prod-copy.db --speed 2
+    python -m benchmarks startup --sizes 0,100000 --store sqlite --output startup.json
+    python -m benchmarks memory --sizes 1000,100000
+
+Every layer runs against a synthetic catalog of each size (1k, 100k and
+1M books by default; 1M needs several GB of memory with the in-memory
+store). `compare` exits with status 1 when a benchmark's median time grew
+by more than the threshold. `load` drives the app with an open-loop,
+weighted mix of GraphQL operations and reports latency percentiles;
+`replay` re-issues traffic recorded with BOOKSHELF_CAPTURE_PATH instead.
+`--compiled` answers the benchmark queries with compiled execution
+plans (BOOKSHELF_COMPILED_OPERATIONS). `startup` times imports and the
+first query in fresh interpreters; its results compare like any others.
+`memory` reports the bytes each book's aggregates hold, reviews and value
+objects included.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import shutil
+import sys
+import tempfile
+from dataclasses import asdict, replace
+from pathlib import Path
+
+from benchmarks import graphql, handlers, repository
+from benchmarks.loadgen import (
+    DEFAULT_MIX,
+    LoadReport,
+    format_report,
+    generate_load,
+    parse_mix,
+)
+from benchmarks.memory import measure_footprint
+from benchmarks.replay import capture_files, read_capture, replay
+from benchmarks.startup import measure_startup
+from benchmarks.harness import (
+    Result,
+    build_catalog,
+    compare,
+    format_duration,
+    load_results,
+    measure,
+    save_results,
+)
+from bookshelf.adapters.bootstrap import Container
+from bookshelf.adapters.settings import Settings
+
+LAYERS = {
+    "repository": repository.benchmarks,
+    "handlers": handlers.benchmarks,
+    "graphql": graphql.benchmarks,
+}
+
+
+def _settings(
+    store: str, directory: Path, response_cache: bool = False, compiled: bool = False
+) -> Settings:
+    settings = Settings.from_env()
+    if compiled:
+        operations = directory / "compiled-operations.json"
+        operations.write_text(json.dumps(graphql.QUERIES))
+        settings = replace(settings, compiled_operations_path=operations)
+    return replace(
+        settings,
+        database_path=directory / "bench.db" if store == "sqlite" else None,
+        # Cached responses would turn every query after the first into a lookup.
+        response_cache_max_bytes=settings.response_cache_max_bytes if response_cache else 0,
+    )
+
+
+async def run_suite(
+    sizes: list[int],
+    layers: list[str],
+    *,
+    store: str,
+    min_time: float,
+    selection: str | None,
+    compiled: bool = False,
+) -> list[Result]:
+    results: list[Result] = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            print(f"Loading a catalog of {size:,} books ({store})...", file=sys.stderr)
+            settings = _settings(store, Path(directory), compiled=compiled)
+            catalog = await build_catalog(size, settings)
+            try:
+                for layer in layers:
+                    for benchmark in await LAYERS[layer](catalog):
+                        if selection and selection not in f"{layer}/{benchmark.name}":
+                            continue
+                        result = await measure(benchmark, size, min_time=min_time)
+                        results.append(result)
+                        print(
+                            f"{result.key:<40} {format_duration(result.median_ns):>10} median "
+                            f"{format_duration(result.p95_ns):>10} p95 {result.rounds:>7} rounds"
+                        )
+            finally:
+                await catalog.container.stop()
+    return results
+
+
+async def run_load(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"Loading a catalog of {args.size:,} books ({args.store})...", file=sys.stderr)
+        settings = _settings(
+            args.store,
+            Path(directory),
+            response_cache=args.response_cache,
+            compiled=args.compiled,
+        )
+        catalog = await build_catalog(args.size, settings)
+        try:
+            load = await generate_load(
+                graphql.operations(catalog),
+                parse_mix(args.mix),
+                rate=args.rate,
+                duration=args.duration,
+                warmup=args.warmup,
+                arrival=args.arrival,
+                max_in_flight=args.max_in_flight,
+            )
+        finally:
+            await catalog.container.stop()
+    _print_load_report(load, args.output)
+
+
+async def run_replay(args: argparse.Namespace) -> None:
+    paths = capture_files(args.capture)
+    if not paths:
+        raise ValueError(f"No capture files at {args.capture}")
+    operations = read_capture(paths)
+    print(f"Replaying {len(operations):,} operations from {len(paths)} files", file=sys.stderr)
+    with tempfile.TemporaryDirectory() as directory:
+        settings = _settings(
+            "sqlite" if args.database else args.store,
+            Path(directory),
+            response_cache=args.response_cache,
+        )
+        if args.database is not None:
+            # Replay writes; keep the original database untouched.
+            shutil.copyfile(args.database, settings.database_path)  # type: ignore[arg-type]
+            container = Container(settings=settings)
+            await container.start()
+        else:
+            container = (await build_catalog(args.size, settings)).container
+        graphql.mount(container)
+        try:
+            load = await replay(operations, speed=args.speed, max_in_flight=args.max_in_flight)
+        finally:
+            await container.stop()
+    _print_load_report(load, args.output)
+
+
+async def run_startup(args: argparse.Namespace) -> list[Result]:
+    results: list[Result] = []
+    for size in (int(size) for size in args.sizes.split(",")):
+        print(f"Starting the app {args.runs} times over {size:,} books...", file=sys.stderr)
+        for result in await measure_startup(
+            size, store=args.store, runs=args.runs, fast_start=args.fast_start
+        ):
+            results.append(result)
+            print(
+                f"{result.key:<40} {format_duration(result.median_ns):>10} median "
+                f"{format_duration(result.min_ns):>10} min"
+            )
+    return results
+
+
+def run_memory(args: argparse.Namespace) -> None:
+    footprints = []
+    for size in (int(size) for size in args.sizes.split(",")):
+        footprint = measure_footprint(size)
+        footprints.append(footprint)
+        print(
+            f"{size:>10,} books {footprint.reviews:>10,} reviews "
+            f"{footprint.total_bytes / 2**20:>10.1f} MiB {footprint.bytes_per_book:>8,.0f} bytes/book"
+        )
+    if args.output is not None:
+        payload = [{**asdict(f), "bytes_per_book": f.bytes_per_book} for f in footprints]
+        args.output.write_text(json.dumps(payload, indent=2) + "\n")
+
+
+def _print_load_report(load: LoadReport, output: Path | None) -> None:
+    print(format_report(load))
+    if output is not None:
+        output.write_text(json.dumps(load.to_json(), indent=2) + "\n")
+
+
+def report(baseline: dict[str, Result], current: dict[str, Result], threshold: float) -> bool:
+    regressions, improvements, _ = compare(baseline, current, threshold)
+    for title, changes in (("Regressions", regressions), ("Improvements", improvements)):
+        if changes:
+            print(f"\n{title} (threshold {threshold:.0%}):")
+        for change in changes:
+            print(
+                f"  {change.key:<40} {format_duration(change.baseline_ns):>10} -> "
+                f"{format_duration(change.current_ns):>10}  ({change.ratio - 1:+.1%})"
+            )
+    missing = sorted(baseline.keys() - current.keys())
+    if missing:
+        print(f"\nNot measured in this run: {', '.join(missing)}")
+    if not regressions:
+        print("\nNo regressions.")
+    return not regressions
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the suite and write results as JSON")
+    run.add_argument("--sizes", default="1000,100000,1000000", help="comma-separated book counts")
+    run.add_argument(
+        "--layers", default=",".join(LAYERS), help=f"comma-separated, from {', '.join(LAYERS)}"
+    )
+    run.add_argument("--select", default=None, help="only benchmarks whose layer/name contains this")
+    run.add_argument("--store", choices=("memory", "sqlite"), default="memory")
+    run.add_argument("--min-time", type=float, default=1.0, help="seconds per benchmark")
+    run.add_argument("--output", type=Path, default=Path("benchmark-results.json"))
+    run.add_argument("--baseline", type=Path, default=None, help="compare against this file")
+    run.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown (0.10 = 10%%)")
+    run.add_argument("--compiled", action="store_true", help="answer the queries with plans")
+
+    diff = commands.add_parser("compare", help="flag regressions between two result files")
+    diff.add_argument("baseline", type=Path)
+    diff.add_argument("current", type=Path)
+    diff.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown (0.10 = 10%%)")
+
+    load = commands.add_parser("load", help="drive the app with an open-loop request mix")
+    load.add_argument("--size", type=int, default=10_000, help="books in the catalog")
+    load.add_argument("--store", choices=("memory", "sqlite"), default="memory")
+    load.add_argument("--rate", type=float, default=100.0, help="requests per second")
+    load.add_argument("--duration", type=float, default=30.0, help="measured seconds")
+    load.add_argument("--warmup", type=float, default=5.0, help="unmeasured seconds first")
+    load.add_argument(
+        "--mix",
+        default=",".join(f"{name}={weight:g}" for name, weight in DEFAULT_MIX.items()),
+        help="weighted operations, e.g. book=40,createBook=10",
+    )
+    load.add_argument("--arrival", choices=("poisson", "uniform"), default="poisson")
+    load.add_argument("--max-in-flight", type=int, default=10_000)
+    load.add_argument("--response-cache", action="store_true", help="keep the response cache on")
+    load.add_argument("--compiled", action="store_true", help="answer the queries with plans")
+    load.add_argument("--output", type=Path, default=None, help="write the report as JSON")
+
+    again = commands.add_parser("replay", help="re-issue captured traffic")
+    again.add_argument("capture", type=Path, help="capture file; rotated backups are included")
+    again.add_argument("--speed", type=float, default=1.0, help="2 replays twice as fast")
+    again.add_argument(
+        "--database", type=Path, default=None, help="replay against a copy of this SQLite file"
+    )
+    again.add_argument("--size", type=int, default=10_000, help="synthetic books otherwise")
+    again.add_argument("--store", choices=("memory", "sqlite"), default="memory")
+    again.add_argument("--max-in-flight", type=int, default=10_000)
+    again.add_argument("--response-cache", action="store_true", help="keep the response cache on")
+    again.add_argument("--output", type=Path, default=None, help="write the report as JSON")
+
+    start = commands.add_parser("startup", help="time cold starts in fresh interpreters")
+    start.add_argument("--sizes", default="0,10000", help="comma-separated book counts")
+    start.add_argument("--store", choices=("memory", "sqlite"), default="sqlite")
+    start.add_argument("--runs", type=int, default=10, help="cold starts per size")
+    start.add_argument("--fast-start", action="store_true", help="set BOOKSHELF_FAST_START")
+    start.add_argument("--output", type=Path, default=Path("startup-results.json"))
+    start.add_argument("--baseline", type=Path, default=None, help="compare against this file")
+    start.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown (0.10 = 10%%)")
+
+    memory = commands.add_parser("memory", help="measure the memory held per book")
+    memory.add_argument("--sizes", default="1000,100000", help="comma-separated book counts")
+    memory.add_argument("--output", type=Path, default=None, help="write the figures as JSON")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.command in ("load", "replay"):
+        try:
+            asyncio.run(run_load(args) if args.command == "load" else run_replay(args))
+        except ValueError as exc:
+            parser.error(str(exc))
+        return
+    if args.command == "memory":
+        run_memory(args)
+        return
+    if args.command == "compare":
+        ok = report(load_results(args.baseline), load_results(args.current), args.threshold)
+        sys.exit(0 if ok else 1)
+
+    if args.command == "startup":
+        results = asyncio.run(run_startup(args))
+    else:
+        layers = args.layers.split(",")
+        unknown = set(layers) - LAYERS.keys()
+        if unknown:
+            parser.error(f"unknown layers: {', '.join(sorted(unknown))}")
+        results = asyncio.run(
+            run_suite(
+                [int(size) for size in args.sizes.split(",")],
+                layers,
+                store=args.store,
+                min_time=args.min_time,
+                selection=args.select,
+                compiled=args.compiled,
+            )
+        )
+    save_results(args.output, results, store=args.store)
+    print(f"\nWrote {len(results)} results to {args.output}")
+    if args.baseline is not None:
+        ok = report(load_results(args.baseline), {r.key: r for r in results}, args.threshold)
+        sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""One cold start of the app, run in a fresh interpreter by benchmarks.startup.
+
+Nothing from the app is imported before the clock starts. Prints the
+nanoseconds from the first import until each milestone as one JSON line.
+"""
+
+import asyncio
+import json
+import time
+
+
+def main() -> None:
+    started = time.perf_counter_ns()
+    import bookshelf.adapters.bootstrap  # noqa: F401
+
+    bootstrap = time.perf_counter_ns()
+    import bookshelf.adapters.app as app_module
+
+    app = time.perf_counter_ns()
+    from benchmarks.graphql import TOP_BOOKS, post_graphql
+
+    async def first_query() -> int:
+        async with app_module.lifespan(app_module.app):
+            await post_graphql(TOP_BOOKS, {})
+            return time.perf_counter_ns()
+
+    answered = asyncio.run(first_query())
+    milestones = {
+        "import_bootstrap": bootstrap - started,
+        "import_app": app - started,
+        "first_query": answered - started,
+    }
+    print(json.dumps(milestones))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Full GraphQL operations, posted to the FastAPI app in-process over raw ASGI.
+
+No server or HTTP client is involved: each request is one call into the
+ASGI app, so the numbers cover routing, GraphQL parsing, validation, the
+schema extensions, resolvers and JSON encoding, but not the network.
+"""
+
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import bookshelf.adapters.app as app_module
+from benchmarks.harness import Benchmark, Catalog
+from bookshelf.adapters.bootstrap import Container
+
+BOOKS_PAGE = """
+query BooksPage($first: Int!) {
+  books(first: $first) {
+    totalCount
+    edges { node { id title averageRating author { name { fullName } } } }
+  }
+}
+"""
+BOOK = """
+query Book($id: String!) {
+  book(bookId: $id) {
+    ... on BookType { id title isbn reviewCount reviews { rating comment } }
+    ... on ErrorType { code }
+  }
+}
+"""
+CREATE_BOOK = """
+mutation CreateBook($input: CreateBookInput!) {
+  createBook(input: $input) {
+    ... on CreateBookResponse { bookId }
+    ... on ErrorType { code message }
+  }
+}
+"""
+TOP_BOOKS = """
+query TopBooks {
+  topBooks(first: 10) { id title averageRating reviewCount }
+}
+"""
+AUTHOR = """
+query Author($id: String!) {
+  author(authorId: $id) {
+    ... on AuthorType { id name { fullName } books { id title } }
+    ... on ErrorType { code }
+  }
+}
+"""
+ADD_REVIEW = """
+mutation AddReview($input: AddReviewInput!) {
+  addReviewToBook(input: $input) {
+    ... on BookType { id reviewCount }
+    ... on ErrorType { code message }
+  }
+}
+"""
+
+# The read operations, as registered for compiled execution plans.
+QUERIES = [BOOKS_PAGE, BOOK, TOP_BOOKS, AUTHOR]
+
+
+async def post_graphql(
+    query: str, variables: dict[str, Any], operation_name: str | None = None
+) -> dict[str, Any]:
+    """POST one operation to the app over ASGI and return the decoded response."""
+    payload = {"query": query, "variables": variables, "operationName": operation_name}
+    body = json.dumps(payload).encode()
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/graphql",
+        "raw_path": b"/graphql",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("127.0.0.1", 0),
+        "server": ("127.0.0.1", 80),
+    }
+    received = False
+    chunks: list[bytes] = []
+    status = 0
+
+    async def receive() -> dict[str, Any]:
+        nonlocal received
+        if received:
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app_module.app(scope, receive, send)
+    response = json.loads(b"".join(chunks))
+    if status != 200 or response.get("errors"):
+        raise RuntimeError(f"GraphQL request failed ({status}): {response}")
+    return response
+
+
+def mount(container: Container) -> None:
+    """Serve requests to the app from `container`."""
+    # The app resolves its context from this module attribute on every request.
+    app_module.container = container
+
+
+def operations(catalog: Catalog) -> dict[str, Callable[[], Awaitable[object]]]:
+    """The GraphQL operations, by name, each picking its targets from `catalog`."""
+    mount(catalog.container)
+
+    async def books_page() -> object:
+        return await post_graphql(BOOKS_PAGE, {"first": 20})
+
+    async def book() -> object:
+        return await post_graphql(BOOK, {"id": catalog.book_id()})
+
+    async def top_books() -> object:
+        return await post_graphql(TOP_BOOKS, {})
+
+    async def author() -> object:
+        return await post_graphql(AUTHOR, {"id": catalog.author_id()})
+
+    async def create_book() -> object:
+        return await post_graphql(
+            CREATE_BOOK,
+            {
+                "input": {
+                    "authorId": catalog.author_id(),
+                    "title": "Benchmark Book",
+                    "isbn": catalog.new_isbn(),
+                    "summary": "Created by the benchmark suite.",
+                    "publishedYear": 2024,
+                    "pageCount": 320,
+                    "genres": ["FICTION"],
+                }
+            },
+        )
+
+    async def add_review() -> object:
+        return await post_graphql(
+            ADD_REVIEW,
+            {"input": {"bookId": catalog.book_id(), "rating": 4, "comment": "Benchmark review."}},
+        )
+
+    return {
+        "books_page": books_page,
+        "book": book,
+        "topBooks": top_books,
+        "author": author,
+        "createBook": create_book,
+        "addReviewToBook": add_review,
+    }
+
+
+async def benchmarks(catalog: Catalog) -> list[Benchmark]:
+    return [
+        Benchmark("graphql", name, lambda _, run=run: run())
+        for name, run in operations(catalog).items()
+    ]
@@ -0,0 +1,32 @@
+"""Application handlers, called the way the GraphQL resolvers call them."""
+
+from benchmarks.harness import Benchmark, Catalog
+
+
+async def benchmarks(catalog: Catalog) -> list[Benchmark]:
+    container = catalog.container
+
+    async def create_book(_: int) -> object:
+        return await container.create_book_handler(
+            author_id=catalog.author_id(),
+            title="Benchmark Book",
+            isbn=catalog.new_isbn(),
+            summary="Created by the benchmark suite.",
+            published_year=2024,
+            page_count=320,
+            genres=["Fiction"],
+        )
+
+    async def add_review_to_book(_: int) -> object:
+        return await container.add_review_to_book_handler(
+            book_id=catalog.book_id(), rating=4, comment="Benchmark review."
+        )
+
+    async def get_all_books(_: int) -> object:
+        return await container.get_all_books_handler()
+
+    return [
+        Benchmark("handlers", "CreateBook", create_book),
+        Benchmark("handlers", "AddReviewToBook", add_review_to_book),
+        Benchmark("handlers", "GetAllBooks", get_all_books),
+    ]
@@ -0,0 +1,212 @@
+import gc
+import json
+import platform
+import random
+import statistics
+import subprocess
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from itertools import count
+from pathlib import Path
+from typing import Any
+
+from bookshelf.adapters.bootstrap import Container
+from bookshelf.adapters.settings import Settings
+from bookshelf.adapters.synthetic_catalog import (
+    CatalogSpec,
+    isbn13,
+    load_synthetic_catalog,
+)
+
+type Operation = Callable[[int], Awaitable[object]]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    layer: str
+    name: str
+    operation: Operation
+
+
+@dataclass
+class Result:
+    layer: str
+    name: str
+    size: int
+    rounds: int
+    min_ns: int
+    median_ns: int
+    mean_ns: int
+    p95_ns: int
+    stdev_ns: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.layer}/{self.name}@{self.size}"
+
+    @property
+    def ops_per_second(self) -> float:
+        return 1e9 / self.median_ns if self.median_ns else float("inf")
+
+
+@dataclass
+class Catalog:
+    """A populated container plus the IDs benchmarks pick their targets from."""
+
+    container: Container
+    size: int
+    book_ids: list[str]
+    author_ids: list[str]
+    isbns: list[str]
+    rng: random.Random = field(default_factory=lambda: random.Random(1))
+    # Far above the synthetic catalog's ISBN range, so created books never clash.
+    _new_isbns: Iterator[int] = field(default_factory=lambda: count(50_000_000))
+
+    def book_id(self) -> str:
+        return self.rng.choice(self.book_ids)
+
+    def author_id(self) -> str:
+        return self.rng.choice(self.author_ids)
+
+    def isbn(self) -> str:
+        return self.rng.choice(self.isbns)
+
+    def new_isbn(self) -> str:
+        return isbn13(next(self._new_isbns))
+
+
+def catalog_spec(size: int, seed: int = 42) -> CatalogSpec:
+    return CatalogSpec(authors=max(size // 20, 1), books=size, reviews=size * 2, seed=seed)
+
+
+async def build_catalog(size: int, settings: Settings, seed: int = 42) -> Catalog:
+    """Start a container and fill it with a synthetic catalog of `size` books."""
+    container = Container(settings=settings)
+    await container.start()
+    await load_synthetic_catalog(
+        catalog_spec(size, seed),
+        author_repository=container.author_repository,
+        book_repository=container.book_repository,
+        event_publisher=container.event_publisher,
+    )
+    book_ids: list[str] = []
+    isbns: list[str] = []
+    async for chunk in container.book_repository.iter_all():
+        book_ids.extend(str(book.id) for book in chunk)
+        isbns.extend(book.isbn.value for book in chunk)
+    author_ids: list[str] = []
+    async for authors in container.author_repository.iter_all():
+        author_ids.extend(str(author.id) for author in authors)
+    return Catalog(container, size, book_ids, author_ids, isbns)
+
+
+async def measure(
+    benchmark: Benchmark,
+    size: int,
+    *,
+    min_time: float,
+    min_rounds: int = 5,
+    max_rounds: int = 100_000,
+    warmup: int = 2,
+) -> Result:
+    """Time `benchmark` call by call until both `min_time` and `min_rounds` are reached."""
+    for i in range(warmup):
+        await benchmark.operation(-1 - i)
+    gc.collect()
+    samples: list[int] = []
+    deadline = time.perf_counter() + min_time
+    while len(samples) < max_rounds and (
+        len(samples) < min_rounds or time.perf_counter() < deadline
+    ):
+        started = time.perf_counter_ns()
+        await benchmark.operation(len(samples))
+        samples.append(time.perf_counter_ns() - started)
+    return summarize(benchmark.layer, benchmark.name, size, samples)
+
+
+def summarize(layer: str, name: str, size: int, samples: list[int]) -> Result:
+    samples = sorted(samples)
+    return Result(
+        layer=layer,
+        name=name,
+        size=size,
+        rounds=len(samples),
+        min_ns=samples[0],
+        median_ns=int(statistics.median(samples)),
+        mean_ns=int(statistics.fmean(samples)),
+        p95_ns=samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        stdev_ns=int(statistics.stdev(samples)) if len(samples) > 1 else 0,
+    )
+
+
+# ── Result files ──────────────────────────────────────────────
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_results(path: Path, results: list[Result], *, store: str) -> None:
+    document = {
+        "meta": {
+            "created_at": datetime.now(UTC).isoformat(),
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "store": store,
+        },
+        "results": [asdict(result) for result in results],
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n")
+
+
+def load_results(path: Path) -> dict[str, Result]:
+    document: dict[str, Any] = json.loads(path.read_text())
+    results = (Result(**fields) for fields in document["results"])
+    return {result.key: result for result in results}
+
+
+# ── Comparison ────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class Change:
+    key: str
+    baseline_ns: int
+    current_ns: int
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ns / self.baseline_ns if self.baseline_ns else float("inf")
+
+
+def compare(
+    baseline: dict[str, Result], current: dict[str, Result], threshold: float
+) -> tuple[list[Change], list[Change], list[Change]]:
+    """Split shared benchmarks into (regressions, improvements, unchanged) by median time."""
+    regressions: list[Change] = []
+    improvements: list[Change] = []
+    unchanged: list[Change] = []
+    for key in sorted(baseline.keys() & current.keys()):
+        change = Change(key, baseline[key].median_ns, current[key].median_ns)
+        if change.ratio > 1 + threshold:
+            regressions.append(change)
+        elif change.ratio < 1 / (1 + threshold):
+            improvements.append(change)
+        else:
+            unchanged.append(change)
+    return regressions, improvements, unchanged
+
+
+def format_duration(ns: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("µs", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f} {unit}"
+    return f"{ns:.0f} ns"
@@ -0,0 +1,199 @@
+"""Open-loop load generation against the in-process app.
+
+Requests are started on a fixed schedule, Poisson or evenly spaced, at the
+target rate whether or not earlier ones have finished. Latency is measured
+from each request's scheduled start, so time spent waiting behind a
+saturated event loop counts against the request rather than silently
+lowering the offered load.
+
+The generator shares the event loop and CPU with the app it drives. A
+report whose achieved rate falls short of the target means the process
+was saturated, not that the app merely slowed down.
+"""
+
+import asyncio
+import math
+import random
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+DEFAULT_MIX = {
+    "book": 40.0,
+    "author": 15.0,
+    "topBooks": 15.0,
+    "books_page": 10.0,
+    "createBook": 10.0,
+    "addReviewToBook": 10.0,
+}
+PERCENTILES = (50.0, 95.0, 99.0, 99.9)
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    """Parse "book=40,books_page=10,createBook=5" into operation weights."""
+    mix: dict[str, float] = {}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def percentile(ordered: list[int], p: float) -> int:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return 0
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(p / 100 * len(ordered)) - 1))]
+
+
+@dataclass
+class OperationReport:
+    operation: str
+    requests: int
+    errors: int
+    throughput: float
+    latency_ms: dict[str, float]
+
+
+@dataclass
+class LoadReport:
+    target_rate: float
+    achieved_rate: float
+    duration: float
+    dropped: int
+    operations: list[OperationReport] = field(default_factory=list)
+
+    def to_json(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class _Samples:
+    latencies_ns: list[int] = field(default_factory=list)
+    errors: int = 0
+
+
+def _summarize(name: str, samples: _Samples, duration: float) -> OperationReport:
+    ordered = sorted(samples.latencies_ns)
+    latency = {f"p{p:g}": percentile(ordered, p) / 1e6 for p in PERCENTILES}
+    latency["max"] = (ordered[-1] if ordered else 0) / 1e6
+    return OperationReport(
+        operation=name,
+        requests=len(ordered) + samples.errors,
+        errors=samples.errors,
+        throughput=len(ordered) / duration if duration else 0.0,
+        latency_ms=latency,
+    )
+
+
+type Request = tuple[float, str, Callable[[], Awaitable[object]]]
+
+
+async def drive(
+    schedule: Iterable[Request], *, measure_from: float = 0.0, max_in_flight: int = 10_000
+) -> tuple[dict[str, _Samples], int]:
+    """Start each (offset, name, call) request `offset` seconds after now, open loop.
+
+    Requests due before `measure_from` run but are not recorded. Returns the
+    samples per name and how many measured requests were dropped because
+    `max_in_flight` were still running.
+    """
+    loop = asyncio.get_running_loop()
+    samples: dict[str, _Samples] = {}
+    in_flight: set[asyncio.Task[None]] = set()
+    dropped = 0
+
+    async def issue(call: Callable[[], Awaitable[object]], scheduled: float, into: _Samples) -> None:
+        try:
+            await call()
+        except Exception:
+            into.errors += 1
+            return
+        into.latencies_ns.append(int((loop.time() - scheduled) * 1e9))
+
+    started = loop.time()
+    for offset, name, call in schedule:
+        scheduled = started + offset
+        delay = scheduled - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        # Requests that came due while the loop was busy start at once, late.
+        recorded = offset >= measure_from
+        if len(in_flight) >= max_in_flight:
+            if recorded:
+                dropped += 1
+            continue
+        into = samples.setdefault(name, _Samples()) if recorded else _Samples()
+        task = asyncio.create_task(issue(call, scheduled, into))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+    if in_flight:
+        await asyncio.wait(in_flight)
+    return samples, dropped
+
+
+def build_report(
+    samples: dict[str, _Samples], dropped: int, *, duration: float, target_rate: float
+) -> LoadReport:
+    reports = [_summarize(name, samples[name], duration) for name in sorted(samples)]
+    total = _Samples(
+        [ns for s in samples.values() for ns in s.latencies_ns],
+        sum(s.errors for s in samples.values()),
+    )
+    reports.append(_summarize("all", total, duration))
+    return LoadReport(
+        target_rate=target_rate,
+        achieved_rate=reports[-1].requests / duration if duration else 0.0,
+        duration=duration,
+        dropped=dropped,
+        operations=reports,
+    )
+
+
+async def generate_load(
+    operations: dict[str, Callable[[], Awaitable[object]]],
+    mix: dict[str, float],
+    *,
+    rate: float,
+    duration: float,
+    warmup: float = 0.0,
+    arrival: str = "poisson",
+    max_in_flight: int = 10_000,
+    seed: int = 0,
+) -> LoadReport:
+    """Offer `rate` requests per second drawn from `mix` for `warmup` + `duration` seconds."""
+    unknown = mix.keys() - operations.keys()
+    if unknown:
+        raise ValueError(f"Unknown operations: {', '.join(sorted(unknown))}")
+    rng = random.Random(seed)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+
+    def schedule() -> Iterator[Request]:
+        offset = 0.0
+        while True:
+            offset += rng.expovariate(rate) if arrival == "poisson" else 1 / rate
+            if offset >= warmup + duration:
+                return
+            name = rng.choices(names, weights)[0]
+            yield offset, name, operations[name]
+
+    samples, dropped = await drive(
+        schedule(), measure_from=warmup, max_in_flight=max_in_flight
+    )
+    return build_report(samples, dropped, duration=duration, target_rate=rate)
+
+
+def format_report(report: LoadReport) -> str:
+    columns = ["p50", "p95", "p99", "p99.9", "max"]
+    lines = [
+        f"Target {report.target_rate:.0f} req/s, achieved {report.achieved_rate:.1f} req/s "
+        f"over {report.duration:.0f}s ({report.dropped} dropped at the in-flight limit)",
+        f"{'operation':<18}{'requests':>9}{'errors':>8}{'req/s':>9}"
+        + "".join(f"{column + ' ms':>11}" for column in columns),
+    ]
+    for op in report.operations:
+        lines.append(
+            f"{op.operation:<18}{op.requests:>9}{op.errors:>8}{op.throughput:>9.1f}"
+            + "".join(f"{op.latency_ms[column]:>11.2f}" for column in columns)
+        )
+    return "\n".join(lines)
@@ -0,0 +1,51 @@
+"""Memory held by the domain model: a catalog's aggregates, measured with tracemalloc.
+
+Bytes per book cover the book with its reviews, genres and value objects,
+plus its share of the authors, so a figure times the catalog size
+approximates what the in-memory store needs for the aggregates themselves.
+"""
+
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from itertools import chain
+
+from benchmarks.harness import catalog_spec
+from bookshelf.adapters.synthetic_catalog import SyntheticCatalog
+from bookshelf.domain.model.author import Author
+from bookshelf.domain.model.book import Book
+
+
+@dataclass(frozen=True)
+class Footprint:
+    size: int
+    reviews: int
+    authors: int
+    total_bytes: int
+
+    @property
+    def bytes_per_book(self) -> float:
+        return self.total_bytes / self.size if self.size else 0.0
+
+
+def measure_footprint(size: int, seed: int = 42) -> Footprint:
+    """Generate a catalog of `size` books and measure the memory its aggregates retain."""
+    catalog = SyntheticCatalog(catalog_spec(size, seed))
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        authors: list[Author] = list(catalog.authors())
+        books: list[Book] = list(catalog.books([author.id for author in authors]))
+        for aggregate in chain(authors, books):
+            aggregate.collect_events()
+        gc.collect()
+        total = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return Footprint(
+        size=size,
+        reviews=sum(book.review_count for book in books),
+        authors=len(authors),
+        total_bytes=total,
+    )
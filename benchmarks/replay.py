@@ -0,0 +1,93 @@
+"""Replay captured GraphQL traffic against the in-process app.
+
+Captures are written by TrafficCaptureExtension when BOOKSHELF_CAPTURE_PATH
+is set. Operations are re-issued in their original order, each at its
+original offset from the first one divided by `speed`, open loop.
+
+IDs in captured variables only resolve against the data they were captured
+on: replay against a copy of that SQLite database, or against a synthetic
+catalog of the same size when the traffic was captured on one (synthetic
+catalogs are deterministic). Otherwise lookups still run but mostly miss.
+"""
+
+import json
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from benchmarks.graphql import post_graphql
+from benchmarks.loadgen import LoadReport, Request, build_report, drive
+
+
+@dataclass(frozen=True, slots=True)
+class CapturedOperation:
+    started_at: float
+    name: str
+    query: str
+    operation_name: str | None
+    variables: dict[str, Any]
+
+
+def capture_files(path: Path) -> list[Path]:
+    """`path` and its rotated backups that exist, oldest first."""
+    backups = sorted(
+        (
+            candidate
+            for candidate in path.parent.glob(f"{path.name}.*")
+            if candidate.suffix[1:].isdigit()
+        ),
+        key=lambda candidate: int(candidate.suffix[1:]),
+        reverse=True,
+    )
+    return [*backups, path] if path.exists() else backups
+
+
+def read_capture(paths: list[Path]) -> list[CapturedOperation]:
+    operations: list[CapturedOperation] = []
+    for path in paths:
+        documents: dict[str, str] = {}
+        with path.open(encoding="utf-8") as stream:
+            for line in stream:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record["type"] == "document":
+                    documents[record["hash"]] = record["query"]
+                elif record["type"] == "operation" and record["hash"] in documents:
+                    operations.append(
+                        CapturedOperation(
+                            started_at=record["started_at"],
+                            name=record["operation"] or f"anonymous:{record['hash'][:12]}",
+                            query=documents[record["hash"]],
+                            operation_name=record["operation"],
+                            variables=record["variables"],
+                        )
+                    )
+    operations.sort(key=lambda operation: operation.started_at)
+    return operations
+
+
+def _call(operation: CapturedOperation) -> Callable[[], Awaitable[object]]:
+    return lambda: post_graphql(operation.query, operation.variables, operation.operation_name)
+
+
+async def replay(
+    operations: list[CapturedOperation], *, speed: float = 1.0, max_in_flight: int = 10_000
+) -> LoadReport:
+    """Re-issue `operations` at their captured pace multiplied by `speed`."""
+    if speed <= 0:
+        raise ValueError("Replay speed must be positive")
+    first = operations[0].started_at if operations else 0.0
+
+    def schedule() -> Iterator[Request]:
+        for operation in operations:
+            yield (operation.started_at - first) / speed, operation.name, _call(operation)
+
+    samples, dropped = await drive(schedule(), max_in_flight=max_in_flight)
+    span = (operations[-1].started_at - first) / speed if operations else 0.0
+    # A capture of one burst has no span; report its rate over at least a millisecond.
+    duration = max(span, 1e-3)
+    return build_report(
+        samples, dropped, duration=duration, target_rate=len(operations) / duration
+    )
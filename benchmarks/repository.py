@@ -0,0 +1,36 @@
+"""Repository port operations, called directly on the configured implementation."""
+
+from benchmarks.harness import Benchmark, Catalog
+from bookshelf.domain.model.identifiers import AuthorId, BookId
+from bookshelf.domain.model.value_objects import ISBN
+
+
+async def benchmarks(catalog: Catalog) -> list[Benchmark]:
+    books = catalog.container.book_repository
+    sample = [await books.find_by_id(BookId(catalog.book_id())) for _ in range(100)]
+
+    async def save(i: int) -> None:
+        await books.save(sample[i % len(sample)])  # type: ignore[arg-type]
+
+    async def find_by_id(_: int) -> object:
+        return await books.find_by_id(BookId(catalog.book_id()))
+
+    async def isbn_exists(_: int) -> bool:
+        return await books.isbn_exists(ISBN(catalog.isbn()))
+
+    async def find_by_author(_: int) -> object:
+        return await books.find_by_author(AuthorId(catalog.author_id()))
+
+    async def iter_all(_: int) -> int:
+        loaded = 0
+        async for chunk in books.iter_all():
+            loaded += len(chunk)
+        return loaded
+
+    return [
+        Benchmark("repository", "save", save),
+        Benchmark("repository", "find_by_id", find_by_id),
+        Benchmark("repository", "isbn_exists", isbn_exists),
+        Benchmark("repository", "find_by_author", find_by_author),
+        Benchmark("repository", "iter_all", iter_all),
+    ]
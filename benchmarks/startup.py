@@ -0,0 +1,62 @@
+"""Cold-start times: each run imports and starts the app in a new interpreter.
+
+The catalog is prepared once, as a SQLite file or as a synthetic-catalog
+spec the app seeds from at startup, so every run starts from the same data.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+
+from benchmarks.harness import Result, build_catalog, catalog_spec, summarize
+from bookshelf.adapters.settings import Settings
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+async def _cold_start(env: dict[str, str]) -> dict[str, int]:
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "benchmarks.coldstart",
+        cwd=ROOT,
+        env=env,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        raise RuntimeError(f"Cold start failed:\n{stderr.decode()}")
+    return json.loads(stdout.decode().splitlines()[-1])
+
+
+async def measure_startup(
+    size: int, *, store: str, runs: int, fast_start: bool = False
+) -> list[Result]:
+    """Start the app `runs` times over a catalog of `size` books and time each milestone."""
+    with tempfile.TemporaryDirectory() as directory:
+        env = {
+            **os.environ,
+            "BOOKSHELF_FAST_START": "1" if fast_start else "",
+            "BOOKSHELF_DATABASE_PATH": "",
+            "BOOKSHELF_SYNTHETIC_CATALOG": "",
+        }
+        if store == "sqlite":
+            database = Path(directory) / "startup.db"
+            settings = replace(Settings.from_env(), database_path=database)
+            await (await build_catalog(size, settings)).container.stop()
+            env["BOOKSHELF_DATABASE_PATH"] = str(database)
+        else:
+            spec = catalog_spec(size)
+            env["BOOKSHELF_SYNTHETIC_CATALOG"] = (
+                f"authors={spec.authors},books={spec.books},reviews={spec.reviews},seed={spec.seed}"
+            )
+        samples: dict[str, list[int]] = {}
+        for _ in range(runs):
+            for name, ns in (await _cold_start(env)).items():
+                samples.setdefault(name, []).append(ns)
+    return [summarize("startup", name, size, times) for name, times in samples.items()]
@@ -1,32 +1,118 @@
-from collections.abc import AsyncIterator
+import json
+from collections.abc import AsyncIterator, Iterable
 from contextlib import asynccontextmanager
+from datetime import datetime
+from enum import StrEnum
+from typing import Annotated, Any
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Query
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from strawberry.fastapi import GraphQLRouter
 
 from bookshelf.adapters.bootstrap import Container
 from bookshelf.adapters.inbound.graphql.context import GraphQLContext
-from bookshelf.adapters.inbound.graphql.schema import schema
-from bookshelf.adapters.seeder import seed
+from bookshelf.adapters.inbound.graphql.fragments import encode_json
+from bookshelf.adapters.inbound.graphql.resolvers.queries import (
+    apply_author_filter,
+    apply_book_filter,
+)
+from bookshelf.adapters.inbound.graphql.schema import get_schema
+from bookshelf.adapters.inbound.graphql.types.enums import GenreEnum
+from bookshelf.adapters.inbound.graphql.types.inputs import AuthorFilter, BookFilter
+from bookshelf.adapters.seeder import seed_if_empty
+
+NDJSON = "application/x-ndjson"
+EXPORT_CHUNK_SIZE = 500
+
+# Genres are spelled as in the GraphQL API (FANTASY, SCI_FI), not by value.
+GenreName = StrEnum("GenreName", [(name, name) for name in GenreEnum.__members__])
 
 container = Container()
 
 
 async def get_context() -> GraphQLContext:
-    return container.graphql_context()
+    context = container.graphql_context()
+    if container.settings.fragment_cache_max_bytes > 0:
+        # This app's router writes responses with fragments.encode_json.
+        context.fragment_cache = container.fragment_cache
+    return context
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
-    await seed(
-        create_author=container.create_author_handler,
-        create_book=container.create_book_handler,
-        add_review=container.add_review_to_book_handler,
-    )
+    await container.start()
+    await seed_if_empty(container)
     yield
+    await container.stop()
 
 
-graphql_router = GraphQLRouter(schema, context_getter=get_context)
+class BookshelfGraphQLRouter(GraphQLRouter[GraphQLContext, None]):
+    def encode_json(self, data: object) -> str:
+        return encode_json(data)
+
+
+graphql_router = BookshelfGraphQLRouter(get_schema(), context_getter=get_context)
 
 app = FastAPI(title="Bookshelf API", version="1.0.0", lifespan=lifespan)
 app.include_router(graphql_router, prefix="/graphql")
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    return PlainTextResponse(
+        container.metrics.render(), media_type="text/plain; version=0.0.4"
+    )
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _ndjson(models: Iterable[Any]) -> bytes:
+    return "".join(
+        json.dumps(model.as_dict(), default=_json_default) + "\n" for model in models
+    ).encode()
+
+
+@app.get("/export/books.ndjson", response_class=StreamingResponse)
+async def export_books(
+    title: str | None = None,
+    genre: Annotated[list[GenreName] | None, Query()] = None,
+    published_year_from: int | None = None,
+    published_year_to: int | None = None,
+    page_count_from: int | None = None,
+    page_count_to: int | None = None,
+    min_average_rating: float | None = None,
+) -> StreamingResponse:
+    """Stream every book matching the `books` query filter as NDJSON, in storage order."""
+    book_filter = BookFilter(
+        title=title,
+        genres=[GenreEnum[name] for name in genre] if genre is not None else None,
+        published_year_from=published_year_from,
+        published_year_to=published_year_to,
+        page_count_from=page_count_from,
+        page_count_to=page_count_to,
+        min_average_rating=min_average_rating,
+    )
+
+    async def lines() -> AsyncIterator[bytes]:
+        async for books in container.export_books_handler(EXPORT_CHUNK_SIZE):
+            if chunk := apply_book_filter(books, book_filter):
+                yield _ndjson(chunk)
+
+    return StreamingResponse(lines(), media_type=NDJSON)
+
+
+@app.get("/export/authors.ndjson", response_class=StreamingResponse)
+async def export_authors(name: str | None = None) -> StreamingResponse:
+    """Stream every author matching the `authors` query filter as NDJSON, in storage order."""
+    author_filter = AuthorFilter(name=name)
+
+    async def lines() -> AsyncIterator[bytes]:
+        async for authors in container.export_authors_handler(EXPORT_CHUNK_SIZE):
+            if chunk := apply_author_filter(authors, author_filter):
+                yield _ndjson(chunk)
+
+    return StreamingResponse(lines(), media_type=NDJSON)
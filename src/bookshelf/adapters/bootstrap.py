@@ -1,20 +1,46 @@
+import asyncio
+import logging
+import time
 from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING
 
-
-from bookshelf.adapters.inbound.graphql.context import GraphQLContext
-from bookshelf.adapters.inbound.graphql.dataloaders import (
-    create_author_loader,
-    create_books_by_author_loader,
+from bookshelf.adapters.metrics import MetricsRegistry
+from bookshelf.adapters.outbound.async_batching_event_publisher import (
+    AsyncBatchingEventPublisher,
+    OverflowPolicy,
 )
+from bookshelf.adapters.outbound.book_ranking_projector import BookRankingProjector
+from bookshelf.adapters.outbound.composite_event_publisher import CompositeEventPublisher
+from bookshelf.adapters.outbound.event_broadcaster import EventBroadcaster
 from bookshelf.adapters.outbound.logging_event_publisher import LoggingEventPublisher
+from bookshelf.adapters.outbound.outbox_feed import OutboxFeed
+from bookshelf.adapters.outbound.outbox_relay import OutboxRelay
+from bookshelf.adapters.outbound.persistence.identity_map_repositories import (
+    IdentityMapAuthorRepository,
+    IdentityMapBookRepository,
+)
 from bookshelf.adapters.outbound.persistence.in_memory_author_repository import (
     InMemoryAuthorRepository,
 )
+from bookshelf.adapters.outbound.persistence.in_memory_book_ranking import (
+    InMemoryBookRanking,
+)
 from bookshelf.adapters.outbound.persistence.in_memory_book_repository import (
     InMemoryBookRepository,
 )
+from bookshelf.adapters.outbound.persistence.sqlite_author_repository import (
+    SqliteAuthorRepository,
+)
+from bookshelf.adapters.outbound.persistence.sqlite_book_repository import (
+    SqliteBookRepository,
+)
+from bookshelf.adapters.outbound.persistence.sqlite_database import SqliteDatabase
+from bookshelf.adapters.outbound.response_cache import ResponseCache, ResponseCacheInvalidator
 from bookshelf.adapters.outbound.system_clock import SystemClock
+from bookshelf.adapters.outbound.traffic_recorder import TrafficRecorder
 from bookshelf.adapters.outbound.ulid_id_generator import UlidIdGenerator
+from bookshelf.adapters.settings import Settings
 from bookshelf.application.add_genre_to_book import AddGenreToBook
 from bookshelf.application.add_review_to_book import AddReviewToBook
 from bookshelf.application.change_author_biography import ChangeAuthorBiography
@@ -23,13 +49,18 @@ from bookshelf.application.change_book_isbn import ChangeBookIsbn
 from bookshelf.application.change_book_summary import ChangeBookSummary
 from bookshelf.application.change_book_title import ChangeBookTitle
 from bookshelf.application.create_author import CreateAuthor
+from bookshelf.application.create_authors import CreateAuthors
 from bookshelf.application.create_book import CreateBook
+from bookshelf.application.create_books import CreateBooks
 from bookshelf.application.delete_author import DeleteAuthor
 from bookshelf.application.delete_book import DeleteBook
+from bookshelf.application.export_authors import ExportAuthors
+from bookshelf.application.export_books import ExportBooks
 from bookshelf.application.get_all_authors import GetAllAuthors
 from bookshelf.application.get_all_books import GetAllBooks
 from bookshelf.application.get_author_by_id import GetAuthorById
 from bookshelf.application.get_book_by_id import GetBookById
+from bookshelf.application.get_top_books import GetTopBooks
 from bookshelf.application.remove_genre_from_book import RemoveGenreFromBook
 from bookshelf.application.remove_review_from_book import RemoveReviewFromBook
 from bookshelf.domain.factory.author_factory import DefaultAuthorFactory
@@ -39,84 +70,321 @@ from bookshelf.domain.service.change_isbn_service import ChangeIsbnService
 from bookshelf.domain.service.create_author_service import CreateAuthorService
 from bookshelf.domain.service.create_book_service import CreateBookService
 from bookshelf.domain.service.add_review_service import AddReviewService
+from bookshelf.domain.port.author_repository import AuthorRepository
+from bookshelf.domain.port.book_repository import BookRepository
+from bookshelf.domain.port.event_publisher import EventPublisher
 from bookshelf.domain.service.delete_author_service import DeleteAuthorService
 
+if TYPE_CHECKING:
+    from bookshelf.adapters.inbound.graphql.context import GraphQLContext
+    from bookshelf.adapters.inbound.graphql.execution_plans import ExecutionPlans
+
+logger = logging.getLogger("bookshelf.startup")
+
 
 @dataclass
 class Container:
-    book_repository: InMemoryBookRepository = field(default_factory=InMemoryBookRepository)
-    author_repository: InMemoryAuthorRepository = field(default_factory=InMemoryAuthorRepository)
+    book_ranking: InMemoryBookRanking = field(default_factory=InMemoryBookRanking)
+    settings: Settings = field(default_factory=Settings.from_env)
 
     def __post_init__(self) -> None:
+        # Observability and caches
+        self.metrics = MetricsRegistry()
+        self.response_cache = ResponseCache(max_bytes=self.settings.response_cache_max_bytes)
+        self.fragment_cache = ResponseCache(max_bytes=self.settings.fragment_cache_max_bytes)
+        self.loader_cache = ResponseCache(max_bytes=self.settings.loader_cache_max_bytes)
+        self._register_cache_gauges()
+        self.traffic_recorder: TrafficRecorder | None = None
+        if self.settings.capture_path is not None:
+            self.traffic_recorder = TrafficRecorder(
+                self.settings.capture_path,
+                sample_rate=self.settings.capture_sample_rate,
+                max_bytes=self.settings.capture_max_bytes,
+                backup_count=self.settings.capture_backup_count,
+            )
+        self.event_broadcaster = EventBroadcaster(
+            max_queue_size=self.settings.subscription_queue_size, metrics=self.metrics
+        )
+
+        # Persistence
+        self.database: SqliteDatabase | None = None
+        self.book_repository: BookRepository
+        self.author_repository: AuthorRepository
+        if self.settings.database_path is not None:
+            self.database = SqliteDatabase(self.settings.database_path)
+            self.book_repository = SqliteBookRepository(self.database)
+            self.author_repository = SqliteAuthorRepository(self.database)
+        else:
+            self.book_repository = InMemoryBookRepository()
+            self.author_repository = InMemoryAuthorRepository()
+        # Within a GraphQL request, each aggregate is loaded at most once.
+        self.book_repository = IdentityMapBookRepository(self.book_repository)
+        self.author_repository = IdentityMapAuthorRepository(self.author_repository)
+
         # Infrastructure
         self.id_generator = UlidIdGenerator()
         self.clock = SystemClock()
-        self.event_publisher = LoggingEventPublisher()
+        # In-process projections stay synchronous so reads after a write see it;
+        # delivery to the remaining sinks happens off the request path. With a
+        # database those sinks are fed from the transactional outbox instead,
+        # by whichever process holds the relay lease, and every process's
+        # projections also follow the outbox to see writes made by the others.
+        self.background_event_publisher = AsyncBatchingEventPublisher(
+            [LoggingEventPublisher()],
+            max_queue_size=self.settings.event_queue_size,
+            overflow=OverflowPolicy(self.settings.event_overflow_policy),
+            spill_path=self.settings.event_spill_path,
+            metrics=self.metrics,
+        )
+        self.outbox_relay: OutboxRelay | None = None
+        self.outbox_feed: OutboxFeed | None = None
+        self._ranking_rebuild: asyncio.Task[None] | None = None
+        projections: list[EventPublisher] = [
+            BookRankingProjector(self.book_repository, self.book_ranking),
+            ResponseCacheInvalidator(self.response_cache),
+            ResponseCacheInvalidator(self.fragment_cache),
+            ResponseCacheInvalidator(self.loader_cache),
+        ]
+        if self.database is not None:
+            self.outbox_relay = OutboxRelay(
+                self.database,
+                self.background_event_publisher,
+                exclusive=True,
+                metrics=self.metrics,
+            )
+            # Replaying this process's own events is harmless for the ranking
+            # and the cache; subscribers hear every event from the feed only.
+            self.outbox_feed = OutboxFeed(
+                self.database,
+                CompositeEventPublisher([*projections, self.event_broadcaster]),
+                on_gap=self._resync_projections,
+                poll_interval=self.settings.change_feed_interval,
+            )
+            self.event_publisher = CompositeEventPublisher(projections)
+        else:
+            self.event_publisher = CompositeEventPublisher(
+                [*projections, self.event_broadcaster, self.background_event_publisher]
+            )
 
         # Factories
         self.book_factory = DefaultBookFactory(self.id_generator)
         self.author_factory = DefaultAuthorFactory(self.id_generator)
 
-        # Domain services
-        self.change_isbn_service = ChangeIsbnService(self.book_repository)
-        self.change_author_name_service = ChangeAuthorNameService(self.author_repository)
-        self.create_book_service = CreateBookService(self.book_repository, self.book_factory)
-        self.create_author_service = CreateAuthorService(self.author_repository, self.author_factory)
-        self.add_review_service = AddReviewService(self.id_generator, self.clock)
-        self.delete_author_service = DeleteAuthorService(self.book_repository, self.author_repository)
+    # Domain services and application handlers are built on first use.
+
+    @cached_property
+    def change_isbn_service(self) -> ChangeIsbnService:
+        return ChangeIsbnService(self.book_repository)
+
+    @cached_property
+    def change_author_name_service(self) -> ChangeAuthorNameService:
+        return ChangeAuthorNameService(self.author_repository)
+
+    @cached_property
+    def create_book_service(self) -> CreateBookService:
+        return CreateBookService(self.book_repository, self.book_factory)
 
-        # Application services
-        self.create_book_handler = CreateBook(
+    @cached_property
+    def create_author_service(self) -> CreateAuthorService:
+        return CreateAuthorService(self.author_repository, self.author_factory)
+
+    @cached_property
+    def add_review_service(self) -> AddReviewService:
+        return AddReviewService(self.id_generator, self.clock)
+
+    @cached_property
+    def delete_author_service(self) -> DeleteAuthorService:
+        return DeleteAuthorService(self.book_repository, self.author_repository)
+
+    @cached_property
+    def create_book_handler(self) -> CreateBook:
+        return CreateBook(
             self.book_repository,
             self.author_repository,
             self.create_book_service,
             self.event_publisher,
         )
-        self.create_author_handler = CreateAuthor(
-            self.author_repository, self.create_author_service, self.event_publisher
-        )
-        self.change_book_title_handler = ChangeBookTitle(
-            self.book_repository, self.event_publisher
-        )
-        self.change_book_isbn_handler = ChangeBookIsbn(
-            self.book_repository, self.change_isbn_service, self.event_publisher
-        )
-        self.change_book_summary_handler = ChangeBookSummary(
-            self.book_repository, self.event_publisher
-        )
-        self.add_genre_to_book_handler = AddGenreToBook(
-            self.book_repository, self.event_publisher
+
+    @cached_property
+    def create_author_handler(self) -> CreateAuthor:
+        return CreateAuthor(
+            self.author_repository,
+            self.create_author_service,
+            self.event_publisher,
         )
-        self.remove_genre_from_book_handler = RemoveGenreFromBook(
-            self.book_repository, self.event_publisher
+
+    @cached_property
+    def create_books_handler(self) -> CreateBooks:
+        return CreateBooks(
+            self.book_repository,
+            self.author_repository,
+            self.create_book_service,
+            self.event_publisher,
         )
-        self.add_review_to_book_handler = AddReviewToBook(
-            self.book_repository, self.add_review_service, self.event_publisher
+
+    @cached_property
+    def create_authors_handler(self) -> CreateAuthors:
+        return CreateAuthors(
+            self.author_repository,
+            self.create_author_service,
+            self.event_publisher,
         )
-        self.remove_review_from_book_handler = RemoveReviewFromBook(
-            self.book_repository, self.event_publisher
+
+    @cached_property
+    def change_book_title_handler(self) -> ChangeBookTitle:
+        return ChangeBookTitle(self.book_repository, self.event_publisher)
+
+    @cached_property
+    def change_book_isbn_handler(self) -> ChangeBookIsbn:
+        return ChangeBookIsbn(self.book_repository, self.change_isbn_service, self.event_publisher)
+
+    @cached_property
+    def change_book_summary_handler(self) -> ChangeBookSummary:
+        return ChangeBookSummary(self.book_repository, self.event_publisher)
+
+    @cached_property
+    def add_genre_to_book_handler(self) -> AddGenreToBook:
+        return AddGenreToBook(self.book_repository, self.event_publisher)
+
+    @cached_property
+    def remove_genre_from_book_handler(self) -> RemoveGenreFromBook:
+        return RemoveGenreFromBook(self.book_repository, self.event_publisher)
+
+    @cached_property
+    def add_review_to_book_handler(self) -> AddReviewToBook:
+        return AddReviewToBook(self.book_repository, self.add_review_service, self.event_publisher)
+
+    @cached_property
+    def remove_review_from_book_handler(self) -> RemoveReviewFromBook:
+        return RemoveReviewFromBook(self.book_repository, self.event_publisher)
+
+    @cached_property
+    def delete_book_handler(self) -> DeleteBook:
+        return DeleteBook(self.book_repository, self.event_publisher)
+
+    @cached_property
+    def change_author_name_handler(self) -> ChangeAuthorName:
+        return ChangeAuthorName(
+            self.author_repository,
+            self.change_author_name_service,
+            self.event_publisher,
         )
-        self.delete_book_handler = DeleteBook(self.book_repository)
-        self.change_author_name_handler = ChangeAuthorName(
-            self.author_repository, self.change_author_name_service, self.event_publisher
+
+    @cached_property
+    def change_author_biography_handler(self) -> ChangeAuthorBiography:
+        return ChangeAuthorBiography(self.author_repository, self.event_publisher)
+
+    @cached_property
+    def delete_author_handler(self) -> DeleteAuthor:
+        return DeleteAuthor(
+            self.author_repository,
+            self.delete_author_service,
+            self.event_publisher,
         )
-        self.change_author_biography_handler = ChangeAuthorBiography(
-            self.author_repository, self.event_publisher
+
+    @cached_property
+    def get_book_by_id_handler(self) -> GetBookById:
+        return GetBookById(self.book_repository)
+
+    @cached_property
+    def get_all_books_handler(self) -> GetAllBooks:
+        return GetAllBooks(self.book_repository)
+
+    @cached_property
+    def get_author_by_id_handler(self) -> GetAuthorById:
+        return GetAuthorById(self.author_repository)
+
+    @cached_property
+    def get_all_authors_handler(self) -> GetAllAuthors:
+        return GetAllAuthors(self.author_repository)
+
+    @cached_property
+    def get_top_books_handler(self) -> GetTopBooks:
+        return GetTopBooks(self.book_repository, self.book_ranking)
+
+    @cached_property
+    def export_books_handler(self) -> ExportBooks:
+        return ExportBooks(self.book_repository)
+
+    @cached_property
+    def export_authors_handler(self) -> ExportAuthors:
+        return ExportAuthors(self.author_repository)
+
+    @cached_property
+    def execution_plans(self) -> "ExecutionPlans | None":
+        if self.settings.compiled_operations_path is None:
+            return None
+        from bookshelf.adapters.inbound.graphql.execution_plans import ExecutionPlans
+        from bookshelf.adapters.inbound.graphql.schema import get_schema
+
+        plans = ExecutionPlans.from_file(
+            get_schema(),
+            self.settings.compiled_operations_path,
+            verify=self.settings.verify_compiled_operations,
         )
-        self.delete_author_handler = DeleteAuthor(
-            self.author_repository, self.delete_author_service
+        logger.info("Compiled %d operations", len(plans))
+        return plans
+
+    async def start(self) -> None:
+        await self.background_event_publisher.start()
+        if self.outbox_relay is not None and self.outbox_feed is not None:
+            # Follow the outbox before ranking so no write falls in between.
+            await self.outbox_feed.start()
+            if self.settings.fast_start:
+                # Serve straight away; topBooks covers only the books ranked so far.
+                self._ranking_rebuild = asyncio.create_task(self._rebuild_ranking())
+            else:
+                await self._rebuild_ranking()
+            await self.outbox_relay.start()
+
+    async def _rebuild_ranking(self) -> None:
+        started = time.perf_counter()
+        count = 0
+        async for books in self.book_repository.iter_all():
+            for book in books:
+                await self.book_ranking.update(book)
+            count += len(books)
+            # Let requests in between chunks. Each chunk is read after the
+            # previous yield, so it never overwrites a newer projected update.
+            await asyncio.sleep(0)
+        logger.info("Ranked %d books in %.2fs", count, time.perf_counter() - started)
+
+    async def _resync_projections(self) -> None:
+        self.response_cache.clear()
+        self.fragment_cache.clear()
+        self.loader_cache.clear()
+        await self._rebuild_ranking()
+
+    async def stop(self) -> None:
+        if self._ranking_rebuild is not None:
+            self._ranking_rebuild.cancel()
+        if self.outbox_feed is not None:
+            await self.outbox_feed.stop()
+        if self.outbox_relay is not None:
+            await self.outbox_relay.stop()
+        await self.background_event_publisher.stop()
+        if self.database is not None:
+            self.database.close()
+        if self.traffic_recorder is not None:
+            self.traffic_recorder.close()
+
+    def graphql_context(self) -> "GraphQLContext":
+        # Imported here so that wiring a container (the CLI, workers) does not
+        # pull in strawberry and the GraphQL types.
+        from bookshelf.adapters.inbound.graphql.context import GraphQLContext
+        from bookshelf.adapters.inbound.graphql.dataloaders import (
+            create_author_loader,
+            create_books_by_author_loader,
         )
 
-        self.get_book_by_id_handler = GetBookById(self.book_repository)
-        self.get_all_books_handler = GetAllBooks(self.book_repository)
-        self.get_author_by_id_handler = GetAuthorById(self.author_repository)
-        self.get_all_authors_handler = GetAllAuthors(self.author_repository)
+        shared = self.loader_cache if self.settings.loader_cache_max_bytes > 0 else None
 
-    def graphql_context(self) -> GraphQLContext:
         return GraphQLContext(
             # Command handlers
             create_book_handler=self.create_book_handler,
             create_author_handler=self.create_author_handler,
+            create_books_handler=self.create_books_handler,
+            create_authors_handler=self.create_authors_handler,
             change_book_title_handler=self.change_book_title_handler,
             change_book_isbn_handler=self.change_book_isbn_handler,
             change_book_summary_handler=self.change_book_summary_handler,
@@ -133,7 +401,66 @@ class Container:
             get_all_books_handler=self.get_all_books_handler,
             get_author_by_id_handler=self.get_author_by_id_handler,
             get_all_authors_handler=self.get_all_authors_handler,
-            # DataLoaders (fresh per request)
-            author_loader=create_author_loader(self.author_repository),
-            books_by_author_loader=create_books_by_author_loader(self.book_repository),
+            get_top_books_handler=self.get_top_books_handler,
+            # DataLoaders (fresh per request, over a cache shared by all of them)
+            author_loader=create_author_loader(self.author_repository, self.metrics, shared),
+            books_by_author_loader=create_books_by_author_loader(
+                self.book_repository, self.metrics, shared
+            ),
+            response_cache=self.response_cache,
+            execution_plans=self.execution_plans,
+            event_broadcaster=self.event_broadcaster,
+            metrics=self.metrics,
+            trace_sample_rate=self.settings.trace_sample_rate,
+            traffic_recorder=self.traffic_recorder,
+        )
+
+    def _register_cache_gauges(self) -> None:
+        cache = self.response_cache
+        self.metrics.gauge(
+            "bookshelf_response_cache_hit_ratio",
+            "Fraction of cacheable queries served from the response cache.",
+            lambda: cache.stats()["hitRatio"],
+        )
+        self.metrics.gauge(
+            "bookshelf_response_cache_bytes",
+            "Estimated size of cached responses.",
+            lambda: cache.stats()["bytes"],
+        )
+        self.metrics.gauge(
+            "bookshelf_response_cache_entries",
+            "Number of cached responses.",
+            lambda: cache.stats()["entries"],
+        )
+        fragments = self.fragment_cache
+        self.metrics.gauge(
+            "bookshelf_fragment_cache_hit_ratio",
+            "Fraction of entity lookups in execution plans served as cached JSON.",
+            lambda: fragments.stats()["hitRatio"],
+        )
+        self.metrics.gauge(
+            "bookshelf_fragment_cache_bytes",
+            "Size of cached entity fragments.",
+            lambda: fragments.stats()["bytes"],
+        )
+        self.metrics.gauge(
+            "bookshelf_fragment_cache_entries",
+            "Number of cached entity fragments.",
+            lambda: fragments.stats()["entries"],
+        )
+        loaded = self.loader_cache
+        self.metrics.gauge(
+            "bookshelf_loader_cache_hit_ratio",
+            "Fraction of DataLoader keys served from read models of earlier requests.",
+            lambda: loaded.stats()["hitRatio"],
+        )
+        self.metrics.gauge(
+            "bookshelf_loader_cache_bytes",
+            "Estimated size of read models shared by DataLoaders.",
+            lambda: loaded.stats()["bytes"],
+        )
+        self.metrics.gauge(
+            "bookshelf_loader_cache_entries",
+            "Number of read models shared by DataLoaders.",
+            lambda: loaded.stats()["entries"],
         )
@@ -0,0 +1,362 @@
+"""Stream a CSV or JSON-lines catalog dump into the configured repositories.
+
+Each row describes one book and its author:
+
+    title, isbn, summary, published_year, page_count, genres,
+    author_first_name, author_last_name[, author_biography]
+
+In CSV files `genres` is a `|`-separated list; in JSON lines it may also be
+an array. Authors are matched by name and created when missing.
+
+Rows are read lazily and validated in chunks on a process pool, with only a
+bounded number of chunks in flight, so memory use does not grow with the
+file. Valid rows are written through the bulk create handlers one chunk at a
+time; after each chunk the number of rows consumed is written to the
+checkpoint file, and a rerun resumes after it. Rejected rows are reported
+with their line number.
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from itertools import islice
+from pathlib import Path
+from typing import Any, TextIO
+
+from bookshelf.adapters.bootstrap import Container
+from bookshelf.application.create_authors import AuthorDraft
+from bookshelf.application.create_books import BookDraft
+from bookshelf.domain.exception.exceptions import DomainException, InvalidGenreError
+from bookshelf.domain.model.value_objects import (
+    AuthorBiography,
+    AuthorName,
+    BookTitle,
+    Genre,
+    ISBN,
+    PageCount,
+    PublishedYear,
+    Summary,
+)
+
+logger = logging.getLogger("bookshelf.import")
+
+DEFAULT_BIOGRAPHY = "Imported from a catalog dump."
+AUTHOR_CACHE_SIZE = 100_000
+
+
+@dataclass(frozen=True, slots=True)
+class ImportRow:
+    line: int
+    book: BookDraft  # author_id is filled in once the author is resolved
+    author_name: AuthorName
+    author_biography: str
+
+
+@dataclass(frozen=True, slots=True)
+class RejectedRow:
+    line: int
+    code: str
+    message: str
+
+
+@dataclass
+class ImportStats:
+    rows: int = 0
+    imported: int = 0
+    rejected: int = 0
+    resumed_at: int = 0
+    started: float = 0.0
+
+    def rate(self) -> float:
+        elapsed = time.monotonic() - self.started
+        return (self.rows - self.resumed_at) / elapsed if elapsed > 0 else 0.0
+
+
+# ── Reading ───────────────────────────────────────────────────
+
+
+def _read_csv(stream: TextIO) -> Iterator[tuple[int, Any]]:
+    reader = csv.DictReader(stream)
+    for record in reader:
+        yield reader.line_num, record
+
+
+def _read_jsonl(stream: TextIO) -> Iterator[tuple[int, Any]]:
+    for line_number, line in enumerate(stream, start=1):
+        if line.strip():
+            yield line_number, line
+
+
+def _chunks(
+    records: Iterator[tuple[int, Any]], size: int
+) -> Iterator[list[tuple[int, Any]]]:
+    while chunk := list(islice(records, size)):
+        yield chunk
+
+
+# ── Validation (runs in worker processes) ─────────────────────
+
+
+def _genres(raw: Any) -> list[str]:
+    names = raw if isinstance(raw, list) else str(raw or "").split("|")
+    genres: list[str] = []
+    for name in (str(n).strip() for n in names):
+        if not name:
+            continue
+        try:
+            genres.append(Genre(name).value)
+        except ValueError:
+            raise InvalidGenreError(name)
+    return genres
+
+
+def _validate(line: int, record: Any, is_json: bool) -> ImportRow | RejectedRow:
+    try:
+        fields = json.loads(record) if is_json else record
+        title = BookTitle(str(fields["title"])).value
+        isbn = ISBN(str(fields["isbn"])).value
+        summary = Summary(str(fields["summary"])).value
+        published_year = PublishedYear(int(fields["published_year"])).value
+        page_count = PageCount(int(fields["page_count"])).value
+        genres = _genres(fields.get("genres"))
+        author_name = AuthorName(
+            str(fields["author_first_name"]), str(fields["author_last_name"])
+        )
+        biography = AuthorBiography(
+            str(fields.get("author_biography") or DEFAULT_BIOGRAPHY)
+        ).value
+    except DomainException as exc:
+        return RejectedRow(line, exc.code, exc.message)
+    except KeyError as exc:
+        return RejectedRow(line, "MISSING_FIELD", f"Missing field {exc}")
+    except (TypeError, ValueError) as exc:
+        return RejectedRow(line, "MALFORMED_ROW", str(exc))
+    book = BookDraft(
+        author_id="",
+        title=title,
+        isbn=isbn,
+        summary=summary,
+        published_year=published_year,
+        page_count=page_count,
+        genres=genres,
+    )
+    return ImportRow(line, book, author_name, biography)
+
+
+def validate_chunk(
+    chunk: list[tuple[int, Any]], is_json: bool
+) -> list[ImportRow | RejectedRow]:
+    return [_validate(line, record, is_json) for line, record in chunk]
+
+
+# ── Writing ───────────────────────────────────────────────────
+
+
+class CatalogImporter:
+    """Writes validated rows through the bulk create handlers, one chunk at a time."""
+
+    def __init__(self, container: Container) -> None:
+        self._container = container
+        self._author_ids: OrderedDict[AuthorName, str] = OrderedDict()
+
+    async def write(self, rows: list[ImportRow]) -> list[RejectedRow]:
+        rejected: list[RejectedRow] = []
+        author_ids = await self._resolve_authors(rows, rejected)
+        writable = [row for row in rows if row.author_name in author_ids]
+        results = await self._container.create_books_handler(
+            [replace(row.book, author_id=author_ids[row.author_name]) for row in writable]
+        )
+        for row, result in zip(writable, results):
+            if isinstance(result, DomainException):
+                rejected.append(RejectedRow(row.line, result.code, result.message))
+            elif isinstance(result, Exception):
+                rejected.append(RejectedRow(row.line, "APPLICATION_ERROR", str(result)))
+        return rejected
+
+    async def _resolve_authors(
+        self, rows: list[ImportRow], rejected: list[RejectedRow]
+    ) -> dict[AuthorName, str]:
+        resolved: dict[AuthorName, str] = {}
+        missing: dict[AuthorName, str] = {}
+        for row in rows:
+            cached = self._author_ids.get(row.author_name)
+            if cached is not None:
+                self._author_ids.move_to_end(row.author_name)
+                resolved[row.author_name] = cached
+            else:
+                missing.setdefault(row.author_name, row.author_biography)
+
+        names = list(missing)
+        stored = await self._container.author_repository.find_by_names(names)
+        for name, author in zip(names, stored):
+            if author is not None:
+                resolved[name] = str(author.id)
+                del missing[name]
+
+        drafts = [
+            AuthorDraft(name.first_name, name.last_name, biography)
+            for name, biography in missing.items()
+        ]
+        results = await self._container.create_authors_handler(drafts)
+        for name, result in zip(missing, results):
+            if isinstance(result, Exception):
+                code = result.code if isinstance(result, DomainException) else "APPLICATION_ERROR"
+                rejected.extend(
+                    RejectedRow(row.line, code, str(result))
+                    for row in rows
+                    if row.author_name == name
+                )
+            else:
+                resolved[name] = str(result)
+
+        for name, author_id in resolved.items():
+            self._author_ids[name] = author_id
+        while len(self._author_ids) > AUTHOR_CACHE_SIZE:
+            self._author_ids.popitem(last=False)
+        return resolved
+
+
+# ── Checkpoint ────────────────────────────────────────────────
+
+
+def _load_checkpoint(path: Path, source: Path) -> int:
+    if not path.exists():
+        return 0
+    state = json.loads(path.read_text())
+    if state.get("source") != str(source.resolve()):
+        return 0
+    return int(state.get("rows", 0))
+
+
+def _save_checkpoint(path: Path, source: Path, rows: int) -> None:
+    temporary = path.with_suffix(path.suffix + ".tmp")
+    temporary.write_text(json.dumps({"source": str(source.resolve()), "rows": rows}))
+    os.replace(temporary, path)
+
+
+# ── Command ───────────────────────────────────────────────────
+
+
+async def import_catalog(
+    source: Path,
+    *,
+    container: Container,
+    chunk_size: int = 1000,
+    workers: int | None = None,
+    checkpoint: Path | None = None,
+    rejects: TextIO | None = None,
+    progress_interval: float = 5.0,
+) -> ImportStats:
+    is_json = source.suffix.lower() in (".jsonl", ".ndjson", ".json")
+    checkpoint = checkpoint or source.with_name(source.name + ".checkpoint")
+    skip = _load_checkpoint(checkpoint, source)
+    stats = ImportStats(rows=skip, resumed_at=skip, started=time.monotonic())
+    if skip:
+        logger.info("Resuming after %d rows from %s", skip, checkpoint)
+    importer = CatalogImporter(container)
+    workers = workers or os.cpu_count() or 1
+    loop = asyncio.get_running_loop()
+    last_report = stats.started
+
+    with (
+        source.open(newline="", encoding="utf-8") as stream,
+        ProcessPoolExecutor(max_workers=workers) as pool,
+    ):
+        records = _read_jsonl(stream) if is_json else _read_csv(stream)
+        chunks = _chunks(islice(records, skip, None), chunk_size)
+        in_flight: list[Future[list[ImportRow | RejectedRow]]] = []
+
+        def submit_next() -> None:
+            chunk = next(chunks, None)
+            if chunk is not None:
+                in_flight.append(pool.submit(validate_chunk, chunk, is_json))
+
+        for _ in range(workers * 2):
+            submit_next()
+        while in_flight:
+            validated = await asyncio.wrap_future(in_flight.pop(0), loop=loop)
+            submit_next()
+
+            rows = [item for item in validated if isinstance(item, ImportRow)]
+            rejected = [item for item in validated if isinstance(item, RejectedRow)]
+            rejected.extend(await importer.write(rows))
+
+            stats.rows += len(validated)
+            stats.rejected += len(rejected)
+            stats.imported += len(validated) - len(rejected)
+            if rejects is not None:
+                for row in sorted(rejected, key=lambda r: r.line):
+                    rejects.write(
+                        json.dumps({"line": row.line, "code": row.code, "message": row.message})
+                        + "\n"
+                    )
+                rejects.flush()
+            _save_checkpoint(checkpoint, source, stats.rows)
+
+            now = time.monotonic()
+            if now - last_report >= progress_interval:
+                last_report = now
+                logger.info(
+                    "%d rows, %d imported, %d rejected, %.0f rows/s",
+                    stats.rows,
+                    stats.imported,
+                    stats.rejected,
+                    stats.rate(),
+                )
+    return stats
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", type=Path, help="CSV or JSON-lines (.jsonl) catalog file")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None, help="validation processes")
+    parser.add_argument(
+        "--checkpoint", type=Path, default=None, help="defaults to <source>.checkpoint"
+    )
+    parser.add_argument("--rejects", type=Path, default=None, help="write rejected rows here")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("bookshelf.events").setLevel(logging.WARNING)
+
+    async def run() -> ImportStats:
+        container = Container()
+        if container.database is None:
+            logger.warning("BOOKSHELF_DATABASE_PATH is not set; the import is not persisted.")
+        await container.start()
+        rejects = args.rejects.open("a", encoding="utf-8") if args.rejects else None
+        try:
+            return await import_catalog(
+                args.source,
+                container=container,
+                chunk_size=args.chunk_size,
+                workers=args.workers,
+                checkpoint=args.checkpoint,
+                rejects=rejects,
+            )
+        finally:
+            if rejects is not None:
+                rejects.close()
+            await container.stop()
+
+    stats = asyncio.run(run())
+    logger.info(
+        "Done: %d rows, %d imported, %d rejected, %.0f rows/s",
+        stats.rows,
+        stats.imported,
+        stats.rejected,
+        stats.rate(),
+    )
+
+
+if __name__ == "__main__":
+    main()
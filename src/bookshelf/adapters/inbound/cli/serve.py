@@ -0,0 +1,76 @@
+"""Serve the API from several worker processes sharing one SQLite store.
+
+Each worker is a fresh interpreter with its own Container and its own
+connection to the database. Writes made through any worker reach the book
+ranking, response cache and subscriptions of every other worker via the
+outbox, within BOOKSHELF_CHANGE_FEED_INTERVAL seconds; one worker at a time
+relays events to the background sinks. The store is created and seeded
+before the workers start, so they never race to seed it.
+
+Metrics are per worker: /metrics reports whichever worker answered.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+from pathlib import Path
+
+import uvicorn
+
+from bookshelf.adapters.bootstrap import Container
+from bookshelf.adapters.seeder import seed_if_empty
+from bookshelf.adapters.settings import Settings
+
+logger = logging.getLogger("bookshelf.serve")
+
+
+async def prepare_store() -> None:
+    """Create the database schema and seed an empty store, without starting the container."""
+    container = Container()
+    try:
+        await seed_if_empty(container)
+    finally:
+        await container.stop()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--database", type=Path, default=None, help="defaults to BOOKSHELF_DATABASE_PATH"
+    )
+    parser.add_argument("--loop", choices=("auto", "asyncio", "uvloop"), default="auto")
+    parser.add_argument("--http", choices=("auto", "h11", "httptools"), default="auto")
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args(argv)
+
+    if args.database is not None:
+        # Workers read their settings from the environment they inherit.
+        os.environ["BOOKSHELF_DATABASE_PATH"] = str(args.database)
+    settings = Settings.from_env()
+    if args.workers > 1 and settings.database_path is None:
+        parser.error(
+            "several workers need a shared store: pass --database or set BOOKSHELF_DATABASE_PATH"
+        )
+    if args.workers > 1 and settings.capture_path is not None:
+        parser.error("traffic capture writes one file; use a single worker to capture")
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    asyncio.run(prepare_store())
+    logger.info("Starting %d workers on %s:%d", args.workers, args.host, args.port)
+    uvicorn.run(
+        "bookshelf.adapters.app:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop=args.loop,
+        http=args.http,
+        log_level=args.log_level,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 from starlette.requests import Request
 from starlette.websockets import WebSocket
@@ -6,6 +7,8 @@ from strawberry.dataloader import DataLoader
 from strawberry.fastapi import BaseContext
 from strawberry.types import Info
 
+from bookshelf.adapters.metrics import MetricsRegistry
+from bookshelf.adapters.outbound.event_broadcaster import EventBroadcaster
 from bookshelf.application.add_genre_to_book import AddGenreToBook
 from bookshelf.application.add_review_to_book import AddReviewToBook
 from bookshelf.application.change_author_biography import ChangeAuthorBiography
@@ -14,23 +17,34 @@ from bookshelf.application.change_book_isbn import ChangeBookIsbn
 from bookshelf.application.change_book_summary import ChangeBookSummary
 from bookshelf.application.change_book_title import ChangeBookTitle
 from bookshelf.application.create_author import CreateAuthor
+from bookshelf.application.create_authors import CreateAuthors
 from bookshelf.application.create_book import CreateBook
+from bookshelf.application.create_books import CreateBooks
 from bookshelf.application.delete_author import DeleteAuthor
 from bookshelf.application.delete_book import DeleteBook
 from bookshelf.application.get_all_authors import GetAllAuthors
 from bookshelf.application.get_all_books import GetAllBooks
 from bookshelf.application.get_author_by_id import GetAuthorById
 from bookshelf.application.get_book_by_id import GetBookById
+from bookshelf.application.get_top_books import GetTopBooks
+from bookshelf.application.identity_map import IdentityMap
 from bookshelf.application.read_models import AuthorReadModel, BookReadModel
 from bookshelf.application.remove_genre_from_book import RemoveGenreFromBook
 from bookshelf.application.remove_review_from_book import RemoveReviewFromBook
 
+if TYPE_CHECKING:
+    from bookshelf.adapters.inbound.graphql.execution_plans import ExecutionPlans
+    from bookshelf.adapters.outbound.response_cache import ResponseCache
+    from bookshelf.adapters.outbound.traffic_recorder import TrafficRecorder
+
 
 @dataclass
 class GraphQLContext(BaseContext):
     # Command handlers
     create_book_handler: CreateBook
     create_author_handler: CreateAuthor
+    create_books_handler: CreateBooks
+    create_authors_handler: CreateAuthors
     change_book_title_handler: ChangeBookTitle
     change_book_isbn_handler: ChangeBookIsbn
     change_book_summary_handler: ChangeBookSummary
@@ -47,9 +61,26 @@ class GraphQLContext(BaseContext):
     get_all_books_handler: GetAllBooks
     get_author_by_id_handler: GetAuthorById
     get_all_authors_handler: GetAllAuthors
+    get_top_books_handler: GetTopBooks
     # DataLoaders
     author_loader: DataLoader[str, AuthorReadModel | None]
     books_by_author_loader: DataLoader[str, list[BookReadModel]]
+    # Aggregates and read models loaded while serving this request
+    identity_map: IdentityMap = field(default_factory=IdentityMap)
+    # Caches shared across requests
+    response_cache: "ResponseCache | None" = None
+    # Entities encoded by execution plans; set only where responses are
+    # written with fragments.encode_json
+    fragment_cache: "ResponseCache | None" = None
+    # Compiled plans for registered queries
+    execution_plans: "ExecutionPlans | None" = None
+    # Subscriptions
+    event_broadcaster: EventBroadcaster | None = None
+    # Tracing
+    metrics: MetricsRegistry | None = None
+    trace_sample_rate: float = 0.0
+    # Traffic capture
+    traffic_recorder: "TrafficRecorder | None" = None
     # Request
     request: Request | WebSocket | None = None
 
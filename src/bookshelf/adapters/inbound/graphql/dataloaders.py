@@ -2,6 +2,8 @@ import asyncio
 
 from strawberry.dataloader import DataLoader
 
+from bookshelf.adapters.metrics import MetricsRegistry
+from bookshelf.adapters.outbound.response_cache import ResponseCache
 from bookshelf.application.read_models import (
     AuthorReadModel,
     BookReadModel,
@@ -13,29 +15,89 @@ from bookshelf.domain.port.author_repository import AuthorRepository
 from bookshelf.domain.port.book_repository import BookRepository
 
 
+BATCH_SIZE = "bookshelf_dataloader_batch_size"
+
+
+def _record_batch(metrics: MetricsRegistry | None, loader: str, size: int) -> None:
+    if metrics is not None:
+        metrics.histogram(BATCH_SIZE, "Keys per DataLoader batch.", loader=loader).record(size)
+
+
+def _author_size(author: AuthorReadModel) -> int:
+    # A rough estimate of the memory an entry holds, to bound the shared cache.
+    return 256 + len(author.biography) + 2 * len(author.name.full_name)
+
+
+def _books_size(books: tuple[BookReadModel, ...]) -> int:
+    return sum(
+        512 + len(book.title) + len(book.summary) + 128 * book.review_count for book in books
+    )
+
+
 def create_author_loader(
     author_repository: AuthorRepository,
+    metrics: MetricsRegistry | None = None,
+    shared: ResponseCache | None = None,
 ) -> DataLoader[str, AuthorReadModel | None]:
-    """Create a DataLoader that batches author lookups by ID."""
+    """Create a DataLoader that batches author lookups by ID.
+
+    With a `shared` cache, authors read by earlier requests are reused
+    until an event about them invalidates "Author:<id>".
+    """
 
     async def load_authors(keys: list[str]) -> list[AuthorReadModel | None]:
-        authors = await asyncio.gather(
-            *(author_repository.find_by_id(AuthorId(key)) for key in keys)
-        )
-        return [author_to_read_model(a) if a else None for a in authors]
+        _record_batch(metrics, "author", len(keys))
+        if shared is None:
+            authors = await author_repository.find_by_ids([AuthorId(key) for key in keys])
+            return [author_to_read_model(a) if a else None for a in authors]
+
+        since_version = shared.version
+        found: list[AuthorReadModel | None] = [shared.get(f"Author:{key}") for key in keys]
+        missing = [i for i, author in enumerate(found) if author is None]
+        if missing:
+            authors = await author_repository.find_by_ids([AuthorId(keys[i]) for i in missing])
+            for i, author in zip(missing, authors):
+                if author is None:
+                    continue
+                model = found[i] = author_to_read_model(author)
+                key = f"Author:{keys[i]}"
+                shared.put(key, model, {key}, since_version, size=_author_size(model))
+        return found
 
     return DataLoader(load_fn=load_authors)
 
 
 def create_books_by_author_loader(
     book_repository: BookRepository,
+    metrics: MetricsRegistry | None = None,
+    shared: ResponseCache | None = None,
 ) -> DataLoader[str, list[BookReadModel]]:
-    """Create a DataLoader that batches book lookups by author ID."""
+    """Create a DataLoader that batches book lookups by author ID.
+
+    With a `shared` cache, an author's books are reused until a book is
+    added to or removed from them ("AuthorBooks:<id>") or one of them
+    changes ("Book:<id>").
+    """
 
     async def load_books_by_author(keys: list[str]) -> list[list[BookReadModel]]:
+        _record_batch(metrics, "books_by_author", len(keys))
+        since_version = shared.version if shared is not None else 0
+        found: list[tuple[BookReadModel, ...] | None] = (
+            [shared.get(f"AuthorBooks:{key}") for key in keys]
+            if shared is not None
+            else [None] * len(keys)
+        )
+        missing = [i for i, books in enumerate(found) if books is None]
         results = await asyncio.gather(
-            *(book_repository.find_by_author(AuthorId(key)) for key in keys)
+            *(book_repository.find_by_author(AuthorId(keys[i])) for i in missing)
         )
-        return [[book_to_read_model(b) for b in books] for books in results]
+        for i, books in zip(missing, results):
+            models = found[i] = tuple(book_to_read_model(b) for b in books)
+            if shared is not None:
+                key = f"AuthorBooks:{keys[i]}"
+                dependencies = {key, *(f"Book:{model.id}" for model in models)}
+                shared.put(key, models, dependencies, since_version, size=_books_size(models))
+        # Cached tuples are shared between requests; each caller gets its own list.
+        return [list(books) for books in found]  # type: ignore[arg-type]
 
     return DataLoader(load_fn=load_books_by_author)
@@ -0,0 +1,675 @@
+"""Compiled execution plans for registered query documents.
+
+A plan answers one document without the generic executor. Its root fields
+call the same fetch functions as the Query resolvers; everything below them
+is read straight off the read models by builder functions generated per
+selection set, so no resolver, Info object or strawberry type is created
+per field. Fields behind a DataLoader are resolved a level at a time with
+one `load_many` per field, which batches exactly like the generic path.
+With a fragment cache on the context, each book and author is encoded to
+JSON once per selection set and reused until a domain event touches one
+of the entities it was built from (see `fragments`).
+
+Only queries over the types in `_FIELDS` compile. Whatever a plan cannot
+reproduce exactly at run time (variables that do not coerce, a book whose
+author is gone, any unexpected exception) makes it give up, and the
+operation goes through the generic executor instead.
+"""
+
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import strawberry
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLAbstractType,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLOutputType,
+    GraphQLScalarType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+    parse,
+    validate,
+)
+from graphql.execution.values import get_argument_values, get_variable_values
+from strawberry.types.arguments import convert_arguments
+
+from bookshelf.adapters.inbound.graphql.context import GraphQLContext
+from bookshelf.adapters.inbound.graphql.fragments import (
+    Fragment,
+    collect_dependencies,
+    splice,
+)
+from bookshelf.adapters.inbound.graphql.middleware.response_cache import (
+    root_field_dependency,
+    track_dependencies,
+)
+from bookshelf.adapters.inbound.graphql.resolvers.queries import (
+    fetch_author,
+    fetch_authors_page,
+    fetch_book,
+    fetch_books_page,
+    fetch_top_books,
+)
+from bookshelf.adapters.inbound.graphql.types.errors import ErrorType
+from bookshelf.application.read_models import AuthorReadModel, BookReadModel
+
+if TYPE_CHECKING:
+    from bookshelf.adapters.outbound.response_cache import ResponseCache
+
+logger = logging.getLogger("bookshelf.graphql")
+
+
+class UnsupportedOperationError(Exception):
+    """The document uses something execution plans cannot reproduce."""
+
+
+class _Fallback(Exception):
+    """Raised while executing a plan to hand the operation to the generic executor."""
+
+
+@dataclass(frozen=True, slots=True)
+class _Value:
+    # Expression over the source `m`
+    expression: str
+
+
+@dataclass(frozen=True, slots=True)
+class _Object:
+    # Expression over the source `m` giving the child source, or a list of them
+    expression: str
+
+
+@dataclass(frozen=True, slots=True)
+class _Loaded:
+    loader: str
+    # Expression over the source `m` giving the key
+    key: str
+    count: bool = False
+    dependency: str | None = None
+
+
+# How each supported type's fields are read from its source: read models for
+# entities, `Page` for connections and (cursor, item) pairs for edges.
+_FIELDS: dict[str, dict[str, _Value | _Object | _Loaded]] = {
+    "BookType": {
+        "id": _Value("m.id"),
+        "title": _Value("m.title"),
+        "isbn": _Value("m.isbn"),
+        "summary": _Value("m.summary"),
+        "publishedYear": _Value("m.published_year"),
+        "pageCount": _Value("m.page_count"),
+        "genres": _Object("m.genres"),
+        "reviews": _Object("m.reviews"),
+        "reviewCount": _Value("m.review_count"),
+        "averageRating": _Value("m.average_rating"),
+        "author": _Loaded("author_loader", "m.author_id"),
+    },
+    "GenreType": {"name": _Value("m.name")},
+    "ReviewType": {
+        "id": _Value("m.id"),
+        "rating": _Value("m.rating"),
+        "comment": _Value("m.comment"),
+        "createdAt": _Value("m.created_at"),
+    },
+    "AuthorType": {
+        "id": _Value("m.id"),
+        "name": _Object("m.name"),
+        "biography": _Value("m.biography"),
+        "books": _Loaded("books_by_author_loader", "m.id", dependency="AuthorBooks"),
+        "bookCount": _Loaded(
+            "books_by_author_loader", "m.id", count=True, dependency="AuthorBooks"
+        ),
+    },
+    "AuthorNameType": {
+        "firstName": _Value("m.first_name"),
+        "lastName": _Value("m.last_name"),
+        "fullName": _Value("m.full_name"),
+    },
+    "ErrorType": {"code": _Value("m.code"), "message": _Value("m.message")},
+    "PageInfo": {
+        "hasPreviousPage": _Value("m.has_previous_page"),
+        "hasNextPage": _Value("m.has_next_page"),
+        "startCursor": _Value("m.start_cursor"),
+        "endCursor": _Value("m.end_cursor"),
+    },
+    "BookConnection": {
+        "edges": _Object("list(zip(m.cursors, m.items))"),
+        "pageInfo": _Object("m.page_info"),
+        "totalCount": _Value("m.total_count"),
+    },
+    "BookEdge": {"cursor": _Value("m[0]"), "node": _Object("m[1]")},
+    "AuthorConnection": {
+        "edges": _Object("list(zip(m.cursors, m.items))"),
+        "pageInfo": _Object("m.page_info"),
+        "totalCount": _Value("m.total_count"),
+    },
+    "AuthorEdge": {"cursor": _Value("m[0]"), "node": _Object("m[1]")},
+}
+
+# Sources of the members of abstract types, to pick a member at run time.
+_SOURCE_TYPES: dict[type, str] = {
+    BookReadModel: "BookType",
+    AuthorReadModel: "AuthorType",
+    ErrorType: "ErrorType",
+}
+
+# Every value of these types adds "<kind>:<id>" to the response cache dependencies.
+_ENTITY_KINDS = {"BookType": "Book", "AuthorType": "Author"}
+
+_ROOT_FIELDS: dict[str, Callable[..., Awaitable[Any]]] = {
+    "book": fetch_book,
+    "books": fetch_books_page,
+    "topBooks": fetch_top_books,
+    "author": fetch_author,
+    "authors": fetch_authors_page,
+}
+
+# Scalars whose values are already what graphql-core would serialize them to.
+_PLAIN_SCALARS = {"String", "ID", "Int", "Boolean"}
+
+
+@dataclass(frozen=True, slots=True)
+class _Execution:
+    context: GraphQLContext
+    fragment_cache: "ResponseCache | None"
+    # Fragment cache version before anything was read, so no fragment
+    # built from data changed meanwhile is stored.
+    since_version: int
+
+
+class _ObjectPlan:
+    def __init__(
+        self,
+        build: Callable[..., dict[str, Any]],
+        children: list["_ChildPlan"],
+        entity_kind: str | None,
+        shape: str,
+        encode: Callable[[dict[str, Any]], str],
+        spliced: list[str],
+    ) -> None:
+        self._build = build
+        self._children = children
+        self._entity_kind = entity_kind
+        # The resolved selection, e.g. "BookType{id:id,author:author AuthorType{...}}"
+        self.shape = shape
+        self.holds_entities = entity_kind is not None or any(
+            child.plan is not None and child.plan.holds_entities for child in children
+        )
+        self._selection = hashlib.sha1(shape.encode()).hexdigest()[:16]
+        self._encode = encode
+        # Keys whose values may hold fragments
+        self._spliced = spliced
+
+    async def run(self, sources: list[Any], execution: _Execution) -> list[Any]:
+        if self._entity_kind is not None and execution.fragment_cache is not None:
+            return await self._run_fragments(sources, execution, execution.fragment_cache)
+        return await self._run_objects(sources, execution)
+
+    async def _run_objects(
+        self, sources: list[Any], execution: _Execution
+    ) -> list[dict[str, Any]]:
+        columns = [await child.run(sources, execution) for child in self._children]
+        if self._entity_kind is not None:
+            track_dependencies(f"{self._entity_kind}:{m.id}" for m in sources)
+        return list(map(self._build, sources, *columns))
+
+    async def _run_fragments(
+        self, sources: list[Any], execution: _Execution, cache: "ResponseCache"
+    ) -> list[Fragment]:
+        """Entities as fragments: cached ones as they are, the others built and cached."""
+        keys = [f"{self._entity_kind}:{m.id}" for m in sources]
+        fragments: list[Fragment | None] = [cache.get(f"{key}\n{self._selection}") for key in keys]
+        track_dependencies(
+            dependency
+            for fragment in fragments
+            if fragment is not None
+            for dependency in fragment.dependencies
+        )
+        # A page often names the same author many times; each is built once.
+        misses: dict[str, list[int]] = {}
+        for i, fragment in enumerate(fragments):
+            if fragment is None:
+                misses.setdefault(keys[i], []).append(i)
+        if misses:
+            missing = [sources[indices[0]] for indices in misses.values()]
+            built = await self._run_objects(missing, execution)
+            for (key, indices), m, value in zip(misses.items(), missing, built):
+                dependencies = {key}
+                for child in self._children:
+                    if child.dependency is not None:
+                        dependencies.add(f"{child.dependency}:{child.get(m)}")
+                for spliced in self._spliced:
+                    collect_dependencies(value[spliced], dependencies)
+                fragment = Fragment(self._encode(value), frozenset(dependencies))
+                cache.put(
+                    f"{key}\n{self._selection}",
+                    fragment,
+                    fragment.dependencies,
+                    execution.since_version,
+                    size=len(fragment.json),
+                )
+                for i in indices:
+                    fragments[i] = fragment
+        return fragments  # type: ignore[return-value]
+
+    async def run_nullable(self, sources: list[Any], execution: _Execution) -> list[Any]:
+        if None not in sources:
+            return await self.run(sources, execution)
+        built = iter(await self.run([m for m in sources if m is not None], execution))
+        return [None if m is None else next(built) for m in sources]
+
+    async def run_lists(
+        self, lists: list[Sequence[Any]], execution: _Execution
+    ) -> list[list[Any]]:
+        built = iter(await self.run([m for items in lists for m in items], execution))
+        return [list(islice(built, len(items))) for items in lists]
+
+
+class _AbstractPlan(_ObjectPlan):
+    """A union or interface; each source is built by the plan of its own type."""
+
+    def __init__(self, members: dict[type, _ObjectPlan]) -> None:
+        self._members = members
+        self.shape = "|".join(plan.shape for plan in members.values())
+        self.holds_entities = any(plan.holds_entities for plan in members.values())
+
+    async def run(self, sources: list[Any], execution: _Execution) -> list[Any]:
+        built: list[Any] = [None] * len(sources)
+        for source_type, plan in self._members.items():
+            indices = [i for i, m in enumerate(sources) if type(m) is source_type]
+            if indices:
+                values = await plan.run([sources[i] for i in indices], execution)
+                for i, value in zip(indices, values):
+                    built[i] = value
+        if None in built:
+            raise _Fallback("value of an unexpected type")
+        return built
+
+
+@dataclass(frozen=True, slots=True)
+class _ChildPlan:
+    get: Callable[[Any], Any]
+    plan: _ObjectPlan | None
+    many: bool
+    nullable: bool
+    loader: str | None = None
+    count: bool = False
+    dependency: str | None = None
+
+    async def run(self, sources: list[Any], execution: _Execution) -> list[Any]:
+        values = list(map(self.get, sources))
+        if self.loader is not None:
+            if self.dependency is not None:
+                track_dependencies(f"{self.dependency}:{key}" for key in values)
+            values = await getattr(execution.context, self.loader).load_many(values)
+            if self.count:
+                return [len(value) for value in values]
+        assert self.plan is not None
+        if self.many:
+            return await self.plan.run_lists(values, execution)
+        if not self.nullable and None in values:
+            raise _Fallback("null for a non-null field")
+        return await self.plan.run_nullable(values, execution)
+
+
+@dataclass(frozen=True, slots=True)
+class _RootFieldPlan:
+    key: str
+    name: str
+    node: FieldNode
+    definition: Any
+    fetch: Callable[..., Awaitable[Any]]
+    plan: _ObjectPlan
+    many: bool
+
+
+class ExecutionPlan:
+    """A query document compiled for its single operation."""
+
+    def __init__(
+        self,
+        schema: strawberry.Schema,
+        operation: OperationDefinitionNode,
+        root_fields: list[_RootFieldPlan],
+    ) -> None:
+        self._schema = schema
+        self._operation = operation
+        self._root_fields = root_fields
+        self.operation_name = operation.name.value if operation.name else None
+
+    async def execute(
+        self,
+        context: GraphQLContext,
+        variables: dict[str, Any] | None = None,
+        operation_name: str | None = None,
+    ) -> dict[str, Any] | None:
+        """The response data, or None when the generic executor has to answer instead.
+
+        With a fragment cache on the context, books and authors in the data
+        are Fragments, to be written with `fragments.encode_json`.
+        """
+        fragment_cache = context.fragment_cache
+        execution = _Execution(
+            context, fragment_cache, fragment_cache.version if fragment_cache else 0
+        )
+        try:
+            if operation_name is not None and operation_name != self.operation_name:
+                raise _Fallback(f"operation {operation_name!r} is not in the document")
+            coerced = get_variable_values(
+                self._schema._schema, self._operation.variable_definitions, variables or {}
+            )
+            if isinstance(coerced, list):
+                raise _Fallback("variables do not coerce")
+            data: dict[str, Any] = {}
+            for field in self._root_fields:
+                data[field.key] = await self._resolve_root(field, execution, coerced)
+            return data
+        except Exception:
+            logger.debug("Execution plan fell back to the generic executor", exc_info=True)
+            return None
+
+    async def _resolve_root(
+        self, field: _RootFieldPlan, execution: _Execution, variables: dict[str, Any]
+    ) -> Any:
+        arguments = get_argument_values(field.definition, field.node, variables)
+        track_dependencies((root_field_dependency(field.name, arguments),))
+        strawberry_field = field.definition.extensions["strawberry-definition"]
+        kwargs = convert_arguments(
+            arguments,
+            strawberry_field.arguments,
+            scalar_registry=self._schema.schema_converter.scalar_registry,
+            config=self._schema.config,
+        )
+        value = await field.fetch(execution.context, **kwargs)
+        if field.many:
+            return await field.plan.run(list(value), execution)
+        return (await field.plan.run([value], execution))[0]
+
+
+def compile_operation(schema: strawberry.Schema, query: str) -> ExecutionPlan:
+    """Compile `query`, which must hold exactly one query operation."""
+    return _Compiler(schema, parse(query)).compile()
+
+
+class _Compiler:
+    def __init__(self, schema: strawberry.Schema, document: DocumentNode) -> None:
+        self._schema = schema
+        self._graphql_schema: GraphQLSchema = schema._schema
+        self._document = document
+        self._fragments: dict[str, FragmentDefinitionNode] = {}
+        self._operations: list[OperationDefinitionNode] = []
+        for definition in document.definitions:
+            if isinstance(definition, FragmentDefinitionNode):
+                self._fragments[definition.name.value] = definition
+            elif isinstance(definition, OperationDefinitionNode):
+                self._operations.append(definition)
+        self._builders = 0
+
+    def compile(self) -> ExecutionPlan:
+        if errors := validate(self._graphql_schema, self._document):
+            raise UnsupportedOperationError(f"invalid document: {errors[0].message}")
+        if len(self._operations) != 1:
+            raise UnsupportedOperationError("only documents with a single operation compile")
+        operation = self._operations[0]
+        if operation.operation is not OperationType.QUERY:
+            raise UnsupportedOperationError("only queries compile")
+        if operation.directives:
+            raise UnsupportedOperationError("operation directives are not supported")
+
+        query_type = self._graphql_schema.query_type
+        assert query_type is not None
+        root_fields = []
+        for key, nodes in self._collect(query_type, [operation.selection_set]).items():
+            name = nodes[0].name.value
+            if name not in _ROOT_FIELDS:
+                raise UnsupportedOperationError(f"root field {name!r} is not supported")
+            definition = query_type.fields[name]
+            strawberry_field = definition.extensions["strawberry-definition"]
+            if strawberry_field.permission_classes or strawberry_field.extensions:
+                raise UnsupportedOperationError(
+                    f"root field {name!r} has permissions or extensions"
+                )
+            return_type, many, _ = _unwrap(definition.type)
+            root_fields.append(
+                _RootFieldPlan(
+                    key=key,
+                    name=name,
+                    node=nodes[0],
+                    definition=definition,
+                    fetch=_ROOT_FIELDS[name],
+                    plan=self._compile_type(return_type, nodes),
+                    many=many,
+                )
+            )
+        return ExecutionPlan(self._schema, operation, root_fields)
+
+    def _compile_type(self, graphql_type: Any, nodes: list[FieldNode]) -> _ObjectPlan:
+        selection_sets = [node.selection_set for node in nodes if node.selection_set]
+        if isinstance(graphql_type, GraphQLObjectType):
+            return self._compile_object(graphql_type, selection_sets)
+        if isinstance(graphql_type, GraphQLAbstractType):
+            members: dict[type, _ObjectPlan] = {}
+            for source_type, type_name in _SOURCE_TYPES.items():
+                member = self._graphql_schema.get_type(type_name)
+                if isinstance(member, GraphQLObjectType) and self._graphql_schema.is_sub_type(
+                    graphql_type, member
+                ):
+                    members[source_type] = self._compile_object(member, selection_sets)
+            if len(members) != len(self._graphql_schema.get_possible_types(graphql_type)):
+                raise UnsupportedOperationError(
+                    f"type {graphql_type.name} has unsupported members"
+                )
+            return _AbstractPlan(members)
+        raise UnsupportedOperationError(f"type {graphql_type} is not supported")
+
+    def _compile_object(
+        self, object_type: GraphQLObjectType, selection_sets: list[SelectionSetNode]
+    ) -> _ObjectPlan:
+        specs = _FIELDS.get(object_type.name)
+        if specs is None:
+            raise UnsupportedOperationError(f"type {object_type.name} is not supported")
+
+        namespace: dict[str, Any] = {}
+        items: list[str] = []
+        shape: list[str] = []
+        spliced: list[str] = []
+        children: list[_ChildPlan] = []
+        fields = self._collect(object_type, selection_sets)
+        for key, nodes in fields.items():
+            name = nodes[0].name.value
+            shape.append(f"{key}:{name}")
+            if name == "__typename":
+                items.append(f"{key!r}: {object_type.name!r}")
+                continue
+            spec = specs.get(name)
+            if spec is None:
+                raise UnsupportedOperationError(
+                    f"field {object_type.name}.{name} is not supported"
+                )
+            field_type, many, nullable = _unwrap(object_type.fields[name].type)
+            if isinstance(spec, _Value):
+                value = self._serialize(spec.expression, field_type, nullable, namespace)
+                items.append(f"{key!r}: {value}")
+                continue
+            child = self._compile_child(spec, field_type, many, nullable, nodes)
+            if child.plan is not None:
+                shape[-1] += f" {child.plan.shape}"
+                if child.plan.holds_entities:
+                    spliced.append(key)
+            children.append(child)
+            items.append(f"{key!r}: c{len(children) - 1}")
+
+        self._builders += 1
+        function_name = f"build_{object_type.name}_{self._builders}"
+        params = ", ".join(["m", *(f"c{i}" for i in range(len(children)))])
+        source = f"def {function_name}({params}):\n    return {{{', '.join(items)}}}"
+        exec(source, namespace)
+        return _ObjectPlan(
+            namespace[function_name],
+            children,
+            _ENTITY_KINDS.get(object_type.name),
+            shape=f"{object_type.name}{{{','.join(shape)}}}",
+            encode=_encoder(list(fields), spliced),
+            spliced=spliced,
+        )
+
+    def _compile_child(
+        self,
+        spec: _Object | _Loaded,
+        field_type: Any,
+        many: bool,
+        nullable: bool,
+        nodes: list[FieldNode],
+    ) -> _ChildPlan:
+        if isinstance(spec, _Object):
+            return _ChildPlan(
+                get=eval(f"lambda m: {spec.expression}"),
+                plan=self._compile_type(field_type, nodes),
+                many=many,
+                nullable=nullable,
+            )
+        return _ChildPlan(
+            get=eval(f"lambda m: {spec.key}"),
+            plan=None if spec.count else self._compile_type(field_type, nodes),
+            many=many,
+            nullable=nullable,
+            loader=spec.loader,
+            count=spec.count,
+            dependency=spec.dependency,
+        )
+
+    def _serialize(
+        self, expression: str, scalar: Any, nullable: bool, namespace: dict[str, Any]
+    ) -> str:
+        if not isinstance(scalar, GraphQLScalarType):
+            raise UnsupportedOperationError(f"leaf type {scalar} is not supported")
+        if scalar.name in _PLAIN_SCALARS:
+            return expression
+        serializer = f"_serialize_{scalar.name}"
+        namespace[serializer] = scalar.serialize
+        if nullable:
+            return f"(None if (v := {expression}) is None else {serializer}(v))"
+        return f"{serializer}({expression})"
+
+    def _collect(
+        self, object_type: GraphQLObjectType, selection_sets: list[SelectionSetNode]
+    ) -> dict[str, list[FieldNode]]:
+        """Fields selected on `object_type`, grouped by response key in order."""
+        fields: dict[str, list[FieldNode]] = {}
+        for selection_set in selection_sets:
+            for selection in selection_set.selections:
+                if selection.directives:
+                    raise UnsupportedOperationError("directives in selections are not supported")
+                if isinstance(selection, FieldNode):
+                    key = selection.alias.value if selection.alias else selection.name.value
+                    fields.setdefault(key, []).append(selection)
+                    continue
+                if isinstance(selection, InlineFragmentNode):
+                    fragment: InlineFragmentNode | FragmentDefinitionNode = selection
+                elif isinstance(selection, FragmentSpreadNode):
+                    fragment = self._fragments[selection.name.value]
+                    if fragment.directives:
+                        raise UnsupportedOperationError("directives on fragments are not supported")
+                else:
+                    raise UnsupportedOperationError(f"{selection.kind} is not supported")
+                if self._applies(fragment, object_type):
+                    for key, nodes in self._collect(object_type, [fragment.selection_set]).items():
+                        fields.setdefault(key, []).extend(nodes)
+        return fields
+
+    def _applies(
+        self, fragment: InlineFragmentNode | FragmentDefinitionNode, object_type: GraphQLObjectType
+    ) -> bool:
+        if fragment.type_condition is None:
+            return True
+        condition = self._graphql_schema.get_type(fragment.type_condition.name.value)
+        if condition is object_type:
+            return True
+        return isinstance(condition, GraphQLAbstractType) and self._graphql_schema.is_sub_type(
+            condition, object_type
+        )
+
+
+def _encoder(keys: list[str], spliced: list[str]) -> Callable[[dict[str, Any]], str]:
+    """A function writing objects with `keys` like json.dumps, splicing fragments in `spliced`."""
+    if not spliced:
+        return json.dumps
+    segments: list[str] = []
+    plain: list[str] = []
+    for key in [*keys, None]:
+        if key is not None and key not in spliced:
+            plain.append(key)
+            continue
+        if plain:
+            # Runs of keys without fragments are written in one call.
+            items = ", ".join(f"{k!r}: d[{k!r}]" for k in plain)
+            segments.append(f"_dumps({{{items}}})[1:-1]")
+            plain = []
+        if key is not None:
+            segments.append(f"{json.dumps(key) + ': '!r} + _splice(d[{key!r}])")
+    namespace: dict[str, Any] = {"_dumps": json.dumps, "_splice": splice}
+    exec(f"def encode(d):\n    return '{{' + ', '.join(({', '.join(segments)},)) + '}}'", namespace)
+    return namespace["encode"]
+
+
+def _unwrap(graphql_type: GraphQLOutputType) -> tuple[Any, bool, bool]:
+    """(named type, is a list, is nullable) of a field type."""
+    nullable = not isinstance(graphql_type, GraphQLNonNull)
+    if isinstance(graphql_type, GraphQLNonNull):
+        graphql_type = graphql_type.of_type
+    if isinstance(graphql_type, GraphQLList):
+        item_type = graphql_type.of_type
+        if not isinstance(item_type, GraphQLNonNull) or isinstance(item_type.of_type, GraphQLList):
+            raise UnsupportedOperationError("only lists of non-null values are supported")
+        return item_type.of_type, True, nullable
+    return graphql_type, False, nullable
+
+
+class ExecutionPlans:
+    """Execution plans for registered documents, looked up by their exact text."""
+
+    def __init__(self, schema: strawberry.Schema, *, verify: bool = False) -> None:
+        self._schema = schema
+        self._plans: dict[str, ExecutionPlan] = {}
+        # Run the generic executor as well and log any difference from the plan.
+        self.verify = verify
+
+    @classmethod
+    def from_file(
+        cls, schema: strawberry.Schema, path: Path, *, verify: bool = False
+    ) -> "ExecutionPlans":
+        """Plans for a JSON array of documents; those that do not compile are skipped."""
+        plans = cls(schema, verify=verify)
+        for query in json.loads(path.read_text()):
+            try:
+                plans.register(query)
+            except UnsupportedOperationError as exc:
+                logger.warning("Not compiling an operation from %s: %s", path, exc)
+        return plans
+
+    def register(self, query: str) -> ExecutionPlan:
+        plan = self._plans.get(query)
+        if plan is None:
+            plan = self._plans[query] = compile_operation(self._schema, query)
+        return plan
+
+    def get(self, query: str) -> ExecutionPlan | None:
+        return self._plans.get(query)
+
+    def __len__(self) -> int:
+        return len(self._plans)
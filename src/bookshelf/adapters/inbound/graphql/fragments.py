@@ -0,0 +1,58 @@
+"""Pre-encoded JSON for parts of a response, spliced in when the response is encoded.
+
+Execution plans encode each book and author they build once per selection
+set and keep the text in the fragment cache; response data then holds the
+Fragment where the entity's object would be. Only `encode_json` knows how
+to write such data, so fragments are produced for requests served by the
+app's router alone.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any
+
+_dumps = json.dumps
+
+
+@dataclass(frozen=True, slots=True)
+class Fragment:
+    """The encoded JSON of one value, and the dependencies it was built from."""
+
+    json: str
+    dependencies: frozenset[str]
+
+    def __str__(self) -> str:
+        # What size estimates that fall back to str() should count.
+        return self.json
+
+
+def encode_json(value: Any) -> str:
+    """`json.dumps(value)`, with the text of every Fragment in `value` spliced in."""
+    try:
+        return _dumps(value)
+    except TypeError:
+        # Raised at the first fragment, which plans put near the start.
+        return splice(value)
+
+
+def splice(value: Any) -> str:
+    if type(value) is Fragment:
+        return value.json
+    if isinstance(value, dict):
+        items = ", ".join(f"{_dumps(key)}: {splice(item)}" for key, item in value.items())
+        return "{" + items + "}"
+    if isinstance(value, list | tuple):
+        return "[" + ", ".join(map(splice, value)) + "]"
+    return _dumps(value)
+
+
+def collect_dependencies(value: Any, dependencies: set[str]) -> None:
+    """Add the dependencies of every Fragment in `value`."""
+    if type(value) is Fragment:
+        dependencies.update(value.dependencies)
+    elif isinstance(value, dict):
+        for item in value.values():
+            collect_dependencies(item, dependencies)
+    elif isinstance(value, list | tuple):
+        for item in value:
+            collect_dependencies(item, dependencies)
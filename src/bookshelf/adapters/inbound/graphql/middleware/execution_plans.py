@@ -0,0 +1,84 @@
+import json
+import logging
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
+
+from graphql import ExecutionResult
+from strawberry.extensions import SchemaExtension
+from strawberry.types.graphql import OperationType
+
+from bookshelf.adapters.inbound.graphql.fragments import encode_json
+
+if TYPE_CHECKING:
+    from bookshelf.adapters.inbound.graphql.execution_plans import ExecutionPlans
+
+logger = logging.getLogger("bookshelf.graphql")
+
+
+class ExecutionPlanExtension(SchemaExtension):
+    """Answers registered queries with their compiled ExecutionPlan.
+
+    In verify mode the generic executor answers as usual, and the plan's
+    data is compared with its result; any difference is logged.
+    """
+
+    async def on_execute(self) -> AsyncIterator[None]:  # type: ignore[override]
+        execution_context = self.execution_context
+        plans: ExecutionPlans | None = getattr(execution_context.context, "execution_plans", None)
+        plan = (
+            plans.get(execution_context.query)
+            if plans is not None
+            and execution_context.query is not None
+            and execution_context.result is None
+            and execution_context.operation_type is OperationType.QUERY
+            else None
+        )
+        if plan is None:
+            yield
+            return
+
+        data = await plan.execute(
+            execution_context.context,
+            execution_context.variables,
+            execution_context.operation_name,
+        )
+        if data is None or not plans.verify:  # type: ignore[union-attr]
+            if data is not None:
+                execution_context.result = ExecutionResult(data=data)
+            yield
+            return
+
+        yield
+        result = execution_context.result
+        if not isinstance(result, ExecutionResult):
+            return
+        # Fragments in the plan's data are compared as the client would read them.
+        difference = _first_difference(json.loads(encode_json(data)), result.data, "data")
+        if difference is not None:
+            logger.warning(
+                "Execution plan for operation %r differs from the generic executor at %s",
+                plan.operation_name or "anonymous",
+                difference,
+            )
+
+
+def _first_difference(compiled: Any, generic: Any, path: str) -> str | None:
+    """Where two responses first differ, keys in the same order included, or None."""
+    if isinstance(compiled, dict) and isinstance(generic, dict):
+        if list(compiled) != list(generic):
+            return f"{path} (keys {list(compiled)} != {list(generic)})"
+        for key, value in compiled.items():
+            if (difference := _first_difference(value, generic[key], f"{path}.{key}")) is not None:
+                return difference
+        return None
+    if isinstance(compiled, list) and isinstance(generic, list):
+        if len(compiled) != len(generic):
+            return f"{path} (length {len(compiled)} != {len(generic)})"
+        for i, (a, b) in enumerate(zip(compiled, generic)):
+            if (difference := _first_difference(a, b, f"{path}[{i}]")) is not None:
+                return difference
+        return None
+    # Leaves are compared as clients see them, which still tells 1 from 1.0 and true.
+    if json.dumps(compiled, default=str) == json.dumps(generic, default=str):
+        return None
+    return f"{path} ({compiled!r} != {generic!r})"
@@ -42,9 +42,11 @@ class QueryDepthLimiter(SchemaExtension):
         super().__init__(execution_context=execution_context)
         self.max_depth = max_depth
 
-    async def on_execute(self) -> AsyncIterator[None]:  # type: ignore[override]
-        document = self.execution_context.graphql_document
-        if document is not None:
+    async def on_validate(self) -> AsyncIterator[None]:  # type: ignore[override]
+        execution_context = self.execution_context
+        document = execution_context.graphql_document
+        # Documents that arrive pre-validated (persisted queries) were checked when cached.
+        if document is not None and execution_context.pre_execution_errors is None:
             for definition in document.definitions:
                 depth = _get_query_depth(definition)
                 if depth > self.max_depth:
@@ -0,0 +1,67 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextvars import ContextVar
+from inspect import isawaitable
+from typing import Any
+
+from graphql import GraphQLResolveInfo
+from starlette.websockets import WebSocket
+from strawberry.extensions import SchemaExtension
+from strawberry.types.graphql import OperationType
+
+from bookshelf.application.identity_map import IdentityMap, use_identity_map
+
+# Results of the root fields resolved so far by the query being executed.
+_root_results: ContextVar[dict[tuple[str, str], Any] | None] = ContextVar(
+    "identity_map_root_results", default=None
+)
+
+
+class IdentityMapExtension(SchemaExtension):
+    """Scopes repository reads and read-model conversion to the context's IdentityMap.
+
+    Root fields of a query called more than once with the same arguments,
+    under different aliases, are resolved once. A WebSocket connection
+    serves many operations from one context, so each gets a map of its own;
+    subscriptions are long-lived and run without one.
+    """
+
+    async def on_execute(self) -> AsyncIterator[None]:  # type: ignore[override]
+        execution_context = self.execution_context
+        context = execution_context.context
+        identity_map: IdentityMap | None = getattr(context, "identity_map", None)
+        operation_type = execution_context.operation_type
+        if identity_map is None or operation_type is OperationType.SUBSCRIPTION:
+            yield
+            return
+        if isinstance(getattr(context, "request", None), WebSocket):
+            identity_map = IdentityMap()
+
+        token = _root_results.set({} if operation_type is OperationType.QUERY else None)
+        try:
+            with use_identity_map(identity_map):
+                yield
+        finally:
+            _root_results.reset(token)
+
+    def resolve(
+        self,
+        _next: Callable[..., Any],
+        root: Any,
+        info: GraphQLResolveInfo,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        results = _root_results.get()
+        if results is None or info.path.prev is not None:
+            return _next(root, info, *args, **kwargs)
+
+        key = (info.field_name, repr(sorted(kwargs.items())))
+        if key in results:
+            return results[key]
+        result = _next(root, info, *args, **kwargs)
+        if isawaitable(result):
+            result = asyncio.ensure_future(result)
+        results[key] = result
+        return result
+
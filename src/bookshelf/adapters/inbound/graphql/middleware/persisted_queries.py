@@ -0,0 +1,129 @@
+import hashlib
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from graphql import DocumentNode, GraphQLError
+from strawberry.extensions import SchemaExtension
+
+PERSISTED_QUERY_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedDocument:
+    query: str
+    document: DocumentNode
+
+
+@dataclass(slots=True)
+class _Operation:
+    # The cached document installed for this operation, if any, and whether
+    # this operation's document passed validation (and depth analysis).
+    vetted: DocumentNode | None = None
+    validated: bool = False
+
+
+_operation: ContextVar[_Operation | None] = ContextVar("persisted_query_operation", default=None)
+
+
+def query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+class PersistedQueryError(GraphQLError):
+    def __init__(self, message: str, code: str) -> None:
+        super().__init__(message, extensions={"code": code})
+
+
+class PersistedQueryExtension(SchemaExtension):
+    """Automatic persisted queries backed by a cache of vetted documents.
+
+    Clients may send only `extensions.persistedQuery.sha256Hash`; an unknown
+    hash is answered with PERSISTED_QUERY_NOT_FOUND so the client retries with
+    the full text. A document is cached by the SHA-256 of its text only once
+    its operation passed parsing, validation and depth analysis and ran
+    without errors; later requests for the same hash reuse it and skip all
+    three steps.
+    """
+
+    def __init__(self, *, execution_context: Any = None, max_documents: int = 1000) -> None:
+        super().__init__(execution_context=execution_context)
+        self.max_documents = max_documents
+        self._documents: OrderedDict[str, _CachedDocument] = OrderedDict()
+
+    async def on_operation(self) -> AsyncIterator[None]:  # type: ignore[override]
+        execution_context = self.execution_context
+        persisted = (execution_context.operation_extensions or {}).get("persistedQuery")
+        query = execution_context.query
+
+        if persisted is not None:
+            if persisted.get("version") != PERSISTED_QUERY_VERSION:
+                raise PersistedQueryError(
+                    "Unsupported persisted query version", "PERSISTED_QUERY_NOT_SUPPORTED"
+                )
+            digest = persisted.get("sha256Hash")
+            if not isinstance(digest, str):
+                raise PersistedQueryError(
+                    "Persisted query hash is missing", "PERSISTED_QUERY_HASH_MISSING"
+                )
+            if query is not None and query_hash(query) != digest:
+                raise PersistedQueryError(
+                    "Provided sha256Hash does not match query", "PERSISTED_QUERY_HASH_MISMATCH"
+                )
+        elif query is not None:
+            digest = query_hash(query)
+        else:
+            yield
+            return
+
+        cached = self._documents.get(digest)
+        if cached is not None:
+            self._documents.move_to_end(digest)
+            execution_context.query = cached.query
+            execution_context.graphql_document = cached.document
+            token = _operation.set(_Operation(vetted=cached.document))
+            try:
+                yield
+            finally:
+                _operation.reset(token)
+            return
+
+        if query is None:
+            raise PersistedQueryError("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")
+
+        operation = _Operation()
+        token = _operation.set(operation)
+        try:
+            yield
+        finally:
+            _operation.reset(token)
+
+        document = execution_context.graphql_document
+        result = execution_context.result
+        if (
+            operation.validated
+            and document is not None
+            and not execution_context.pre_execution_errors
+            and result is not None
+            and not result.errors
+        ):
+            self._documents[digest] = _CachedDocument(query=query, document=document)
+            if len(self._documents) > self.max_documents:
+                self._documents.popitem(last=False)
+
+    async def on_validate(self) -> AsyncIterator[None]:  # type: ignore[override]
+        execution_context = self.execution_context
+        operation = _operation.get()
+        if (
+            operation is not None
+            and operation.vetted is not None
+            and execution_context.graphql_document is operation.vetted
+        ):
+            # An empty error list tells strawberry, and the depth limiter,
+            # that the document is already validated.
+            execution_context.pre_execution_errors = []
+        yield
+        if operation is not None and not execution_context.pre_execution_errors:
+            operation.validated = True
@@ -0,0 +1,241 @@
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLNamedType,
+    GraphQLObjectType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    IntValueNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+    VariableNode,
+    build_ast_schema,
+    get_named_type,
+    parse,
+)
+from strawberry.extensions import SchemaExtension
+from strawberry.schema.base import BaseSchema
+
+from bookshelf.adapters.inbound.graphql.middleware.persisted_queries import query_hash
+
+# Extra cost of resolving a field, keyed by "ParentType.field". Fields that
+# return objects cost 1 unless listed; scalar fields are free, but every item
+# of a list costs at least 1 whatever it selects.
+DEFAULT_FIELD_WEIGHTS: dict[str, int] = {
+    "Query.books": 5,
+    "Query.authors": 5,
+    "Query.topBooks": 2,
+    "AuthorType.books": 2,
+    "BookType.reviews": 2,
+}
+
+# Assumed number of items for list fields when no `first`/`last` is given.
+DEFAULT_LIST_SIZES: dict[str, int] = {
+    "Query.books": 100,
+    "Query.authors": 100,
+    "Query.topBooks": 10,
+    "AuthorType.books": 20,
+    "BookType.reviews": 20,
+    "BookType.genres": 3,
+}
+
+_SIZE_ARGUMENTS = ("first", "last")
+
+
+@dataclass(frozen=True, slots=True)
+class _CostNode:
+    weight: int
+    size: int
+    size_variable: str | None
+    is_list: bool
+    children: tuple["_CostNode", ...]
+
+
+def _evaluate(nodes: tuple[_CostNode, ...], variables: Mapping[str, Any]) -> int:
+    total = 0
+    for node in nodes:
+        size = node.size
+        if node.size_variable is not None:
+            value = variables.get(node.size_variable)
+            if isinstance(value, int) and not isinstance(value, bool):
+                size = max(value, 0)
+        item = _evaluate(node.children, variables)
+        total += node.weight + size * (max(item, 1) if node.is_list else item)
+    return total
+
+
+@lru_cache(maxsize=8)
+def _schema_structure(schema: BaseSchema) -> GraphQLSchema:
+    """The types and fields of `schema`, rebuilt from its SDL once per schema."""
+    return build_ast_schema(parse(schema.as_str()))
+
+
+class _CostPlanner:
+    """Compiles an operation into a tree of weights and list-size multipliers."""
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        fragments: dict[str, FragmentDefinitionNode],
+        variable_defaults: dict[str, int],
+        field_weights: Mapping[str, int],
+        list_sizes: Mapping[str, int],
+    ) -> None:
+        self._schema = schema
+        self._fragments = fragments
+        self._variable_defaults = variable_defaults
+        self._field_weights = field_weights
+        self._list_sizes = list_sizes
+
+    def plan(
+        self, parent: GraphQLNamedType | None, selection_set: SelectionSetNode | None
+    ) -> tuple[_CostNode, ...]:
+        if selection_set is None or parent is None:
+            return ()
+        nodes: list[_CostNode] = []
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                node = self._plan_field(parent, selection)
+                if node is not None:
+                    nodes.append(node)
+            elif isinstance(selection, InlineFragmentNode):
+                condition = parent
+                if selection.type_condition is not None:
+                    condition = self._schema.get_type(selection.type_condition.name.value)
+                nodes.extend(self.plan(condition, selection.selection_set))
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = self._fragments.get(selection.name.value)
+                if fragment is not None:
+                    condition = self._schema.get_type(fragment.type_condition.name.value)
+                    nodes.extend(self.plan(condition, fragment.selection_set))
+        return tuple(nodes)
+
+    def _plan_field(self, parent: GraphQLNamedType, field: FieldNode) -> _CostNode | None:
+        if not isinstance(parent, GraphQLObjectType):
+            return None
+        definition = parent.fields.get(field.name.value)
+        if definition is None:
+            # Introspection and __typename are not charged.
+            return None
+
+        key = f"{parent.name}.{field.name.value}"
+        default_weight = 1 if field.selection_set is not None else 0
+        is_list = key in self._list_sizes
+        size = self._list_sizes.get(key, 1)
+        size_variable: str | None = None
+        for argument in field.arguments or ():
+            if argument.name.value not in _SIZE_ARGUMENTS:
+                continue
+            is_list = True
+            if isinstance(argument.value, IntValueNode):
+                size = max(int(argument.value.value), 0)
+            elif isinstance(argument.value, VariableNode):
+                size_variable = argument.value.name.value
+                size = self._variable_defaults.get(size_variable, size)
+            break
+
+        return _CostNode(
+            weight=self._field_weights.get(key, default_weight),
+            size=size,
+            size_variable=size_variable,
+            is_list=is_list,
+            children=self.plan(get_named_type(definition.type), field.selection_set),
+        )
+
+
+class QueryCostLimiter(SchemaExtension):
+    """Rejects operations whose estimated cost exceeds a budget.
+
+    Cost is the sum of field weights, with each list field's subtree
+    multiplied by its `first`/`last` argument (or an assumed size); an item
+    counts at least 1 even when it selects only scalars. The plan
+    for a document is compiled once per document hash; only the variables are
+    re-read on each request. The computed cost is returned under
+    `extensions.cost`.
+    """
+
+    def __init__(
+        self,
+        *,
+        execution_context: Any = None,
+        max_cost: int = 5000,
+        field_weights: Mapping[str, int] = DEFAULT_FIELD_WEIGHTS,
+        list_sizes: Mapping[str, int] = DEFAULT_LIST_SIZES,
+        max_documents: int = 1000,
+    ) -> None:
+        super().__init__(execution_context=execution_context)
+        self.max_cost = max_cost
+        self.field_weights = field_weights
+        self.list_sizes = list_sizes
+        self.max_documents = max_documents
+        self._plans: OrderedDict[tuple[str, str | None], tuple[_CostNode, ...]] = OrderedDict()
+
+    async def on_execute(self) -> AsyncIterator[None]:  # type: ignore[override]
+        execution_context = self.execution_context
+        document = execution_context.graphql_document
+        if document is None or execution_context.query is None:
+            yield
+            return
+
+        key = (query_hash(execution_context.query), execution_context.operation_name)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = self._compile(
+                _schema_structure(execution_context.schema), document.definitions, key[1]
+            )
+            self._plans[key] = plan
+            if len(self._plans) > self.max_documents:
+                self._plans.popitem(last=False)
+        else:
+            self._plans.move_to_end(key)
+
+        cost = _evaluate(plan, execution_context.variables or {})
+        execution_context.extensions_results["cost"] = {
+            "requested": cost,
+            "maximum": self.max_cost,
+        }
+        if cost > self.max_cost:
+            msg = f"Query cost {cost} exceeds maximum allowed cost of {self.max_cost}."
+            raise ValueError(msg)
+        yield
+
+    def _compile(
+        self, schema: GraphQLSchema, definitions: Any, operation_name: str | None
+    ) -> tuple[_CostNode, ...]:
+        fragments = {
+            d.name.value: d for d in definitions if isinstance(d, FragmentDefinitionNode)
+        }
+        operations = [d for d in definitions if isinstance(d, OperationDefinitionNode)]
+        operation = next(
+            (
+                o
+                for o in operations
+                if operation_name is None or (o.name is not None and o.name.value == operation_name)
+            ),
+            None,
+        )
+        if operation is None:
+            return ()
+
+        variable_defaults = {
+            v.variable.name.value: int(v.default_value.value)
+            for v in operation.variable_definitions or ()
+            if isinstance(v.default_value, IntValueNode)
+        }
+        root = {
+            OperationType.QUERY: schema.query_type,
+            OperationType.MUTATION: schema.mutation_type,
+            OperationType.SUBSCRIPTION: schema.subscription_type,
+        }[operation.operation]
+        planner = _CostPlanner(
+            schema, fragments, variable_defaults, self.field_weights, self.list_sizes
+        )
+        return planner.plan(root, operation.selection_set)
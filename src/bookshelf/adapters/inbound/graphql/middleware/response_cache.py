@@ -0,0 +1,127 @@
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextvars import ContextVar
+from functools import lru_cache
+from inspect import isawaitable
+from typing import Any
+
+from graphql import ExecutionResult, GraphQLResolveInfo, parse, print_ast
+from strawberry.extensions import SchemaExtension
+from strawberry.types.graphql import OperationType
+
+from bookshelf.adapters.inbound.graphql.types.author import AuthorType
+from bookshelf.adapters.inbound.graphql.types.book import BookType
+from bookshelf.adapters.outbound.response_cache import ResponseCache
+
+# Root fields and the argument that narrows them to a single entity; fields
+# without one depend on the whole collection ("Book:*" / "Author:*").
+_ROOT_FIELDS: dict[str, tuple[str, str | None]] = {
+    "book": ("Book", "bookId"),
+    "books": ("Book", None),
+    "topBooks": ("Book", None),
+    "author": ("Author", "authorId"),
+    "authors": ("Author", None),
+}
+
+# Dependencies collected by the resolvers of the operation being executed.
+_dependencies: ContextVar[set[str] | None] = ContextVar("response_cache_dependencies", default=None)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_query(query: str) -> str:
+    return print_ast(parse(query, no_location=True))
+
+
+class ResponseCacheExtension(SchemaExtension):
+    """Serves repeated queries from the ResponseCache on the GraphQL context."""
+
+    async def on_execute(self) -> AsyncIterator[None]:  # type: ignore[override]
+        execution_context = self.execution_context
+        cache: ResponseCache | None = getattr(execution_context.context, "response_cache", None)
+        if (
+            cache is None
+            or execution_context.query is None
+            or execution_context.operation_type is not OperationType.QUERY
+        ):
+            yield
+            return
+
+        key = "\n".join(
+            (
+                execution_context.operation_name or "",
+                json.dumps(execution_context.variables or {}, sort_keys=True, default=str),
+                _normalize_query(execution_context.query),
+            )
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            execution_context.result = ExecutionResult(data=cached)
+            execution_context.extensions_results["responseCache"] = {"hit": True}
+            yield
+            return
+
+        since_version = cache.version
+        dependencies: set[str] = set()
+        token = _dependencies.set(dependencies)
+        try:
+            yield
+        finally:
+            _dependencies.reset(token)
+
+        result = execution_context.result
+        if isinstance(result, ExecutionResult) and not result.errors and result.data is not None:
+            cache.put(key, result.data, dependencies, since_version)
+        execution_context.extensions_results["responseCache"] = {"hit": False}
+
+    def resolve(
+        self,
+        _next: Callable[..., Any],
+        root: Any,
+        info: GraphQLResolveInfo,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        dependencies = _dependencies.get()
+        if dependencies is None:
+            return _next(root, info, *args, **kwargs)
+
+        if info.parent_type.name == "Query" and info.field_name in _ROOT_FIELDS:
+            dependencies.add(root_field_dependency(info.field_name, kwargs))
+        elif isinstance(root, AuthorType) and info.field_name in ("books", "bookCount"):
+            dependencies.add(f"AuthorBooks:{root.id}")
+
+        result = _next(root, info, *args, **kwargs)
+        if isawaitable(result):
+            return self._track_awaitable(result, dependencies)
+        _track_value(result, dependencies)
+        return result
+
+    @staticmethod
+    async def _track_awaitable(result: Awaitable[Any], dependencies: set[str]) -> Any:
+        value = await result
+        _track_value(value, dependencies)
+        return value
+
+
+def root_field_dependency(field_name: str, arguments: dict[str, Any]) -> str:
+    """The dependency a root field adds, given its arguments keyed by GraphQL name."""
+    kind, argument = _ROOT_FIELDS[field_name]
+    narrowed = arguments.get(argument) if argument is not None else None
+    return f"{kind}:{narrowed if narrowed is not None else '*'}"
+
+
+def track_dependencies(dependencies: Iterable[str]) -> None:
+    """Record dependencies for values produced without going through `resolve`."""
+    current = _dependencies.get()
+    if current is not None:
+        current.update(dependencies)
+
+
+def _track_value(value: Any, dependencies: set[str]) -> None:
+    if isinstance(value, BookType):
+        dependencies.add(f"Book:{value.id}")
+    elif isinstance(value, AuthorType):
+        dependencies.add(f"Author:{value.id}")
+    elif isinstance(value, list):
+        for item in value:
+            _track_value(item, dependencies)
@@ -0,0 +1,106 @@
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextvars import ContextVar
+from functools import wraps
+from inspect import isawaitable
+from typing import Any
+
+from graphql import GraphQLResolveInfo
+from strawberry.extensions import SchemaExtension
+
+from bookshelf.adapters.metrics import MetricsRegistry
+
+RESOLVER_DURATION = "bookshelf_graphql_resolver_duration_seconds"
+STEP_DURATION = "bookshelf_graphql_step_duration_seconds"
+OPERATION_DURATION = "bookshelf_graphql_operation_duration_seconds"
+
+# Registry of the current operation when it is sampled, None otherwise.
+_sampled: ContextVar[MetricsRegistry | None] = ContextVar("tracing_sampled", default=None)
+
+
+def traced[**P, R](step: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Time a synchronous helper as a named step of sampled operations."""
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            registry = _sampled.get()
+            if registry is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed_us = (time.perf_counter_ns() - start) // 1000
+                registry.histogram(
+                    STEP_DURATION, "Duration of resolver steps.", scale=1e6, step=step
+                ).record(elapsed_us)
+
+        return wrapper
+
+    return decorator
+
+
+class TracingExtension(SchemaExtension):
+    """Records per-resolver latency for a sample of operations.
+
+    The sampling decision is made once per operation. Unsampled operations
+    pay a single context-variable lookup per field.
+    """
+
+    async def on_operation(self) -> AsyncIterator[None]:  # type: ignore[override]
+        execution_context = self.execution_context
+        registry: MetricsRegistry | None = getattr(execution_context.context, "metrics", None)
+        sample_rate: float = getattr(execution_context.context, "trace_sample_rate", 0.0)
+        if registry is None or sample_rate <= 0.0 or random.random() >= sample_rate:
+            yield
+            return
+
+        token = _sampled.set(registry)
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            _sampled.reset(token)
+            elapsed_us = (time.perf_counter_ns() - start) // 1000
+            registry.histogram(
+                OPERATION_DURATION,
+                "Duration of GraphQL operations.",
+                scale=1e6,
+                operation=execution_context.operation_name or "anonymous",
+            ).record(elapsed_us)
+
+    def resolve(
+        self,
+        _next: Callable[..., Any],
+        root: Any,
+        info: GraphQLResolveInfo,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        registry = _sampled.get()
+        if registry is None:
+            return _next(root, info, *args, **kwargs)
+
+        histogram = registry.histogram(
+            RESOLVER_DURATION,
+            "Duration of individual field resolvers.",
+            scale=1e6,
+            field=f"{info.parent_type.name}.{info.field_name}",
+        )
+        start = time.perf_counter_ns()
+        result = _next(root, info, *args, **kwargs)
+        if isawaitable(result):
+            return _time_awaitable(result, histogram.record, start)
+        histogram.record((time.perf_counter_ns() - start) // 1000)
+        return result
+
+
+async def _time_awaitable(
+    result: Awaitable[Any], record: Callable[[int], None], start: int
+) -> Any:
+    try:
+        return await result
+    finally:
+        record((time.perf_counter_ns() - start) // 1000)
@@ -0,0 +1,51 @@
+import time
+from collections.abc import AsyncIterator
+
+from graphql import ExecutionResult
+from strawberry.extensions import SchemaExtension
+from strawberry.types import ExecutionContext
+from strawberry.types.graphql import OperationType
+
+from bookshelf.adapters.outbound.traffic_recorder import TrafficRecorder
+
+
+def _is_subscription(execution_context: ExecutionContext) -> bool:
+    # Documents that failed to parse, or name no operation in them, are still
+    # captured: malformed requests are part of the traffic too.
+    if execution_context.graphql_document is None:
+        return False
+    try:
+        return execution_context.operation_type is OperationType.SUBSCRIPTION
+    except RuntimeError:
+        return False
+
+
+class TrafficCaptureExtension(SchemaExtension):
+    """Records a sample of queries and mutations with the context's TrafficRecorder."""
+
+    async def on_operation(self) -> AsyncIterator[None]:  # type: ignore[override]
+        execution_context = self.execution_context
+        recorder: TrafficRecorder | None = getattr(
+            execution_context.context, "traffic_recorder", None
+        )
+        if recorder is None or not recorder.sample():
+            yield
+            return
+
+        started_at = time.time()
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            query = execution_context.query
+            if query is not None and not _is_subscription(execution_context):
+                result = execution_context.result
+                recorder.record(
+                    query=query,
+                    operation_name=execution_context.operation_name,
+                    variables=execution_context.variables,
+                    started_at=started_at,
+                    duration_ms=(time.perf_counter_ns() - start) / 1e6,
+                    error=bool(execution_context.pre_execution_errors)
+                    or (isinstance(result, ExecutionResult) and bool(result.errors)),
+                )
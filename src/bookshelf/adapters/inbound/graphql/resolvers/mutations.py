@@ -36,9 +36,19 @@ from bookshelf.adapters.inbound.graphql.types.inputs import (
     RemoveGenreInput,
     RemoveReviewInput,
 )
+from bookshelf.application.create_authors import AuthorDraft
+from bookshelf.application.create_books import BookDraft
 from bookshelf.application.exception import ApplicationError
 from bookshelf.domain.exception.exceptions import DomainException
 
+MAX_BATCH_SIZE = 1000
+
+
+def _check_batch_size(size: int) -> None:
+    if size > MAX_BATCH_SIZE:
+        msg = f"Batch of {size} items exceeds the maximum of {MAX_BATCH_SIZE}."
+        raise ValueError(msg)
+
 
 @strawberry.type(description="Root mutation type for the Bookshelf API.")
 class Mutation:
@@ -80,14 +90,67 @@ class Mutation:
         except (DomainException, ApplicationError) as exc:
             return map_exception_to_error(exc)
 
+    @strawberry.mutation(
+        description="Create many books at once. Results line up with the inputs; "
+        "an invalid input yields an error in its position without affecting the others."
+    )
+    async def create_books(
+        self, info: AppInfo, inputs: list[CreateBookInput]
+    ) -> list[CreateBookResult]:
+        _check_batch_size(len(inputs))
+        results = await info.context.create_books_handler(
+            [
+                BookDraft(
+                    author_id=input.author_id,
+                    title=input.title,
+                    isbn=input.isbn,
+                    summary=input.summary,
+                    published_year=input.published_year,
+                    page_count=input.page_count,
+                    genres=[str(g.value) for g in input.genres],
+                )
+                for input in inputs
+            ]
+        )
+        return [
+            map_exception_to_error(result)
+            if isinstance(result, Exception)
+            else CreateBookResponse(book_id=str(result))
+            for result in results
+        ]
+
+    @strawberry.mutation(
+        description="Create many authors at once. Results line up with the inputs; "
+        "an invalid input yields an error in its position without affecting the others."
+    )
+    async def create_authors(
+        self, info: AppInfo, inputs: list[CreateAuthorInput]
+    ) -> list[CreateAuthorResult]:
+        _check_batch_size(len(inputs))
+        results = await info.context.create_authors_handler(
+            [
+                AuthorDraft(
+                    first_name=input.first_name,
+                    last_name=input.last_name,
+                    biography=input.biography,
+                )
+                for input in inputs
+            ]
+        )
+        return [
+            map_exception_to_error(result)
+            if isinstance(result, Exception)
+            else CreateAuthorResponse(author_id=str(result))
+            for result in results
+        ]
+
     @strawberry.mutation(description="Change the title of an existing book.")
     async def change_book_title(
         self, info: AppInfo, input: ChangeBookTitleInput
     ) -> ChangeBookTitleResult:
         handler = info.context.change_book_title_handler
         try:
-            await handler(book_id=input.book_id, new_title=input.new_title)
-            book = await info.context.get_book_by_id_handler(book_id=input.book_id)
+            book = await handler(book_id=input.book_id, new_title=input.new_title)
             return BookType.from_read_model(book)
         except (DomainException, ApplicationError) as exc:
             return map_exception_to_error(exc)
@@ -98,8 +161,7 @@ class Mutation:
     ) -> ChangeBookIsbnResult:
         handler = info.context.change_book_isbn_handler
         try:
-            await handler(book_id=input.book_id, new_isbn=input.new_isbn)
-            book = await info.context.get_book_by_id_handler(book_id=input.book_id)
+            book = await handler(book_id=input.book_id, new_isbn=input.new_isbn)
             return BookType.from_read_model(book)
         except (DomainException, ApplicationError) as exc:
             return map_exception_to_error(exc)
@@ -110,8 +172,7 @@ class Mutation:
     ) -> ChangeBookSummaryResult:
         handler = info.context.change_book_summary_handler
         try:
-            await handler(book_id=input.book_id, new_summary=input.new_summary)
-            book = await info.context.get_book_by_id_handler(book_id=input.book_id)
+            book = await handler(book_id=input.book_id, new_summary=input.new_summary)
             return BookType.from_read_model(book)
         except (DomainException, ApplicationError) as exc:
             return map_exception_to_error(exc)
@@ -122,8 +183,7 @@ class Mutation:
     ) -> AddGenreResult:
         handler = info.context.add_genre_to_book_handler
         try:
-            await handler(book_id=input.book_id, genre_name=str(input.genre.value))
-            book = await info.context.get_book_by_id_handler(book_id=input.book_id)
+            book = await handler(book_id=input.book_id, genre_name=str(input.genre.value))
             return BookType.from_read_model(book)
         except (DomainException, ApplicationError) as exc:
             return map_exception_to_error(exc)
@@ -134,8 +194,7 @@ class Mutation:
     ) -> RemoveGenreResult:
         handler = info.context.remove_genre_from_book_handler
         try:
-            await handler(book_id=input.book_id, genre_name=str(input.genre.value))
-            book = await info.context.get_book_by_id_handler(book_id=input.book_id)
+            book = await handler(book_id=input.book_id, genre_name=str(input.genre.value))
             return BookType.from_read_model(book)
         except (DomainException, ApplicationError) as exc:
             return map_exception_to_error(exc)
@@ -146,10 +205,9 @@ class Mutation:
     ) -> AddReviewResult:
         handler = info.context.add_review_to_book_handler
         try:
-            await handler(
+            book = await handler(
                 book_id=input.book_id, rating=input.rating, comment=input.comment
             )
-            book = await info.context.get_book_by_id_handler(book_id=input.book_id)
             return BookType.from_read_model(book)
         except (DomainException, ApplicationError) as exc:
             return map_exception_to_error(exc)
@@ -160,8 +218,7 @@ class Mutation:
     ) -> RemoveReviewResult:
         handler = info.context.remove_review_from_book_handler
         try:
-            await handler(book_id=input.book_id, review_id=input.review_id)
-            book = await info.context.get_book_by_id_handler(book_id=input.book_id)
+            book = await handler(book_id=input.book_id, review_id=input.review_id)
             return BookType.from_read_model(book)
         except (DomainException, ApplicationError) as exc:
             return map_exception_to_error(exc)
@@ -184,12 +241,11 @@ class Mutation:
     ) -> ChangeAuthorNameResult:
         handler = info.context.change_author_name_handler
         try:
-            await handler(
+            author = await handler(
                 author_id=input.author_id,
                 first_name=input.first_name,
                 last_name=input.last_name,
             )
-            author = await info.context.get_author_by_id_handler(author_id=input.author_id)
             return AuthorType.from_read_model(author)
         except (DomainException, ApplicationError) as exc:
             return map_exception_to_error(exc)
@@ -200,10 +256,9 @@ class Mutation:
     ) -> ChangeAuthorBiographyResult:
         handler = info.context.change_author_biography_handler
         try:
-            await handler(
+            author = await handler(
                 author_id=input.author_id, new_biography=input.new_biography
             )
-            author = await info.context.get_author_by_id_handler(author_id=input.author_id)
             return AuthorType.from_read_model(author)
         except (DomainException, ApplicationError) as exc:
             return map_exception_to_error(exc)
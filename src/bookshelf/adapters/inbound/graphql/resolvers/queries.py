@@ -1,15 +1,18 @@
 import strawberry
 
-from bookshelf.adapters.inbound.graphql.context import AppInfo
+from bookshelf.adapters.inbound.graphql.context import AppInfo, GraphQLContext
 from bookshelf.adapters.inbound.graphql.middleware.error_handling import map_exception_to_error
+from bookshelf.adapters.inbound.graphql.middleware.tracing import traced
 from bookshelf.adapters.inbound.graphql.types.book import BookType
-from bookshelf.adapters.inbound.graphql.types.enums import SortOrder
+from bookshelf.adapters.inbound.graphql.types.enums import GenreEnum, SortOrder
+from bookshelf.adapters.inbound.graphql.types.errors import ErrorType
 from bookshelf.adapters.inbound.graphql.types.inputs import AuthorFilter, BookFilter
 from bookshelf.adapters.inbound.graphql.types.pagination import (
     AuthorConnection,
     AuthorEdge,
     BookConnection,
     BookEdge,
+    Page,
     paginate,
 )
 from bookshelf.adapters.inbound.graphql.types.responses import GetAuthorResult, GetBookResult
@@ -17,8 +20,11 @@ from bookshelf.application.exception import ApplicationError
 from bookshelf.application.read_models import AuthorReadModel, BookReadModel
 from bookshelf.domain.exception.exceptions import DomainException
 
+MAX_TOP_BOOKS = 100
 
-def _apply_book_filter(
+
+@traced("books.filter")
+def apply_book_filter(
     books: list[BookReadModel], f: BookFilter
 ) -> list[BookReadModel]:
     result = books
@@ -50,7 +56,8 @@ def _apply_book_filter(
     return result
 
 
-def _apply_author_filter(
+@traced("authors.filter")
+def apply_author_filter(
     authors: list[AuthorReadModel], f: AuthorFilter
 ) -> list[AuthorReadModel]:
     result = authors
@@ -60,16 +67,69 @@ def _apply_author_filter(
     return result
 
 
+async def fetch_book(context: GraphQLContext, book_id: str) -> BookReadModel | ErrorType:
+    try:
+        return await context.get_book_by_id_handler(book_id=book_id)
+    except (DomainException, ApplicationError) as exc:
+        return map_exception_to_error(exc)
+
+
+async def fetch_books_page(
+    context: GraphQLContext,
+    filter: BookFilter | None = None,
+    first: int | None = None,
+    after: str | None = None,
+    last: int | None = None,
+    before: str | None = None,
+    sort_order: SortOrder = SortOrder.ASC,
+) -> Page[BookReadModel]:
+    all_books = await context.get_all_books_handler()
+    if filter:
+        all_books = apply_book_filter(all_books, filter)
+    all_books.sort(key=lambda b: b.title, reverse=sort_order == SortOrder.DESC)
+    return Page(*paginate(all_books, first, after, last, before))
+
+
+async def fetch_top_books(
+    context: GraphQLContext, genre: GenreEnum | None = None, first: int = 10
+) -> list[BookReadModel]:
+    if not 0 <= first <= MAX_TOP_BOOKS:
+        msg = f"topBooks(first: {first}) must be between 0 and {MAX_TOP_BOOKS}."
+        raise ValueError(msg)
+    return await context.get_top_books_handler(
+        limit=first, genre_name=str(genre.value) if genre is not None else None
+    )
+
+
+async def fetch_author(context: GraphQLContext, author_id: str) -> AuthorReadModel | ErrorType:
+    try:
+        return await context.get_author_by_id_handler(author_id=author_id)
+    except (DomainException, ApplicationError) as exc:
+        return map_exception_to_error(exc)
+
+
+async def fetch_authors_page(
+    context: GraphQLContext,
+    filter: AuthorFilter | None = None,
+    first: int | None = None,
+    after: str | None = None,
+    last: int | None = None,
+    before: str | None = None,
+    sort_order: SortOrder = SortOrder.ASC,
+) -> Page[AuthorReadModel]:
+    all_authors = await context.get_all_authors_handler()
+    if filter:
+        all_authors = apply_author_filter(all_authors, filter)
+    all_authors.sort(key=lambda a: a.name.full_name, reverse=sort_order == SortOrder.DESC)
+    return Page(*paginate(all_authors, first, after, last, before))
+
+
 @strawberry.type(description="Root query type for the Bookshelf API.")
 class Query:
     @strawberry.field(description="Fetch a single book by its ID.")
     async def book(self, info: AppInfo, book_id: str) -> GetBookResult:
-        handler = info.context.get_book_by_id_handler
-        try:
-            book = await handler(book_id=book_id)
-            return BookType.from_read_model(book)
-        except (DomainException, ApplicationError) as exc:
-            return map_exception_to_error(exc)
+        book = await fetch_book(info.context, book_id)
+        return book if isinstance(book, ErrorType) else BookType.from_read_model(book)
 
     @strawberry.field(
         description="Fetch a paginated list of all books, sorted by title."
@@ -84,34 +144,40 @@ class Query:
         before: str | None = None,
         sort_order: SortOrder = SortOrder.ASC,
     ) -> BookConnection:
-        handler = info.context.get_all_books_handler
-        all_books = await handler()
-        if filter:
-            all_books = _apply_book_filter(all_books, filter)
-        reverse = sort_order == SortOrder.DESC
-        all_books.sort(key=lambda b: b.title, reverse=reverse)
-        book_types = [BookType.from_read_model(b) for b in all_books]
-        sliced, cursors, page_info, total_count = paginate(
-            book_types, first, after, last, before
+        page = await fetch_books_page(
+            info.context, filter, first, after, last, before, sort_order
         )
         edges = [
-            BookEdge(cursor=cursor, node=node)
-            for cursor, node in zip(cursors, sliced)
+            BookEdge(cursor=cursor, node=BookType.from_read_model(book))
+            for cursor, book in zip(page.cursors, page.items)
         ]
         return BookConnection(
-            edges=edges, page_info=page_info, total_count=total_count
+            edges=edges, page_info=page.page_info, total_count=page.total_count
         )
 
+    @strawberry.field(
+        description=(
+            "Fetch the highest-rated books, ranked by Bayesian average rating; "
+            f"`first` is at most {MAX_TOP_BOOKS}."
+        )
+    )
+    async def top_books(
+        self,
+        info: AppInfo,
+        genre: GenreEnum | None = None,
+        first: int = 10,
+    ) -> list[BookType]:
+        books = await fetch_top_books(info.context, genre, first)
+        return [BookType.from_read_model(b) for b in books]
+
     @strawberry.field(description="Fetch a single author by their ID.")
     async def author(self, info: AppInfo, author_id: str) -> GetAuthorResult:
-        handler = info.context.get_author_by_id_handler
-        try:
-            author = await handler(author_id=author_id)
-            from bookshelf.adapters.inbound.graphql.types.author import AuthorType
+        author = await fetch_author(info.context, author_id)
+        if isinstance(author, ErrorType):
+            return author
+        from bookshelf.adapters.inbound.graphql.types.author import AuthorType
 
-            return AuthorType.from_read_model(author)
-        except (DomainException, ApplicationError) as exc:
-            return map_exception_to_error(exc)
+        return AuthorType.from_read_model(author)
 
     @strawberry.field(
         description="Fetch a paginated list of all authors, sorted by name."
@@ -126,22 +192,15 @@ class Query:
         before: str | None = None,
         sort_order: SortOrder = SortOrder.ASC,
     ) -> AuthorConnection:
-        handler = info.context.get_all_authors_handler
-        all_authors = await handler()
-        if filter:
-            all_authors = _apply_author_filter(all_authors, filter)
-        reverse = sort_order == SortOrder.DESC
-        all_authors.sort(key=lambda a: a.name.full_name, reverse=reverse)
+        page = await fetch_authors_page(
+            info.context, filter, first, after, last, before, sort_order
+        )
         from bookshelf.adapters.inbound.graphql.types.author import AuthorType
 
-        author_types = [AuthorType.from_read_model(a) for a in all_authors]
-        sliced, cursors, page_info, total_count = paginate(
-            author_types, first, after, last, before
-        )
         edges = [
-            AuthorEdge(cursor=cursor, node=node)
-            for cursor, node in zip(cursors, sliced)
+            AuthorEdge(cursor=cursor, node=AuthorType.from_read_model(author))
+            for cursor, author in zip(page.cursors, page.items)
         ]
         return AuthorConnection(
-            edges=edges, page_info=page_info, total_count=total_count
+            edges=edges, page_info=page.page_info, total_count=page.total_count
         )
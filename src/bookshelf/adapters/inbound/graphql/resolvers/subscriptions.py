@@ -0,0 +1,34 @@
+from collections.abc import AsyncGenerator
+
+import strawberry
+
+from bookshelf.adapters.inbound.graphql.context import AppInfo
+from bookshelf.adapters.inbound.graphql.types.catalog_change import CatalogChangeType
+
+
+@strawberry.type(description="Root subscription type for the Bookshelf API.")
+class Subscription:
+    @strawberry.subscription(
+        description=(
+            "Stream catalog changes. Filters on different arguments must all match; "
+            "omit an argument to accept any value."
+        )
+    )
+    async def catalog_changes(
+        self,
+        info: AppInfo,
+        book_ids: list[strawberry.ID] | None = None,
+        author_ids: list[strawberry.ID] | None = None,
+        event_types: list[str] | None = None,
+    ) -> AsyncGenerator[CatalogChangeType, None]:
+        broadcaster = info.context.event_broadcaster
+        if broadcaster is None:
+            msg = "Subscriptions are not available"
+            raise ValueError(msg)
+        with broadcaster.subscribe(
+            book_ids=book_ids or (),
+            author_ids=author_ids or (),
+            event_types=event_types or (),
+        ) as subscription:
+            async for event in subscription:
+                yield CatalogChangeType.from_event(event)
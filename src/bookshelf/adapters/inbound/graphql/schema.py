@@ -1,14 +1,54 @@
+from functools import cache
+from typing import Any
+
 import strawberry
 
+from bookshelf.adapters.inbound.graphql.middleware.execution_plans import (
+    ExecutionPlanExtension,
+)
 from bookshelf.adapters.inbound.graphql.middleware.extensions import (
     LoggingExtension,
     query_depth_limiter,
 )
+from bookshelf.adapters.inbound.graphql.middleware.identity_map import IdentityMapExtension
+from bookshelf.adapters.inbound.graphql.middleware.persisted_queries import (
+    PersistedQueryExtension,
+)
+from bookshelf.adapters.inbound.graphql.middleware.query_cost import QueryCostLimiter
+from bookshelf.adapters.inbound.graphql.middleware.response_cache import (
+    ResponseCacheExtension,
+)
+from bookshelf.adapters.inbound.graphql.middleware.tracing import TracingExtension
+from bookshelf.adapters.inbound.graphql.middleware.traffic_capture import (
+    TrafficCaptureExtension,
+)
 from bookshelf.adapters.inbound.graphql.resolvers.mutations import Mutation
 from bookshelf.adapters.inbound.graphql.resolvers.queries import Query
+from bookshelf.adapters.inbound.graphql.resolvers.subscriptions import Subscription
 
-schema = strawberry.Schema(
-    query=Query,
-    mutation=Mutation,
-    extensions=[LoggingExtension, query_depth_limiter(max_depth=10)],
-)
+
+@cache
+def get_schema() -> strawberry.Schema:
+    """The application schema, built on first use and shared for the life of the process."""
+    return strawberry.Schema(
+        query=Query,
+        mutation=Mutation,
+        subscription=Subscription,
+        extensions=[
+            PersistedQueryExtension(max_documents=1000),
+            TrafficCaptureExtension,
+            TracingExtension,
+            LoggingExtension,
+            query_depth_limiter(max_depth=10),
+            QueryCostLimiter(max_cost=5000),
+            ResponseCacheExtension,
+            IdentityMapExtension,
+            ExecutionPlanExtension,
+        ],
+    )
+
+
+def __getattr__(name: str) -> Any:
+    if name == "schema":
+        return get_schema()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,29 @@
+from typing import Self
+
+import strawberry
+from strawberry.scalars import JSON
+
+from bookshelf.adapters.outbound.event_codec import encode_event
+from bookshelf.domain.event.domain_event import DomainEvent
+
+
+@strawberry.type(description="A change to the catalog, delivered to subscribers.")
+class CatalogChangeType:
+    event_type: str = strawberry.field(description="Name of the domain event, e.g. BookTitleChanged.")
+    book_id: strawberry.ID | None = strawberry.field(description="The book that changed, if any.")
+    author_id: strawberry.ID | None = strawberry.field(
+        description="The author that changed or owns the changed book, if the event carries it."
+    )
+    data: JSON = strawberry.field(description="The event's fields.")
+
+    @classmethod
+    def from_event(cls, event: DomainEvent) -> Self:
+        payload = encode_event(event)
+        book_id = getattr(event, "book_id", None)
+        author_id = getattr(event, "author_id", None)
+        return cls(
+            event_type=payload["type"],
+            book_id=strawberry.ID(str(book_id)) if book_id is not None else None,
+            author_id=strawberry.ID(str(author_id)) if author_id is not None else None,
+            data=payload["data"],
+        )
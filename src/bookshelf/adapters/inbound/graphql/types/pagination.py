@@ -1,4 +1,5 @@
 import base64
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Annotated
 
 import strawberry
@@ -69,6 +70,16 @@ class AuthorConnection:
     )
 
 
+@dataclass(frozen=True, slots=True)
+class Page[T]:
+    """One page of a sorted collection, before it is wrapped in connection types."""
+
+    items: list[T]
+    cursors: list[str]
+    page_info: PageInfo
+    total_count: int
+
+
 def paginate(
     items: list,
     first: int | None = None,
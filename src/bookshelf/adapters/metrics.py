@@ -0,0 +1,118 @@
+from collections.abc import Callable
+from typing import ClassVar
+
+_QUANTILES = (0.5, 0.9, 0.95, 0.99, 0.999)
+
+
+class HdrHistogram:
+    """Log-linear histogram of non-negative integers with bounded relative error.
+
+    Values below 2**SUB_BUCKET_BITS are counted exactly; above that each
+    power of two is split into 2**(SUB_BUCKET_BITS - 1) linear sub-buckets,
+    so any recorded value is reproduced within ~3%. Recording is O(1) and
+    memory grows only with the dynamic range seen.
+    """
+
+    SUB_BUCKET_BITS: ClassVar[int] = 6
+
+    def __init__(self) -> None:
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        value = max(value, 0)
+        index = self._index(value)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def value_at_quantile(self, quantile: float) -> int:
+        if self.count == 0:
+            return 0
+        rank = max(1, round(quantile * self.count))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return min(self._upper_bound(index), self.max)
+        return self.max
+
+    @classmethod
+    def _index(cls, value: int) -> int:
+        shift = value.bit_length() - cls.SUB_BUCKET_BITS
+        if shift <= 0:
+            return value
+        return (shift << (cls.SUB_BUCKET_BITS - 1)) + (value >> shift)
+
+    @classmethod
+    def _upper_bound(cls, index: int) -> int:
+        half = 1 << (cls.SUB_BUCKET_BITS - 1)
+        if index < 2 * half:
+            return index
+        shift = (index >> (cls.SUB_BUCKET_BITS - 1)) - 1
+        sub = index - (shift << (cls.SUB_BUCKET_BITS - 1))
+        return ((sub + 1) << shift) - 1
+
+
+class _Family:
+    def __init__(self, help: str, scale: float) -> None:
+        self.help = help
+        self.scale = scale
+        self.series: dict[tuple[tuple[str, str], ...], HdrHistogram] = {}
+
+
+class MetricsRegistry:
+    """In-process metrics rendered in the Prometheus text exposition format."""
+
+    def __init__(self) -> None:
+        self._families: dict[str, _Family] = {}
+        self._scalars: dict[str, tuple[str, str, Callable[[], float]]] = {}
+
+    def histogram(self, name: str, help: str, scale: float = 1.0, **labels: str) -> HdrHistogram:
+        """Return the histogram for `labels`; recorded values are divided by `scale` on export."""
+        family = self._families.get(name)
+        if family is None:
+            family = self._families[name] = _Family(help, scale)
+        key = tuple(sorted(labels.items()))
+        histogram = family.series.get(key)
+        if histogram is None:
+            histogram = family.series[key] = HdrHistogram()
+        return histogram
+
+    def gauge(self, name: str, help: str, read: Callable[[], float]) -> None:
+        self._scalars[name] = ("gauge", help, read)
+
+    def counter(self, name: str, help: str, read: Callable[[], float]) -> None:
+        self._scalars[name] = ("counter", help, read)
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for name, family in sorted(self._families.items()):
+            lines.append(f"# HELP {name} {family.help}")
+            lines.append(f"# TYPE {name} summary")
+            for labels, histogram in sorted(family.series.items()):
+                for quantile in _QUANTILES:
+                    value = histogram.value_at_quantile(quantile) / family.scale
+                    label_text = _labels((*labels, ("quantile", str(quantile))))
+                    lines.append(f"{name}{label_text} {value:.9g}")
+                lines.append(f"{name}_sum{_labels(labels)} {histogram.total / family.scale:.9g}")
+                lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+        for name, (kind, help, read) in sorted(self._scalars.items()):
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"{name} {read():.9g}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
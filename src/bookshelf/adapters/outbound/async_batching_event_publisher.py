@@ -0,0 +1,189 @@
+import asyncio
+import json
+import logging
+from collections.abc import Sequence
+from enum import StrEnum
+from pathlib import Path
+
+from bookshelf.adapters.metrics import MetricsRegistry
+from bookshelf.adapters.outbound.event_codec import decode_event, encode_event
+from bookshelf.domain.event.domain_event import DomainEvent
+from bookshelf.domain.port.event_publisher import EventPublisher
+
+logger = logging.getLogger("bookshelf.events")
+
+
+class OverflowPolicy(StrEnum):
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    SPILL = "spill"
+
+
+class AsyncBatchingEventPublisher(EventPublisher):
+    """Queues events and delivers them to sinks in batches from background workers.
+
+    `publish` returns as soon as the events are queued. When the bounded
+    queue is full the overflow policy applies: BLOCK waits for room
+    (backpressure), DROP_OLDEST discards the oldest queued event, and SPILL
+    appends to a JSON-lines file that is fed back, in order, as the queue
+    drains. Until `start` is called events are delivered inline.
+    """
+
+    def __init__(
+        self,
+        sinks: Sequence[EventPublisher],
+        *,
+        max_queue_size: int = 10_000,
+        batch_size: int = 256,
+        workers: int = 1,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        spill_path: Path | None = None,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        if overflow is OverflowPolicy.SPILL and spill_path is None:
+            raise ValueError("The spill overflow policy requires a spill_path")
+        self._sinks = tuple(sinks)
+        self._queue: asyncio.Queue[DomainEvent] = asyncio.Queue(maxsize=max_queue_size)
+        self._batch_size = batch_size
+        self._worker_count = workers
+        self._overflow = overflow
+        self._spill_path = spill_path
+        self._spill_offset = 0
+        self._spilled = 0
+        self._workers: list[asyncio.Task[None]] = []
+        self.delivered = 0
+        self.dropped = 0
+        self.failed = 0
+        if metrics is not None:
+            self._register_metrics(metrics)
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() + self._spilled
+
+    async def publish(self, events: list[DomainEvent]) -> None:
+        if not events:
+            return
+        if not self._workers:
+            await self._deliver(events)
+            return
+        for index, event in enumerate(events):
+            if not await self._enqueue(event):
+                # Keep ordering: once anything is on disk, newer events follow it there.
+                self._spill(events[index:])
+                return
+
+    async def start(self) -> None:
+        if self._workers:
+            return
+        if self._spill_path is not None and self._spill_path.exists():
+            with self._spill_path.open("rb") as spill:
+                self._spilled = sum(1 for _ in spill)
+            self._refill_from_spill()
+        self._workers = [
+            asyncio.create_task(self._run(), name=f"event-publisher-{i}")
+            for i in range(self._worker_count)
+        ]
+
+    async def stop(self) -> None:
+        """Deliver everything still queued or spilled, then stop the workers."""
+        if not self._workers:
+            return
+        while not self._queue.empty() or self._spilled:
+            self._refill_from_spill()
+            await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _enqueue(self, event: DomainEvent) -> bool:
+        """Queue `event`, returning False when it belongs in the spill file instead."""
+        if self._spilled:
+            return False
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        match self._overflow:
+            case OverflowPolicy.BLOCK:
+                await self._queue.put(event)
+            case OverflowPolicy.DROP_OLDEST:
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self.dropped += 1
+                self._queue.put_nowait(event)
+            case OverflowPolicy.SPILL:
+                return False
+        return True
+
+    def _spill(self, events: Sequence[DomainEvent]) -> None:
+        assert self._spill_path is not None
+        with self._spill_path.open("a", encoding="utf-8") as spill:
+            spill.writelines(json.dumps(encode_event(event)) + "\n" for event in events)
+        self._spilled += len(events)
+
+    def _refill_from_spill(self) -> None:
+        if not self._spilled or self._spill_path is None:
+            return
+        room = self._queue.maxsize - self._queue.qsize()
+        if room <= 0:
+            return
+        with self._spill_path.open("r", encoding="utf-8") as spill:
+            spill.seek(self._spill_offset)
+            for _ in range(min(room, self._spilled)):
+                line = spill.readline()
+                if not line:
+                    break
+                self._queue.put_nowait(decode_event(json.loads(line)))
+                self._spilled -= 1
+            self._spill_offset = spill.tell()
+        if not self._spilled:
+            self._spill_path.unlink(missing_ok=True)
+            self._spill_offset = 0
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self._batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._deliver(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            self._refill_from_spill()
+
+    async def _deliver(self, batch: list[DomainEvent]) -> None:
+        for sink in self._sinks:
+            try:
+                await sink.publish(batch)
+            except Exception:
+                self.failed += len(batch)
+                logger.exception("Event sink %s failed for %d event(s)", sink, len(batch))
+            else:
+                self.delivered += len(batch)
+
+    def _register_metrics(self, metrics: MetricsRegistry) -> None:
+        metrics.gauge(
+            "bookshelf_event_queue_depth",
+            "Events waiting for delivery, including spilled ones.",
+            lambda: self.queue_depth,
+        )
+        metrics.counter(
+            "bookshelf_events_delivered_total",
+            "Events a sink accepted, counted once per sink.",
+            lambda: self.delivered,
+        )
+        metrics.counter(
+            "bookshelf_events_dropped_total",
+            "Events discarded by the drop-oldest overflow policy.",
+            lambda: self.dropped,
+        )
+        metrics.counter(
+            "bookshelf_events_failed_total",
+            "Events a sink raised on, counted once per sink.",
+            lambda: self.failed,
+        )
@@ -0,0 +1,39 @@
+from bookshelf.domain.event.domain_event import DomainEvent
+from bookshelf.domain.event.events import (
+    BookCreated,
+    BookDeleted,
+    GenreAdded,
+    GenreRemoved,
+    ReviewAdded,
+    ReviewRemoved,
+)
+from bookshelf.domain.model.identifiers import BookId
+from bookshelf.domain.port.book_ranking import BookRanking
+from bookshelf.domain.port.book_repository import BookRepository
+from bookshelf.domain.port.event_publisher import EventPublisher
+
+_RANKING_EVENTS = (BookCreated, GenreAdded, GenreRemoved, ReviewAdded, ReviewRemoved)
+
+
+class BookRankingProjector(EventPublisher):
+    """Keeps a BookRanking in step with the events that change a book's rank."""
+
+    def __init__(self, book_repository: BookRepository, book_ranking: BookRanking) -> None:
+        self._book_repository = book_repository
+        self._book_ranking = book_ranking
+
+    async def publish(self, events: list[DomainEvent]) -> None:
+        # A batch often carries several events for one book; re-rank it once.
+        affected: dict[BookId, bool] = {}
+        for event in events:
+            if isinstance(event, BookDeleted):
+                affected[event.book_id] = False
+            elif isinstance(event, _RANKING_EVENTS):
+                affected.setdefault(event.book_id, True)
+
+        for book_id, exists in affected.items():
+            book = await self._book_repository.find_by_id(book_id) if exists else None
+            if book is None:
+                await self._book_ranking.remove(book_id)
+            else:
+                await self._book_ranking.update(book)
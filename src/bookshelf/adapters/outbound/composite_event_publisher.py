@@ -0,0 +1,17 @@
+from collections.abc import Sequence
+
+from bookshelf.domain.event.domain_event import DomainEvent
+from bookshelf.domain.port.event_publisher import EventPublisher
+
+
+class CompositeEventPublisher(EventPublisher):
+    """Fans each batch of events out to several publishers, in order."""
+
+    def __init__(self, publishers: Sequence[EventPublisher]) -> None:
+        self._publishers = tuple(publishers)
+
+    async def publish(self, events: list[DomainEvent]) -> None:
+        if not events:
+            return
+        for publisher in self._publishers:
+            await publisher.publish(events)
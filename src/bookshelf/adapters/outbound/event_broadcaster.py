@@ -0,0 +1,168 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+
+from bookshelf.adapters.metrics import MetricsRegistry
+from bookshelf.domain.event.domain_event import DomainEvent
+from bookshelf.domain.port.event_publisher import EventPublisher
+
+type _Topic = tuple[str, str]
+
+
+def _event_topics(event: DomainEvent) -> list[_Topic]:
+    topics: list[_Topic] = [("type", event.event_name)]
+    book_id = getattr(event, "book_id", None)
+    if book_id is not None:
+        topics.append(("book", str(book_id)))
+    author_id = getattr(event, "author_id", None)
+    if author_id is not None:
+        topics.append(("author", str(author_id)))
+    return topics
+
+
+class EventSubscription:
+    """A subscriber's filter and bounded mailbox; iterate it to receive matching events.
+
+    Filters on different dimensions must all match, while any value within a
+    dimension matches. When the mailbox is full the oldest event is dropped,
+    so a slow client never holds up the publisher.
+    """
+
+    def __init__(
+        self,
+        broadcaster: "EventBroadcaster",
+        book_ids: frozenset[str],
+        author_ids: frozenset[str],
+        event_types: frozenset[str],
+        max_queue_size: int,
+    ) -> None:
+        self._broadcaster = broadcaster
+        self.book_ids = book_ids
+        self.author_ids = author_ids
+        self.event_types = event_types
+        self._mailbox: deque[DomainEvent] = deque(maxlen=max_queue_size)
+        self._ready = asyncio.Event()
+        self._closed = False
+        self.dropped = 0
+
+    @property
+    def routing_topics(self) -> list[_Topic]:
+        """Index keys for the most selective filter, or none for a catch-all subscriber."""
+        if self.book_ids:
+            return [("book", book_id) for book_id in self.book_ids]
+        if self.author_ids:
+            return [("author", author_id) for author_id in self.author_ids]
+        return [("type", event_type) for event_type in self.event_types]
+
+    def matches(self, event: DomainEvent) -> bool:
+        if self.event_types and event.event_name not in self.event_types:
+            return False
+        if self.book_ids and str(getattr(event, "book_id", "")) not in self.book_ids:
+            return False
+        if self.author_ids and str(getattr(event, "author_id", "")) not in self.author_ids:
+            return False
+        return True
+
+    def offer(self, event: DomainEvent) -> None:
+        if len(self._mailbox) == self._mailbox.maxlen:
+            self.dropped += 1
+            self._broadcaster.dropped += 1
+        self._mailbox.append(event)
+        self._ready.set()
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._broadcaster._unsubscribe(self)
+            self._ready.set()
+
+    def __enter__(self) -> "EventSubscription":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    async def __aiter__(self) -> AsyncIterator[DomainEvent]:
+        while not self._closed:
+            while self._mailbox:
+                yield self._mailbox.popleft()
+            self._ready.clear()
+            await self._ready.wait()
+
+
+class EventBroadcaster(EventPublisher):
+    """Fans published events out to subscribers through a topic index.
+
+    Each subscription is indexed under its most selective filter, so
+    publishing touches only subscribers whose topics the event carries;
+    idle or unrelated subscribers cost nothing per event.
+    """
+
+    def __init__(self, max_queue_size: int = 100, metrics: MetricsRegistry | None = None) -> None:
+        self.max_queue_size = max_queue_size
+        self._by_topic: dict[_Topic, set[EventSubscription]] = {}
+        self._catch_all: set[EventSubscription] = set()
+        self._count = 0
+        self.dropped = 0
+        if metrics is not None:
+            self._register_metrics(metrics)
+
+    @property
+    def subscriber_count(self) -> int:
+        return self._count
+
+    def subscribe(
+        self,
+        book_ids: Iterable[str] = (),
+        author_ids: Iterable[str] = (),
+        event_types: Iterable[str] = (),
+    ) -> EventSubscription:
+        subscription = EventSubscription(
+            self,
+            frozenset(book_ids),
+            frozenset(author_ids),
+            frozenset(event_types),
+            self.max_queue_size,
+        )
+        topics = subscription.routing_topics
+        if not topics:
+            self._catch_all.add(subscription)
+        for topic in topics:
+            self._by_topic.setdefault(topic, set()).add(subscription)
+        self._count += 1
+        return subscription
+
+    async def publish(self, events: list[DomainEvent]) -> None:
+        if not self._count:
+            return
+        for event in events:
+            candidates = set(self._catch_all)
+            for topic in _event_topics(event):
+                candidates.update(self._by_topic.get(topic, ()))
+            for subscription in candidates:
+                if subscription.matches(event):
+                    subscription.offer(event)
+
+    def _unsubscribe(self, subscription: EventSubscription) -> None:
+        topics = subscription.routing_topics
+        if not topics:
+            self._catch_all.discard(subscription)
+        for topic in topics:
+            subscribers = self._by_topic.get(topic)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._by_topic[topic]
+        self._count -= 1
+
+    def _register_metrics(self, metrics: MetricsRegistry) -> None:
+        metrics.gauge(
+            "bookshelf_subscriptions",
+            "Active catalog change subscriptions.",
+            lambda: self.subscriber_count,
+        )
+        metrics.counter(
+            "bookshelf_subscription_events_dropped_total",
+            "Events dropped because a subscriber's queue was full.",
+            lambda: self.dropped,
+        )
@@ -0,0 +1,50 @@
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from functools import cache
+from typing import Any, get_type_hints
+
+import bookshelf.domain.event.events  # noqa: F401  (registers the event classes)
+from bookshelf.domain.event.domain_event import DomainEvent
+
+
+@cache
+def _event_types() -> dict[str, type[DomainEvent]]:
+    return {cls.__name__: cls for cls in DomainEvent.__subclasses__()}
+
+
+@cache
+def _field_types(cls: type[DomainEvent]) -> dict[str, Any]:
+    return get_type_hints(cls)
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if is_dataclass(value):
+        names = [f.name for f in fields(value)]
+        if names == ["value"]:
+            return _encode_value(value.value)  # type: ignore[attr-defined]
+        return {name: _encode_value(getattr(value, name)) for name in names}
+    return value
+
+
+def _decode_value(field_type: Any, raw: Any) -> Any:
+    if isinstance(field_type, type) and is_dataclass(field_type) and isinstance(raw, dict):
+        return field_type(**raw)
+    if isinstance(field_type, type) and (is_dataclass(field_type) or issubclass(field_type, Enum)):
+        return field_type(raw)
+    return raw
+
+
+def encode_event(event: DomainEvent) -> dict[str, Any]:
+    """Encode an event as JSON-compatible primitives."""
+    return {
+        "type": event.event_name,
+        "data": {f.name: _encode_value(getattr(event, f.name)) for f in fields(event)},
+    }
+
+
+def decode_event(payload: dict[str, Any]) -> DomainEvent:
+    cls = _event_types()[payload["type"]]
+    types = _field_types(cls)
+    return cls(**{name: _decode_value(types[name], raw) for name, raw in payload["data"].items()})
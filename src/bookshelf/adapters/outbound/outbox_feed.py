@@ -0,0 +1,103 @@
+import asyncio
+import logging
+import os
+import secrets
+import time
+from collections.abc import Awaitable, Callable
+
+from bookshelf.adapters.outbound.outbox_relay import OutboxRelay
+from bookshelf.adapters.outbound.persistence.sqlite_database import (
+    FEED_CHECKPOINT_PREFIX,
+    SqliteDatabase,
+)
+from bookshelf.domain.port.event_publisher import EventPublisher
+
+logger = logging.getLogger("bookshelf.events")
+
+
+class OutboxFeed(OutboxRelay):
+    """Delivers every event appended to the outbox, by any process, to this process.
+
+    The projections it feeds are rebuilt at startup, so the feed starts at
+    the newest event and its checkpoint does not outlive the process: it is
+    held under a lease the feed renews while running and deletes on stop.
+    It is saved on each renewal rather than after every batch, so following
+    the outbox adds no write per commit.
+
+    A feed whose lease lapsed finds its checkpoint pruned and events gone;
+    it starts again from the newest event and awaits `on_gap` to resync.
+    """
+
+    def __init__(
+        self,
+        database: SqliteDatabase,
+        publisher: EventPublisher,
+        *,
+        on_gap: Callable[[], Awaitable[None]],
+        poll_interval: float = 0.1,
+        lease_ttl: float = 30.0,
+    ) -> None:
+        super().__init__(
+            database,
+            publisher,
+            name=f"{FEED_CHECKPOINT_PREFIX}{os.getpid()}-{secrets.token_hex(4)}",
+            poll_interval=poll_interval,
+            lease_ttl=lease_ttl,
+        )
+        self._on_gap = on_gap
+
+    async def start(self) -> None:
+        await self._register()
+        await super().start()
+
+    async def stop(self) -> None:
+        """Stop following the outbox and give up the checkpoint."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        await self._database.run(self._unregister)
+
+    async def _register(self) -> None:
+        self._position = await self._database.run(self._checkpoint_head)
+        self._lease_renew_at = time.monotonic() + self._lease_ttl / 3
+
+    async def _ready(self) -> bool:
+        if time.monotonic() < self._lease_renew_at:
+            return True
+        if not await self._database.run(self._renew, self._position):
+            logger.warning("Outbox feed %s fell behind pruning; resyncing", self._name)
+            await self._register()
+            await self._on_gap()
+            return True
+        self._lease_renew_at = time.monotonic() + self._lease_ttl / 3
+        return True
+
+    # The methods below run on the database thread.
+
+    def _checkpoint_head(self) -> int:
+        self._database.acquire_lease(self._name, self._holder, self._lease_ttl)
+        position = self._database.outbox_head()
+        self._database.save_checkpoint(self._name, position)
+        return position
+
+    def _renew(self, position: int) -> bool:
+        """Renew the lease and save `position`; False if the checkpoint was pruned meanwhile."""
+        if not self._database.has_checkpoint(self._name):
+            return False
+        self._database.acquire_lease(self._name, self._holder, self._lease_ttl)
+        self._database.save_checkpoint(self._name, position)
+        return True
+
+    def _unregister(self) -> None:
+        self._database.delete_checkpoint(self._name)
+        self._database.release_lease(self._name, self._holder)
+
+    def _open_checkpoint(self) -> int:
+        # Registered at the head of the outbox, under a lease, when started.
+        return 0
+
+    async def _save_checkpoint(self) -> None:
+        # Saved on renewal instead; a checkpoint that lags only delays pruning.
+        pass
@@ -0,0 +1,170 @@
+import asyncio
+import logging
+import os
+import secrets
+import time
+
+from bookshelf.adapters.metrics import MetricsRegistry
+from bookshelf.adapters.outbound.persistence.sqlite_database import SqliteDatabase
+from bookshelf.domain.port.event_publisher import EventPublisher
+
+logger = logging.getLogger("bookshelf.events")
+
+
+class OutboxRelay:
+    """Ships events from the SQLite outbox to a publisher in order, at least once.
+
+    The position of the last delivered event is checkpointed after each
+    batch, so after a crash or restart delivery resumes from there; a batch
+    whose publish raised is retried. The relay wakes up when a transaction
+    appends to the outbox and otherwise polls every `poll_interval` seconds.
+
+    When several processes share the database, an `exclusive` relay only
+    delivers while it holds the relay's lease; the others stand by and take
+    over, from the checkpoint, once the holder stops renewing it.
+    """
+
+    def __init__(
+        self,
+        database: SqliteDatabase,
+        publisher: EventPublisher,
+        *,
+        name: str = "default",
+        batch_size: int = 256,
+        poll_interval: float = 1.0,
+        exclusive: bool = False,
+        lease_ttl: float = 15.0,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self._database = database
+        self._publisher = publisher
+        self._name = name
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._position = self._open_checkpoint()
+        self._exclusive = exclusive
+        self._lease_ttl = lease_ttl
+        self._holder = f"{os.getpid()}-{secrets.token_hex(4)}"
+        self._leading = not exclusive
+        self._lease_renew_at = 0.0
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        # Refreshed by the delivery loop so the metrics scrape does no I/O.
+        self._backlog = 0
+        self._measure_backlog = metrics is not None
+        self.relayed = 0
+        self.failed_batches = 0
+        database.on_outbox_append(self._wakeup.set)
+        if metrics is not None:
+            self._register_metrics(metrics)
+
+    @property
+    def position(self) -> int:
+        return self._position
+
+    @property
+    def leading(self) -> bool:
+        """Whether this relay currently delivers; always true unless `exclusive`."""
+        return self._leading
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=f"outbox-relay-{self._name}")
+
+    async def stop(self) -> None:
+        """Stop polling and deliver whatever is left in the outbox."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        # The task may have been cancelled before it ever took the lease.
+        if not await self._ready():
+            return
+        while await self.relay_once():
+            pass
+        # A save queued by the cancelled task may never have run.
+        await self._save_checkpoint()
+        if self._exclusive:
+            await self._database.run(self._database.release_lease, self._lease_name, self._holder)
+            self._leading = False
+
+    async def relay_once(self) -> int:
+        """Deliver the next batch and advance the checkpoint; return how many events it held."""
+        batch = await self._database.run(
+            self._database.read_outbox, self._position, self._batch_size
+        )
+        if not batch:
+            return 0
+        await self._publisher.publish([event for _, event in batch])
+        self._position = batch[-1][0]
+        await self._save_checkpoint()
+        self.relayed += len(batch)
+        return len(batch)
+
+    def _open_checkpoint(self) -> int:
+        return self._database.open_checkpoint(self._name)
+
+    async def _save_checkpoint(self) -> None:
+        await self._database.run(self._database.save_checkpoint, self._name, self._position)
+
+    @property
+    def _lease_name(self) -> str:
+        return f"relay:{self._name}"
+
+    async def _ready(self) -> bool:
+        """Whether to deliver now; an exclusive relay takes or renews its lease here."""
+        if not self._exclusive:
+            return True
+        now = time.monotonic()
+        if now < self._lease_renew_at:
+            return self._leading
+        leading = await self._database.run(
+            self._database.acquire_lease, self._lease_name, self._holder, self._lease_ttl
+        )
+        if leading and not self._leading:
+            # The previous holder delivered up to its last checkpoint.
+            self._position = await self._database.run(self._database.load_checkpoint, self._name)
+            logger.info("Outbox relay %s now delivers from %d", self._name, self._position)
+        self._leading = leading
+        self._lease_renew_at = now + self._lease_ttl / 3
+        return leading
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                relayed = await self.relay_once() if await self._ready() else 0
+                if self._measure_backlog:
+                    self._backlog = await self._database.run(self._read_backlog)
+            except Exception:
+                self.failed_batches += 1
+                logger.exception("Outbox relay %s failed; retrying", self._name)
+                relayed = 0
+            if relayed < self._batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self._poll_interval)
+                except TimeoutError:
+                    pass
+
+    def _read_backlog(self) -> int:
+        # A standby relay's position is stale; the holder's checkpoint is not.
+        position = self._position if self._leading else self._database.load_checkpoint(self._name)
+        return self._database.outbox_backlog(position)
+
+    def _register_metrics(self, metrics: MetricsRegistry) -> None:
+        metrics.gauge(
+            "bookshelf_outbox_backlog",
+            "Events in the outbox not yet delivered by the relay.",
+            lambda: self._backlog,
+        )
+        metrics.counter(
+            "bookshelf_outbox_relayed_total",
+            "Events delivered from the outbox.",
+            lambda: self.relayed,
+        )
+        metrics.counter(
+            "bookshelf_outbox_failed_batches_total",
+            "Outbox batches whose delivery raised and will be retried.",
+            lambda: self.failed_batches,
+        )
@@ -1,8 +1,25 @@
 from bookshelf.adapters.outbound.persistence.in_memory_author_repository import (
     InMemoryAuthorRepository,
 )
+from bookshelf.adapters.outbound.persistence.in_memory_book_ranking import (
+    InMemoryBookRanking,
+)
 from bookshelf.adapters.outbound.persistence.in_memory_book_repository import (
     InMemoryBookRepository,
 )
+from bookshelf.adapters.outbound.persistence.sqlite_author_repository import (
+    SqliteAuthorRepository,
+)
+from bookshelf.adapters.outbound.persistence.sqlite_book_repository import (
+    SqliteBookRepository,
+)
+from bookshelf.adapters.outbound.persistence.sqlite_database import SqliteDatabase
 
-__all__ = ["InMemoryAuthorRepository", "InMemoryBookRepository"]
+__all__ = [
+    "InMemoryAuthorRepository",
+    "InMemoryBookRanking",
+    "InMemoryBookRepository",
+    "SqliteAuthorRepository",
+    "SqliteBookRepository",
+    "SqliteDatabase",
+]
@@ -0,0 +1,129 @@
+"""Repository decorators that consult the identity map of the request being served.
+
+Outside a request (the CLI, the outbox relay and feed) every call goes
+straight through. Bulk and streaming reads are not mapped, so listing or
+exporting the catalog costs no more memory than before.
+"""
+
+from collections.abc import AsyncIterator
+
+from bookshelf.application.identity_map import current_identity_map
+from bookshelf.domain.model.author import Author
+from bookshelf.domain.model.book import Book
+from bookshelf.domain.model.identifiers import AuthorId, BookId
+from bookshelf.domain.model.value_objects import ISBN, AuthorName
+from bookshelf.domain.port.author_repository import AuthorRepository
+from bookshelf.domain.port.book_repository import BookRepository
+
+
+class IdentityMapBookRepository(BookRepository):
+    def __init__(self, inner: BookRepository) -> None:
+        self._inner = inner
+
+    async def save(self, book: Book) -> None:
+        await self._inner.save(book)
+        if (identity_map := current_identity_map.get()) is not None:
+            identity_map.saved(book)
+
+    async def save_all(self, books: list[Book]) -> None:
+        await self._inner.save_all(books)
+        if (identity_map := current_identity_map.get()) is not None:
+            for book in books:
+                identity_map.saved(book)
+
+    async def find_by_id(self, id: BookId) -> Book | None:
+        identity_map = current_identity_map.get()
+        if identity_map is None:
+            return await self._inner.find_by_id(id)
+        known, book = identity_map.get(id)
+        if known:
+            return book
+        return identity_map.add(id, await self._inner.find_by_id(id))
+
+    async def find_by_author(self, author_id: AuthorId) -> list[Book]:
+        books = await self._inner.find_by_author(author_id)
+        if (identity_map := current_identity_map.get()) is not None:
+            return identity_map.add_all(books)
+        return books
+
+    async def has_books_by_author(self, author_id: AuthorId) -> bool:
+        return await self._inner.has_books_by_author(author_id)
+
+    async def find_all(self) -> list[Book]:
+        return await self._inner.find_all()
+
+    def iter_all(self, chunk_size: int = 500) -> AsyncIterator[list[Book]]:
+        return self._inner.iter_all(chunk_size)
+
+    async def delete(self, book: Book) -> None:
+        await self._inner.delete(book)
+        if (identity_map := current_identity_map.get()) is not None:
+            identity_map.deleted(book.id)
+
+    async def isbn_exists(self, isbn: ISBN, exclude_book_id: BookId | None = None) -> bool:
+        return await self._inner.isbn_exists(isbn, exclude_book_id)
+
+    async def existing_isbns(self, isbns: list[ISBN]) -> set[ISBN]:
+        return await self._inner.existing_isbns(isbns)
+
+
+class IdentityMapAuthorRepository(AuthorRepository):
+    def __init__(self, inner: AuthorRepository) -> None:
+        self._inner = inner
+
+    async def save(self, author: Author) -> None:
+        await self._inner.save(author)
+        if (identity_map := current_identity_map.get()) is not None:
+            identity_map.saved(author)
+
+    async def save_all(self, authors: list[Author]) -> None:
+        await self._inner.save_all(authors)
+        if (identity_map := current_identity_map.get()) is not None:
+            for author in authors:
+                identity_map.saved(author)
+
+    async def author_name_exists(
+        self, name: AuthorName, exclude_author_id: AuthorId | None = None
+    ) -> bool:
+        return await self._inner.author_name_exists(name, exclude_author_id)
+
+    async def existing_names(self, names: list[AuthorName]) -> set[AuthorName]:
+        return await self._inner.existing_names(names)
+
+    async def find_by_id(self, id: AuthorId) -> Author | None:
+        identity_map = current_identity_map.get()
+        if identity_map is None:
+            return await self._inner.find_by_id(id)
+        known, author = identity_map.get(id)
+        if known:
+            return author
+        return identity_map.add(id, await self._inner.find_by_id(id))
+
+    async def find_by_ids(self, ids: list[AuthorId]) -> list[Author | None]:
+        identity_map = current_identity_map.get()
+        if identity_map is None:
+            return await self._inner.find_by_ids(ids)
+        found: dict[AuthorId, Author | None] = {}
+        for author_id in ids:
+            known, author = identity_map.get(author_id)
+            if known:
+                found[author_id] = author
+        missing = [author_id for author_id in dict.fromkeys(ids) if author_id not in found]
+        if missing:
+            for author_id, author in zip(missing, await self._inner.find_by_ids(missing)):
+                found[author_id] = identity_map.add(author_id, author)
+        return [found[author_id] for author_id in ids]
+
+    async def find_by_names(self, names: list[AuthorName]) -> list[Author | None]:
+        return await self._inner.find_by_names(names)
+
+    async def find_all(self) -> list[Author]:
+        return await self._inner.find_all()
+
+    def iter_all(self, chunk_size: int = 500) -> AsyncIterator[list[Author]]:
+        return self._inner.iter_all(chunk_size)
+
+    async def delete(self, author: Author) -> None:
+        await self._inner.delete(author)
+        if (identity_map := current_identity_map.get()) is not None:
+            identity_map.deleted(author.id)
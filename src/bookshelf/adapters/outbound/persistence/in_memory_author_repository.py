@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator
+
 from bookshelf.domain.exception.exceptions import DuplicateAuthorNameError
 from bookshelf.domain.model.author import Author
 from bookshelf.domain.model.identifiers import AuthorId
@@ -15,6 +17,15 @@ class InMemoryAuthorRepository(AuthorRepository):
                 raise DuplicateAuthorNameError(author_name=author.name.full_name)
         self._authors[author.id] = author
 
+    async def save_all(self, authors: list[Author]) -> None:
+        # One pass over the store for the whole batch, and nothing is written on a clash.
+        ids_by_name = {author.name: author.id for author in self._authors.values()}
+        for author in authors:
+            if ids_by_name.setdefault(author.name, author.id) != author.id:
+                raise DuplicateAuthorNameError(author_name=author.name.full_name)
+        for author in authors:
+            self._authors[author.id] = author
+
     async def author_name_exists(
         self, name: AuthorName, exclude_author_id: AuthorId | None = None
     ) -> bool:
@@ -23,11 +34,27 @@ class InMemoryAuthorRepository(AuthorRepository):
                 return True
         return False
 
+    async def existing_names(self, names: list[AuthorName]) -> set[AuthorName]:
+        wanted = set(names)
+        return {author.name for author in self._authors.values() if author.name in wanted}
+
     async def find_by_id(self, id: AuthorId) -> Author | None:
         return self._authors.get(id)
 
+    async def find_by_ids(self, ids: list[AuthorId]) -> list[Author | None]:
+        return [self._authors.get(id) for id in ids]
+
+    async def find_by_names(self, names: list[AuthorName]) -> list[Author | None]:
+        by_name = {author.name: author for author in self._authors.values()}
+        return [by_name.get(name) for name in names]
+
     async def find_all(self) -> list[Author]:
         return list(self._authors.values())
 
-    async def delete(self, author_id: AuthorId) -> None:
-        self._authors.pop(author_id, None)
+    async def iter_all(self, chunk_size: int = 500) -> AsyncIterator[list[Author]]:
+        authors = list(self._authors.values())
+        for start in range(0, len(authors), chunk_size):
+            yield authors[start : start + chunk_size]
+
+    async def delete(self, author: Author) -> None:
+        self._authors.pop(author.id, None)
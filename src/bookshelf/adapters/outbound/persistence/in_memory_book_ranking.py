@@ -0,0 +1,91 @@
+import heapq
+from itertools import count
+from typing import ClassVar
+
+from bookshelf.domain.model.book import Book
+from bookshelf.domain.model.identifiers import BookId
+from bookshelf.domain.model.value_objects import Genre
+from bookshelf.domain.port.book_ranking import BookRanking
+
+# (negated score, negated review count, book id, generation) — heapq is a
+# min-heap, so negating puts the best-ranked book at the root.
+type _Entry = tuple[float, int, str, int]
+
+
+class InMemoryBookRanking(BookRanking):
+    """Ranks books by Bayesian average rating using one heap per genre.
+
+    Updates push a fresh entry and leave the previous one behind as stale,
+    so re-ranking costs O(log n). Top-k walks the heap best-first from the
+    root, which visits only O(k) nodes (plus any stale ones) instead of
+    sorting the catalog. Heaps are compacted once stale entries dominate.
+    """
+
+    PRIOR_MEAN: ClassVar[float] = 3.0
+    PRIOR_WEIGHT: ClassVar[int] = 5
+
+    def __init__(self) -> None:
+        self._heaps: dict[Genre | None, list[_Entry]] = {}
+        self._members: dict[Genre | None, set[str]] = {}
+        self._generations: dict[str, int] = {}
+        # Shared by all books and never reset, so an entry left behind by a
+        # removed book cannot match the generation of a later update.
+        self._next_generation = count(1)
+        self._genres: dict[str, tuple[Genre, ...]] = {}
+
+    @classmethod
+    def bayesian_average(cls, review_count: int, average_rating: float | None) -> float:
+        total = (average_rating or 0.0) * review_count
+        return (cls.PRIOR_WEIGHT * cls.PRIOR_MEAN + total) / (cls.PRIOR_WEIGHT + review_count)
+
+    async def update(self, book: Book) -> None:
+        key = str(book.id)
+        generation = self._generations[key] = next(self._next_generation)
+        genres = tuple(book.genres)
+        for genre in self._genres.get(key, ()):
+            if genre not in genres:
+                self._members[genre].discard(key)
+        self._genres[key] = genres
+
+        score = self.bayesian_average(book.review_count, book.average_rating)
+        entry = (-score, -book.review_count, key, generation)
+        for bucket in (None, *genres):
+            self._members.setdefault(bucket, set()).add(key)
+            heapq.heappush(self._heaps.setdefault(bucket, []), entry)
+            self._compact_if_needed(bucket)
+
+    async def remove(self, book_id: BookId) -> None:
+        key = str(book_id)
+        if self._generations.pop(key, None) is None:
+            return
+        for bucket in (None, *self._genres.pop(key, ())):
+            self._members[bucket].discard(key)
+
+    async def top(self, limit: int, genre: Genre | None = None) -> list[BookId]:
+        heap = self._heaps.get(genre)
+        if not heap or limit <= 0:
+            return []
+        members = self._members[genre]
+        result: list[BookId] = []
+        frontier: list[tuple[_Entry, int]] = [(heap[0], 0)]
+        while frontier and len(result) < limit:
+            entry, index = heapq.heappop(frontier)
+            if self._is_live(entry, members):
+                result.append(BookId(entry[2]))
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return result
+
+    def _is_live(self, entry: _Entry, members: set[str]) -> bool:
+        key = entry[2]
+        return key in members and self._generations.get(key) == entry[3]
+
+    def _compact_if_needed(self, bucket: Genre | None) -> None:
+        heap = self._heaps[bucket]
+        members = self._members[bucket]
+        if len(heap) <= 2 * len(members) + 64:
+            return
+        live = [entry for entry in heap if self._is_live(entry, members)]
+        heapq.heapify(live)
+        self._heaps[bucket] = live
@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator
+
 from bookshelf.domain.exception.exceptions import DuplicateIsbnError
 from bookshelf.domain.model.book import Book
 from bookshelf.domain.model.identifiers import AuthorId, BookId
@@ -8,11 +10,31 @@ from bookshelf.domain.port.book_repository import BookRepository
 class InMemoryBookRepository(BookRepository):
     def __init__(self) -> None:
         self._books: dict[BookId, Book] = {}
+        # ISBNs as of each book's last save; stored aggregates may change before then.
+        self._ids_by_isbn: dict[ISBN, BookId] = {}
+        self._isbns: dict[BookId, ISBN] = {}
 
     async def save(self, book: Book) -> None:
-        for existing_id, existing_book in self._books.items():
-            if existing_book.isbn == book.isbn and existing_id != book.id:
+        if self._ids_by_isbn.get(book.isbn, book.id) != book.id:
+            raise DuplicateIsbnError(isbn=book.isbn.value)
+        self._store(book)
+
+    async def save_all(self, books: list[Book]) -> None:
+        # Nothing is written on a clash, with the store or within the batch.
+        claimed: dict[ISBN, BookId] = {}
+        for book in books:
+            owner = claimed.setdefault(book.isbn, self._ids_by_isbn.get(book.isbn, book.id))
+            if owner != book.id:
                 raise DuplicateIsbnError(isbn=book.isbn.value)
+        for book in books:
+            self._store(book)
+
+    def _store(self, book: Book) -> None:
+        previous = self._isbns.get(book.id)
+        if previous is not None and previous != book.isbn:
+            del self._ids_by_isbn[previous]
+        self._ids_by_isbn[book.isbn] = book.id
+        self._isbns[book.id] = book.isbn
         self._books[book.id] = book
 
     async def find_by_id(self, id: BookId) -> Book | None:
@@ -27,13 +49,22 @@ class InMemoryBookRepository(BookRepository):
     async def find_all(self) -> list[Book]:
         return list(self._books.values())
 
-    async def delete(self, book_id: BookId) -> None:
-        self._books.pop(book_id, None)
+    async def iter_all(self, chunk_size: int = 500) -> AsyncIterator[list[Book]]:
+        books = list(self._books.values())
+        for start in range(0, len(books), chunk_size):
+            yield books[start : start + chunk_size]
+
+    async def delete(self, book: Book) -> None:
+        self._books.pop(book.id, None)
+        isbn = self._isbns.pop(book.id, None)
+        if isbn is not None:
+            del self._ids_by_isbn[isbn]
 
     async def isbn_exists(
         self, isbn: ISBN, exclude_book_id: BookId | None = None
     ) -> bool:
-        for book_id, book in self._books.items():
-            if book.isbn == isbn and book_id != exclude_book_id:
-                return True
-        return False
+        owner = self._ids_by_isbn.get(isbn)
+        return owner is not None and owner != exclude_book_id
+
+    async def existing_isbns(self, isbns: list[ISBN]) -> set[ISBN]:
+        return {isbn for isbn in isbns if isbn in self._ids_by_isbn}
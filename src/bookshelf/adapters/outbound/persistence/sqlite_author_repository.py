@@ -0,0 +1,132 @@
+import json
+from collections.abc import AsyncIterator
+
+from bookshelf.adapters.outbound.persistence.sqlite_database import SqliteDatabase
+from bookshelf.domain.exception.exceptions import DuplicateAuthorNameError
+from bookshelf.domain.model.author import Author
+from bookshelf.domain.model.identifiers import AuthorId
+from bookshelf.domain.model.rehydration import trusted
+from bookshelf.domain.model.value_objects import AuthorBiography, AuthorName
+from bookshelf.domain.port.author_repository import AuthorRepository
+
+
+# Rows were validated when their authors were saved; rebuild them without checks.
+_author = trusted(Author)
+_author_id = trusted(AuthorId)
+_name = trusted(AuthorName)
+_biography = trusted(AuthorBiography)
+
+
+def _from_row(id: str, first_name: str, last_name: str, data: str) -> Author:
+    return _author(
+        _author_id(id),
+        _name(first_name, last_name),
+        _biography(json.loads(data)["biography"]),
+    )
+
+
+_COLUMNS = "id, first_name, last_name, data"
+
+
+class SqliteAuthorRepository(AuthorRepository):
+    """Stores authors in SQLite and writes their pending events to the outbox atomically."""
+
+    def __init__(self, database: SqliteDatabase) -> None:
+        self._database = database
+
+    async def save(self, author: Author) -> None:
+        await self.save_all([author])
+
+    async def save_all(self, authors: list[Author]) -> None:
+        ids_by_name: dict[AuthorName, str] = {}
+        for author in authors:
+            if ids_by_name.setdefault(author.name, str(author.id)) != str(author.id):
+                raise DuplicateAuthorNameError(author_name=author.name.full_name)
+        await self._database.run(self._save_all, authors, ids_by_name)
+
+    def _save_all(self, authors: list[Author], ids_by_name: dict[AuthorName, str]) -> None:
+        with self._database.transaction() as connection:
+            for name, author_id in self._stored_names(list(ids_by_name)):
+                if ids_by_name[name] != author_id:
+                    raise DuplicateAuthorNameError(author_name=name.full_name)
+            connection.executemany(
+                f"INSERT INTO authors ({_COLUMNS}) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET first_name = excluded.first_name, "
+                "last_name = excluded.last_name, data = excluded.data",
+                [
+                    (
+                        str(author.id),
+                        author.name.first_name,
+                        author.name.last_name,
+                        json.dumps({"biography": author.biography.value}),
+                    )
+                    for author in authors
+                ],
+            )
+            self._database.append_to_outbox(
+                event for author in authors for event in author.pending_events
+            )
+
+    def _stored_names(self, names: list[AuthorName]) -> list[tuple[AuthorName, str]]:
+        return [(author.name, str(author.id)) for author in self._find_by_names(names)]
+
+    def _find_by_names(self, names: list[AuthorName]) -> list[Author]:
+        # Match on last name in SQL, then on the full name here.
+        wanted = set(names)
+        rows = self._database.query_in(
+            f"SELECT {_COLUMNS} FROM authors WHERE last_name IN ({{}})",
+            list({name.last_name for name in names}),
+        )
+        return [author for author in (_from_row(*row) for row in rows) if author.name in wanted]
+
+    async def author_name_exists(
+        self, name: AuthorName, exclude_author_id: AuthorId | None = None
+    ) -> bool:
+        exclude = str(exclude_author_id) if exclude_author_id is not None else ""
+        rows = await self._database.fetch(
+            "SELECT 1 FROM authors WHERE first_name = ? AND last_name = ? AND id != ? LIMIT 1",
+            (name.first_name, name.last_name, exclude),
+        )
+        return bool(rows)
+
+    async def existing_names(self, names: list[AuthorName]) -> set[AuthorName]:
+        return {name for name, _ in await self._database.run(self._stored_names, names)}
+
+    async def find_by_id(self, id: AuthorId) -> Author | None:
+        rows = await self._database.fetch(
+            f"SELECT {_COLUMNS} FROM authors WHERE id = ?", (str(id),)
+        )
+        return _from_row(*rows[0]) if rows else None
+
+    async def find_by_ids(self, ids: list[AuthorId]) -> list[Author | None]:
+        rows = await self._database.fetch_in(
+            f"SELECT {_COLUMNS} FROM authors WHERE id IN ({{}})", list({str(id) for id in ids})
+        )
+        found = {author.id: author for author in (_from_row(*row) for row in rows)}
+        return [found.get(id) for id in ids]
+
+    async def find_by_names(self, names: list[AuthorName]) -> list[Author | None]:
+        authors = await self._database.run(self._find_by_names, names)
+        found = {author.name: author for author in authors}
+        return [found.get(name) for name in names]
+
+    async def find_all(self) -> list[Author]:
+        rows = await self._database.fetch(f"SELECT {_COLUMNS} FROM authors ORDER BY rowid")
+        return [_from_row(*row) for row in rows]
+
+    async def iter_all(self, chunk_size: int = 500) -> AsyncIterator[list[Author]]:
+        after = 0
+        while rows := await self._database.fetch(
+            f"SELECT rowid, {_COLUMNS} FROM authors WHERE rowid > ? ORDER BY rowid LIMIT ?",
+            (after, chunk_size),
+        ):
+            after = rows[-1][0]
+            yield [_from_row(*row[1:]) for row in rows]
+
+    async def delete(self, author: Author) -> None:
+        await self._database.run(self._delete, author)
+
+    def _delete(self, author: Author) -> None:
+        with self._database.transaction() as connection:
+            connection.execute("DELETE FROM authors WHERE id = ?", (str(author.id),))
+            self._database.append_to_outbox(author.pending_events)
@@ -0,0 +1,174 @@
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+
+from bookshelf.adapters.outbound.persistence.sqlite_database import SqliteDatabase
+from bookshelf.domain.exception.exceptions import DuplicateIsbnError
+from bookshelf.domain.model.book import Book, Review
+from bookshelf.domain.model.identifiers import AuthorId, BookId, ReviewId
+from bookshelf.domain.model.rehydration import trusted
+from bookshelf.domain.model.value_objects import (
+    BookTitle,
+    Genre,
+    ISBN,
+    PageCount,
+    PublishedYear,
+    Rating,
+    ReviewComment,
+    Summary,
+)
+from bookshelf.domain.port.book_repository import BookRepository
+
+
+def _to_json(book: Book) -> str:
+    return json.dumps(
+        {
+            "title": book.title.value,
+            "summary": book.summary.value,
+            "published_year": book.published_year.value,
+            "page_count": book.page_count.value,
+            "genres": [genre.value for genre in book.genres],
+            "reviews": [
+                {
+                    "id": str(review.id),
+                    "rating": review.rating.value,
+                    "comment": review.comment.value,
+                    "created_at": review.created_at.isoformat(),
+                }
+                for review in book.reviews
+            ],
+        }
+    )
+
+
+# Rows were validated when their books were saved; rebuild them without checks.
+_book = trusted(Book)
+_review = trusted(Review)
+_book_id = trusted(BookId)
+_author_id = trusted(AuthorId)
+_review_id = trusted(ReviewId)
+_title = trusted(BookTitle)
+_isbn = trusted(ISBN)
+_summary = trusted(Summary)
+_published_year = trusted(PublishedYear)
+_page_count = trusted(PageCount)
+_comment = trusted(ReviewComment)
+_genres = {genre.value: genre for genre in Genre}
+_ratings = {rating.value: rating for rating in Rating}
+
+
+def _from_row(id: str, author_id: str, isbn: str, data: str) -> Book:
+    fields: dict[str, Any] = json.loads(data)
+    return _book(
+        _book_id(id),
+        _author_id(author_id),
+        _title(fields["title"]),
+        _isbn(isbn),
+        _summary(fields["summary"]),
+        _published_year(fields["published_year"]),
+        _page_count(fields["page_count"]),
+        [_genres[genre] for genre in fields["genres"]],
+        [
+            _review(
+                _review_id(review["id"]),
+                _ratings[review["rating"]],
+                _comment(review["comment"]),
+                datetime.fromisoformat(review["created_at"]),
+            )
+            for review in fields["reviews"]
+        ],
+    )
+
+
+_COLUMNS = "id, author_id, isbn, data"
+
+
+class SqliteBookRepository(BookRepository):
+    """Stores books in SQLite and writes their pending events to the outbox atomically."""
+
+    def __init__(self, database: SqliteDatabase) -> None:
+        self._database = database
+
+    async def save(self, book: Book) -> None:
+        await self.save_all([book])
+
+    async def save_all(self, books: list[Book]) -> None:
+        ids_by_isbn: dict[str, str] = {}
+        for book in books:
+            if ids_by_isbn.setdefault(book.isbn.value, str(book.id)) != str(book.id):
+                raise DuplicateIsbnError(isbn=book.isbn.value)
+        await self._database.run(self._save_all, books, ids_by_isbn)
+
+    def _save_all(self, books: list[Book], ids_by_isbn: dict[str, str]) -> None:
+        with self._database.transaction() as connection:
+            for book_id, isbn in self._database.query_in(
+                "SELECT id, isbn FROM books WHERE isbn IN ({})", list(ids_by_isbn)
+            ):
+                if ids_by_isbn[isbn] != book_id:
+                    raise DuplicateIsbnError(isbn=isbn)
+            connection.executemany(
+                f"INSERT INTO books ({_COLUMNS}) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET isbn = excluded.isbn, data = excluded.data",
+                [
+                    (str(book.id), str(book.author_id), book.isbn.value, _to_json(book))
+                    for book in books
+                ],
+            )
+            self._database.append_to_outbox(
+                event for book in books for event in book.pending_events
+            )
+
+    async def find_by_id(self, id: BookId) -> Book | None:
+        rows = await self._database.fetch(
+            f"SELECT {_COLUMNS} FROM books WHERE id = ?", (str(id),)
+        )
+        return _from_row(*rows[0]) if rows else None
+
+    async def find_by_author(self, author_id: AuthorId) -> list[Book]:
+        rows = await self._database.fetch(
+            f"SELECT {_COLUMNS} FROM books WHERE author_id = ? ORDER BY rowid", (str(author_id),)
+        )
+        return [_from_row(*row) for row in rows]
+
+    async def has_books_by_author(self, author_id: AuthorId) -> bool:
+        rows = await self._database.fetch(
+            "SELECT 1 FROM books WHERE author_id = ? LIMIT 1", (str(author_id),)
+        )
+        return bool(rows)
+
+    async def find_all(self) -> list[Book]:
+        rows = await self._database.fetch(f"SELECT {_COLUMNS} FROM books ORDER BY rowid")
+        return [_from_row(*row) for row in rows]
+
+    async def iter_all(self, chunk_size: int = 500) -> AsyncIterator[list[Book]]:
+        after = 0
+        while rows := await self._database.fetch(
+            f"SELECT rowid, {_COLUMNS} FROM books WHERE rowid > ? ORDER BY rowid LIMIT ?",
+            (after, chunk_size),
+        ):
+            after = rows[-1][0]
+            yield [_from_row(*row[1:]) for row in rows]
+
+    async def delete(self, book: Book) -> None:
+        await self._database.run(self._delete, book)
+
+    def _delete(self, book: Book) -> None:
+        with self._database.transaction() as connection:
+            connection.execute("DELETE FROM books WHERE id = ?", (str(book.id),))
+            self._database.append_to_outbox(book.pending_events)
+
+    async def isbn_exists(
+        self, isbn: ISBN, exclude_book_id: BookId | None = None
+    ) -> bool:
+        exclude = str(exclude_book_id) if exclude_book_id is not None else ""
+        rows = await self._database.fetch(
+            "SELECT 1 FROM books WHERE isbn = ? AND id != ? LIMIT 1", (isbn.value, exclude)
+        )
+        return bool(rows)
+
+    async def existing_isbns(self, isbns: list[ISBN]) -> set[ISBN]:
+        rows = await self._database.fetch_in(
+            "SELECT isbn FROM books WHERE isbn IN ({})", [isbn.value for isbn in isbns]
+        )
+        return {ISBN(isbn) for (isbn,) in rows}
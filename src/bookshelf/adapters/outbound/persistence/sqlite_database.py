@@ -0,0 +1,230 @@
+import asyncio
+import json
+import sqlite3
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+from bookshelf.adapters.outbound.event_codec import decode_event, encode_event
+from bookshelf.domain.event.domain_event import DomainEvent
+
+# Stay well below SQLite's limit on bound parameters per statement.
+_CHUNK_SIZE = 500
+
+# Checkpoints of change feeds, which start at the newest event rather than
+# delivering the backlog; they hold back pruning but never allow it.
+FEED_CHECKPOINT_PREFIX = "feed:"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS authors (
+    id TEXT PRIMARY KEY,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    data TEXT NOT NULL,
+    UNIQUE (first_name, last_name)
+);
+CREATE TABLE IF NOT EXISTS books (
+    id TEXT PRIMARY KEY,
+    author_id TEXT NOT NULL,
+    isbn TEXT NOT NULL UNIQUE,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS books_author_id ON books (author_id);
+CREATE TABLE IF NOT EXISTS outbox (
+    position INTEGER PRIMARY KEY AUTOINCREMENT,
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS leases (
+    name TEXT PRIMARY KEY,
+    holder TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+class SqliteDatabase:
+    """SQLite store shared by the repositories, the event outbox and relay checkpoints.
+
+    Repositories write an aggregate and its pending events to the outbox in
+    one transaction, so an event is stored if and only if the change that
+    produced it is. Callbacks registered with `on_outbox_append` run after
+    such a transaction commits.
+
+    Several processes may open the same file, each with its own instance.
+    Leases let one of them act alone, and a checkpoint held under a lease of
+    the same name is dropped once that lease expires, so a consumer that
+    died without cleaning up stops holding back pruning.
+
+    The connection belongs to one thread. Code running on the event loop
+    goes through `run`, so a statement that waits on another process's lock
+    never stalls the loop. The other
+    methods touch the connection directly and are meant for that thread,
+    or for setup and teardown while nothing else uses the database.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self._connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._outbox_listeners: list[Callable[[], None]] = []
+        self._appended = False
+
+    async def run[T](self, work: Callable[..., T], /, *args: object) -> T:
+        """Run `work(*args)` on the database thread and return its result."""
+        self._loop = asyncio.get_running_loop()
+        return await self._loop.run_in_executor(self._executor, work, *args)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._connection
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            self._appended = False
+            raise
+        self._connection.execute("COMMIT")
+        if self._appended:
+            self._appended = False
+            self._notify_outbox_listeners()
+
+    def query(self, sql: str, parameters: Iterable[object] = ()) -> list[tuple]:
+        return self._connection.execute(sql, tuple(parameters)).fetchall()
+
+    def query_in(
+        self, sql: str, values: list[object], parameters: Iterable[object] = ()
+    ) -> list[tuple]:
+        """Run `sql`, whose `{}` placeholder becomes an IN list, over `values` in chunks."""
+        rows: list[tuple] = []
+        for start in range(0, len(values), _CHUNK_SIZE):
+            chunk = values[start : start + _CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            rows.extend(self.query(sql.format(placeholders), (*chunk, *parameters)))
+        return rows
+
+    async def fetch(self, sql: str, parameters: Iterable[object] = ()) -> list[tuple]:
+        """`query` on the database thread."""
+        return await self.run(self.query, sql, parameters)
+
+    async def fetch_in(
+        self, sql: str, values: list[object], parameters: Iterable[object] = ()
+    ) -> list[tuple]:
+        """`query_in` on the database thread."""
+        return await self.run(self.query_in, sql, values, parameters)
+
+    def append_to_outbox(self, events: Iterable[DomainEvent]) -> None:
+        """Queue events for relaying; must be called inside `transaction`."""
+        rows = [(json.dumps(encode_event(event)),) for event in events]
+        if rows:
+            self._connection.executemany("INSERT INTO outbox (payload) VALUES (?)", rows)
+            self._appended = True
+
+    def on_outbox_append(self, listener: Callable[[], None]) -> None:
+        """Call `listener` after each commit that appended to the outbox.
+
+        Listeners run on the event loop that last used `run`, if it is still open.
+        """
+        self._outbox_listeners.append(listener)
+
+    def _notify_outbox_listeners(self) -> None:
+        loop = self._loop
+        for listener in self._outbox_listeners:
+            if loop is None or loop.is_closed():
+                listener()
+            else:
+                loop.call_soon_threadsafe(listener)
+
+    def read_outbox(self, after: int, limit: int) -> list[tuple[int, DomainEvent]]:
+        rows = self.query(
+            "SELECT position, payload FROM outbox WHERE position > ? ORDER BY position LIMIT ?",
+            (after, limit),
+        )
+        return [(position, decode_event(json.loads(payload))) for position, payload in rows]
+
+    def outbox_head(self) -> int:
+        """Position of the newest event ever appended, even if it was pruned since."""
+        rows = self.query("SELECT seq FROM sqlite_sequence WHERE name = 'outbox'")
+        return rows[0][0] if rows else 0
+
+    def outbox_backlog(self, after: int) -> int:
+        return self.query("SELECT COUNT(*) FROM outbox WHERE position > ?", (after,))[0][0]
+
+    def load_checkpoint(self, name: str) -> int:
+        rows = self.query("SELECT position FROM checkpoints WHERE name = ?", (name,))
+        return rows[0][0] if rows else 0
+
+    def open_checkpoint(self, name: str) -> int:
+        """Load `name`'s checkpoint, creating it at 0 so nothing is pruned before it delivers."""
+        with self.transaction() as connection:
+            connection.execute(
+                "INSERT INTO checkpoints (name, position) VALUES (?, 0) ON CONFLICT DO NOTHING",
+                (name,),
+            )
+        return self.load_checkpoint(name)
+
+    def has_checkpoint(self, name: str) -> bool:
+        return bool(self.query("SELECT 1 FROM checkpoints WHERE name = ?", (name,)))
+
+    def save_checkpoint(self, name: str, position: int) -> None:
+        """Record `position` as delivered for `name` and prune events every relay has seen."""
+        with self.transaction() as connection:
+            connection.execute(
+                "INSERT INTO checkpoints (name, position) VALUES (?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET position = excluded.position",
+                (name, position),
+            )
+            self._prune(connection)
+
+    def delete_checkpoint(self, name: str) -> None:
+        with self.transaction() as connection:
+            connection.execute("DELETE FROM checkpoints WHERE name = ?", (name,))
+            self._prune(connection)
+
+    def acquire_lease(self, name: str, holder: str, ttl: float) -> bool:
+        """Take or renew lease `name` for `ttl` seconds; False while another holder has it."""
+        now = time.time()
+        with self.transaction() as connection:
+            connection.execute(
+                "INSERT INTO leases (name, holder, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET "
+                "holder = excluded.holder, expires_at = excluded.expires_at "
+                "WHERE leases.holder = excluded.holder OR leases.expires_at < ?",
+                (name, holder, now + ttl, now),
+            )
+            (current,) = connection.execute(
+                "SELECT holder FROM leases WHERE name = ?", (name,)
+            ).fetchone()
+        return current == holder
+
+    def release_lease(self, name: str, holder: str) -> None:
+        with self.transaction() as connection:
+            connection.execute(
+                "DELETE FROM leases WHERE name = ? AND holder = ?", (name, holder)
+            )
+
+    @staticmethod
+    def _prune(connection: sqlite3.Connection) -> None:
+        now = time.time()
+        connection.execute(
+            "DELETE FROM checkpoints WHERE name IN (SELECT name FROM leases WHERE expires_at < ?)",
+            (now,),
+        )
+        connection.execute("DELETE FROM leases WHERE expires_at < ?", (now,))
+        connection.execute(
+            "DELETE FROM outbox WHERE position <= (SELECT MIN(position) FROM checkpoints) "
+            "AND position <= (SELECT MIN(position) FROM checkpoints WHERE name NOT LIKE ?)",
+            (f"{FEED_CHECKPOINT_PREFIX}%",),
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown()
+        self._connection.close()
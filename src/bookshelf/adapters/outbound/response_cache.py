@@ -0,0 +1,181 @@
+import json
+from collections import OrderedDict, deque
+from collections.abc import Set
+from dataclasses import dataclass
+from typing import Any
+
+from bookshelf.domain.event.domain_event import DomainEvent
+from bookshelf.domain.event.events import (
+    AuthorBiographyChanged,
+    AuthorCreated,
+    AuthorDeleted,
+    AuthorNameChanged,
+    BookCreated,
+    BookDeleted,
+    BookIsbnChanged,
+    BookSummaryChanged,
+    BookTitleChanged,
+    GenreAdded,
+    GenreRemoved,
+    ReviewAdded,
+    ReviewRemoved,
+)
+from bookshelf.domain.port.event_publisher import EventPublisher
+
+_BOOK_EVENTS = (
+    BookTitleChanged,
+    BookIsbnChanged,
+    BookSummaryChanged,
+    GenreAdded,
+    GenreRemoved,
+    ReviewAdded,
+    ReviewRemoved,
+)
+
+
+def invalidation_keys(event: DomainEvent) -> list[str]:
+    """Map a domain event to the dependency keys it makes stale."""
+    if isinstance(event, (BookCreated, BookDeleted)):
+        return [f"Book:{event.book_id}", "Book:*", f"AuthorBooks:{event.author_id}"]
+    if isinstance(event, _BOOK_EVENTS):
+        return [f"Book:{event.book_id}", "Book:*"]
+    if isinstance(event, AuthorCreated):
+        return ["Author:*"]
+    if isinstance(event, (AuthorNameChanged, AuthorBiographyChanged, AuthorDeleted)):
+        return [f"Author:{event.author_id}", "Author:*"]
+    return []
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    data: Any
+    dependencies: frozenset[str]
+    size: int
+
+
+class ResponseCache:
+    """LRU cache of query results, bounded by an estimate of their encoded size.
+
+    Instances of their own also hold the pre-encoded fragments of single
+    entities and the read models shared by DataLoaders across requests.
+    Each entry remembers the entities its resolvers touched. Invalidating a
+    dependency drops exactly the entries that read it; a result computed
+    while one of its dependencies changed is never stored.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, change_log_size: int = 1024) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._by_dependency: dict[str, set[str]] = {}
+        self._version = 0
+        self._changes: deque[tuple[int, frozenset[str]]] = deque(maxlen=change_log_size)
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.data
+
+    def put(
+        self,
+        key: str,
+        data: Any,
+        dependencies: Set[str],
+        since_version: int,
+        size: int | None = None,
+    ) -> None:
+        """Cache `data` unless a dependency changed after `since_version`.
+
+        `size` is the encoded size of `data`, when the caller knows it already.
+        """
+        if self._changed_since(since_version, dependencies):
+            return
+        size = len(key) + (len(json.dumps(data, default=str)) if size is None else size)
+        if size > self.max_bytes:
+            return
+        self._discard(key)
+        entry = _Entry(data=data, dependencies=frozenset(dependencies), size=size)
+        self._entries[key] = entry
+        self._bytes += size
+        for dependency in entry.dependencies:
+            self._by_dependency.setdefault(dependency, set()).add(key)
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+            self.evictions += 1
+
+    def invalidate(self, dependencies: list[str]) -> None:
+        if not dependencies:
+            return
+        self._version += 1
+        self._changes.append((self._version, frozenset(dependencies)))
+        for dependency in dependencies:
+            for key in self._by_dependency.pop(dependency, set()):
+                self._discard(key)
+
+    def clear(self) -> None:
+        """Drop every entry; results being computed right now are not stored either."""
+        self._version += 1
+        self._changes.clear()
+        self._entries.clear()
+        self._by_dependency.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, float | int]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "maxBytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hitRatio": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _changed_since(self, version: int, dependencies: Set[str]) -> bool:
+        if version == self._version:
+            return False
+        if not self._changes or self._changes[0][0] > version + 1:
+            # The change log no longer reaches back that far; assume the worst.
+            return True
+        return any(
+            changed_version > version and not changed.isdisjoint(dependencies)
+            for changed_version, changed in self._changes
+        )
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry.size
+        for dependency in entry.dependencies:
+            keys = self._by_dependency.get(dependency)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_dependency[dependency]
+
+
+class ResponseCacheInvalidator(EventPublisher):
+    """Drops cached responses that depended on entities touched by the events."""
+
+    def __init__(self, response_cache: ResponseCache) -> None:
+        self._response_cache = response_cache
+
+    async def publish(self, events: list[DomainEvent]) -> None:
+        keys: list[str] = []
+        for event in events:
+            keys.extend(invalidation_keys(event))
+        self._response_cache.invalidate(keys)
@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+import random
+from pathlib import Path
+from typing import Any, TextIO
+
+
+class TrafficRecorder:
+    """Appends sampled GraphQL operations to a size-rotated JSON-lines file.
+
+    Each document is written once per file as a `document` record keyed by
+    its SHA-256; `operation` records then refer to it by hash, with the
+    operation name, variables, wall-clock start and duration. When the file
+    would grow past `max_bytes` it is renamed to `<path>.1`, older backups
+    shift up and the oldest beyond `backup_count` is removed, so every file
+    can be replayed on its own.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        sample_rate: float = 1.0,
+        max_bytes: int = 64 * 1024 * 1024,
+        backup_count: int = 5,
+    ) -> None:
+        self.path = path
+        self.sample_rate = sample_rate
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._file: TextIO | None = None
+        self._size = 0
+        self._documents: set[str] = set()
+
+    def sample(self) -> bool:
+        return self.sample_rate > 0.0 and random.random() < self.sample_rate
+
+    def record(
+        self,
+        *,
+        query: str,
+        operation_name: str | None,
+        variables: dict[str, Any] | None,
+        started_at: float,
+        duration_ms: float,
+        error: bool,
+    ) -> None:
+        digest = hashlib.sha256(query.encode()).hexdigest()
+        operation = json.dumps(
+            {
+                "type": "operation",
+                "hash": digest,
+                "operation": operation_name,
+                "variables": variables or {},
+                "started_at": started_at,
+                "duration_ms": round(duration_ms, 3),
+                "error": error,
+            },
+            default=str,
+        )
+        file = self._open()
+        text = self._lines(digest, query, operation)
+        if self._size and self._size + len(text) > self.max_bytes:
+            self._rotate()
+            file = self._open()
+            text = self._lines(digest, query, operation)
+        file.write(text)
+        self._size += len(text)
+        self._documents.add(digest)
+
+    def _lines(self, digest: str, query: str, operation: str) -> str:
+        if digest in self._documents:
+            return operation + "\n"
+        document = json.dumps({"type": "document", "hash": digest, "query": query})
+        return document + "\n" + operation + "\n"
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open(self) -> TextIO:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Line buffered: a crash loses at most the operation being written.
+            self._file = self.path.open("a", encoding="utf-8", buffering=1)
+            self._size = self._file.tell()
+        return self._file
+
+    def _rotate(self) -> None:
+        self.close()
+        self._documents.clear()
+        if self.backup_count <= 0:
+            self.path.unlink(missing_ok=True)
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{index}")
+            if source.exists():
+                os.replace(source, self.path.with_name(f"{self.path.name}.{index + 1}"))
+        os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
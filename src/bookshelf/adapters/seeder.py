@@ -1,3 +1,5 @@
+from bookshelf.adapters.bootstrap import Container
+from bookshelf.adapters.synthetic_catalog import CatalogSpec, load_synthetic_catalog
 from bookshelf.application.add_review_to_book import AddReviewToBook
 from bookshelf.application.create_author import CreateAuthor
 from bookshelf.application.create_book import CreateBook
@@ -149,3 +151,22 @@ async def seed(
 
         for rating, comment in book_data["reviews"]:
             await add_review(book_id_str, rating, comment)
+
+
+async def seed_if_empty(container: Container) -> None:
+    """Fill an empty store with the configured synthetic catalog, or the demo data above."""
+    if await anext(container.author_repository.iter_all(chunk_size=1), None) is not None:
+        return
+    if container.settings.synthetic_catalog:
+        await load_synthetic_catalog(
+            CatalogSpec.parse(container.settings.synthetic_catalog),
+            author_repository=container.author_repository,
+            book_repository=container.book_repository,
+            event_publisher=container.event_publisher,
+        )
+    else:
+        await seed(
+            create_author=container.create_author_handler,
+            create_book=container.create_book_handler,
+            add_review=container.add_review_to_book_handler,
+        )
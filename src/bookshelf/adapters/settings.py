@@ -0,0 +1,86 @@
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Self
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Runtime configuration, read from BOOKSHELF_* environment variables."""
+
+    trace_sample_rate: float = 0.0
+    response_cache_max_bytes: int = 64 * 1024 * 1024
+    fragment_cache_max_bytes: int = 32 * 1024 * 1024
+    loader_cache_max_bytes: int = 16 * 1024 * 1024
+    event_queue_size: int = 10_000
+    event_overflow_policy: str = "block"
+    event_spill_path: Path | None = None
+    database_path: Path | None = None
+    # Seconds between checks for writes made by other processes sharing the database
+    change_feed_interval: float = 0.1
+    subscription_queue_size: int = 100
+    # e.g. "authors=1000,books=100000,reviews=1000000,seed=7"; replaces the demo seed data
+    synthetic_catalog: str | None = None
+    capture_path: Path | None = None
+    capture_sample_rate: float = 1.0
+    capture_max_bytes: int = 64 * 1024 * 1024
+    capture_backup_count: int = 5
+    # Rank stored books in the background instead of before serving
+    fast_start: bool = False
+    # JSON array of query documents to answer with compiled execution plans
+    compiled_operations_path: Path | None = None
+    # Also run the generic executor for compiled operations and log any difference
+    verify_compiled_operations: bool = False
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> Self:
+        return cls(
+            trace_sample_rate=float(
+                environ.get("BOOKSHELF_TRACE_SAMPLE_RATE", cls.trace_sample_rate)
+            ),
+            response_cache_max_bytes=int(
+                environ.get("BOOKSHELF_RESPONSE_CACHE_MAX_BYTES", cls.response_cache_max_bytes)
+            ),
+            fragment_cache_max_bytes=int(
+                environ.get("BOOKSHELF_FRAGMENT_CACHE_MAX_BYTES", cls.fragment_cache_max_bytes)
+            ),
+            loader_cache_max_bytes=int(
+                environ.get("BOOKSHELF_LOADER_CACHE_MAX_BYTES", cls.loader_cache_max_bytes)
+            ),
+            event_queue_size=int(environ.get("BOOKSHELF_EVENT_QUEUE_SIZE", cls.event_queue_size)),
+            event_overflow_policy=environ.get(
+                "BOOKSHELF_EVENT_OVERFLOW_POLICY", cls.event_overflow_policy
+            ),
+            event_spill_path=_optional_path(environ.get("BOOKSHELF_EVENT_SPILL_PATH")),
+            database_path=_optional_path(environ.get("BOOKSHELF_DATABASE_PATH")),
+            change_feed_interval=float(
+                environ.get("BOOKSHELF_CHANGE_FEED_INTERVAL", cls.change_feed_interval)
+            ),
+            subscription_queue_size=int(
+                environ.get("BOOKSHELF_SUBSCRIPTION_QUEUE_SIZE", cls.subscription_queue_size)
+            ),
+            synthetic_catalog=environ.get("BOOKSHELF_SYNTHETIC_CATALOG") or None,
+            capture_path=_optional_path(environ.get("BOOKSHELF_CAPTURE_PATH")),
+            capture_sample_rate=float(
+                environ.get("BOOKSHELF_CAPTURE_SAMPLE_RATE", cls.capture_sample_rate)
+            ),
+            capture_max_bytes=int(
+                environ.get("BOOKSHELF_CAPTURE_MAX_BYTES", cls.capture_max_bytes)
+            ),
+            capture_backup_count=int(
+                environ.get("BOOKSHELF_CAPTURE_BACKUP_COUNT", cls.capture_backup_count)
+            ),
+            fast_start=environ.get("BOOKSHELF_FAST_START", "").lower() in ("1", "true", "yes"),
+            compiled_operations_path=_optional_path(
+                environ.get("BOOKSHELF_COMPILED_OPERATIONS")
+            ),
+            verify_compiled_operations=environ.get(
+                "BOOKSHELF_VERIFY_COMPILED_OPERATIONS", ""
+            ).lower()
+            in ("1", "true", "yes"),
+        )
+
+
+def _optional_path(value: str | None) -> Path | None:
+    return Path(value) if value else None
@@ -0,0 +1,226 @@
+"""Deterministic synthetic catalogs of any size for load and performance work."""
+
+import math
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from itertools import accumulate, islice
+from typing import Self
+
+from ulid import ULID
+
+from bookshelf.domain.factory.author_factory import DefaultAuthorFactory
+from bookshelf.domain.factory.book_factory import DefaultBookFactory
+from bookshelf.domain.model.author import Author
+from bookshelf.domain.model.book import Book, Review
+from bookshelf.domain.model.identifiers import AuthorId, ReviewId
+from bookshelf.domain.model.value_objects import (
+    AuthorBiography,
+    AuthorName,
+    BookTitle,
+    Genre,
+    ISBN,
+    PageCount,
+    PublishedYear,
+    Rating,
+    ReviewComment,
+    Summary,
+)
+from bookshelf.domain.port.author_repository import AuthorRepository
+from bookshelf.domain.port.book_repository import BookRepository
+from bookshelf.domain.port.event_publisher import EventPublisher
+from bookshelf.domain.port.id_generator import IdGenerator
+
+FIRST_NAMES = (
+    "Ada", "Alan", "Alice", "Amara", "Anton", "Beatrix", "Carlos", "Chiara", "Dmitri", "Elena",
+    "Emeka", "Farah", "Gabriel", "Hana", "Ines", "Isaac", "Jonas", "Keiko", "Lars", "Leila",
+    "Mateo", "Mira", "Nadia", "Oskar", "Priya", "Rafael", "Sofia", "Tariq", "Ursula", "Wen",
+)  # fmt: skip
+LAST_NAMES = (
+    "Abe", "Adeyemi", "Bauer", "Costa", "Dubois", "Eriksen", "Fischer", "García", "Haddad",
+    "Ivanova", "Jensen", "Kowalski", "Laurent", "Moreau", "Nakamura", "Okafor", "Petrov",
+    "Quinn", "Rossi", "Sato", "Schmidt", "Silva", "Tanaka", "Umarov", "Varga", "Weber",
+    "Xu", "Yilmaz", "Zhang", "Zielinski",
+)  # fmt: skip
+WORDS = (
+    "ancient", "city", "river", "night", "silent", "garden", "empire", "letters", "winter",
+    "machine", "memory", "house", "sea", "glass", "journey", "shadow", "north", "song",
+    "stone", "harvest", "light", "fire", "island", "storm", "mirror", "orchard", "bridge",
+    "forest", "crown", "paper", "station", "summer", "tide", "voice", "archive", "signal",
+    "the", "of", "and", "a", "in", "beyond", "under", "between", "after", "before",
+)  # fmt: skip
+# Rough shares of the catalog per genre; the first genre of a book follows these.
+GENRE_WEIGHTS = {
+    Genre.FICTION: 20, Genre.MYSTERY: 10, Genre.THRILLER: 9, Genre.ROMANCE: 9,
+    Genre.FANTASY: 8, Genre.SCI_FI: 7, Genre.NON_FICTION: 7, Genre.BIOGRAPHY: 4,
+    Genre.HISTORY: 4, Genre.SCIENCE: 3, Genre.SELF_HELP: 3, Genre.YOUNG_ADULT: 5,
+    Genre.CHILDREN: 4, Genre.HORROR: 3, Genre.POETRY: 1, Genre.DRAMA: 1,
+    Genre.GRAPHIC_NOVEL: 1, Genre.OTHER: 1,
+}  # fmt: skip
+# Cumulative weights for ratings 1..5; readers mostly review books they liked.
+RATING_WEIGHTS = tuple(accumulate((5, 8, 20, 35, 32)))
+EPOCH = datetime(2015, 1, 1, tzinfo=UTC)
+REVIEW_WINDOW = 10 * 365 * 86400  # seconds after EPOCH
+
+
+@dataclass(frozen=True)
+class CatalogSpec:
+    authors: int = 100
+    books: int = 1_000
+    reviews: int = 5_000
+    seed: int = 0
+    zipf_exponent: float = 1.1
+
+    @classmethod
+    def parse(cls, text: str) -> Self:
+        """Parse "authors=1000,books=100000,reviews=1000000,seed=7"."""
+        values: dict[str, float] = {}
+        for part in filter(None, (p.strip() for p in text.split(","))):
+            key, _, value = part.partition("=")
+            values[key.strip()] = float(value) if key.strip() == "zipf_exponent" else int(value)
+        return cls(**values)  # type: ignore[arg-type]
+
+
+class SeededIdGenerator(IdGenerator):
+    """ULIDs whose timestamps count up from EPOCH and whose randomness comes from `rng`."""
+
+    def __init__(self, rng: random.Random) -> None:
+        self._rng = rng
+        self._millis = int(EPOCH.timestamp() * 1000)
+
+    def generate(self) -> str:
+        self._millis += 1
+        return str(ULID.from_bytes(self._millis.to_bytes(6, "big") + self._rng.randbytes(10)))
+
+
+def isbn13(n: int) -> str:
+    """The n-th ISBN-13 in the 979-8 range, hyphenated, with a valid check digit."""
+    body = f"9798{n % 10**8:08d}"
+    total = sum(int(d) * (1 if i % 2 == 0 else 3) for i, d in enumerate(body))
+    check = (10 - total % 10) % 10
+    return f"{body[:3]}-{body[3]}-{body[4:8]}-{body[8:]}-{check}"
+
+
+class SyntheticCatalog:
+    """Generates authors, books and reviews for a CatalogSpec.
+
+    The same spec always yields the same catalog. Reviews per book follow a
+    Zipf distribution over a shuffled popularity order, books per author are
+    skewed the same way, and text lengths are log-normal up to each value
+    object's MAX_LENGTH.
+    """
+
+    def __init__(self, spec: CatalogSpec) -> None:
+        if spec.books > 10**8:
+            raise ValueError("At most 10**8 books can be given distinct ISBNs")
+        self.spec = spec
+        self._rng = random.Random(spec.seed)
+        self._ids = SeededIdGenerator(random.Random(spec.seed + 1))
+        self._author_factory = DefaultAuthorFactory(self._ids)
+        self._book_factory = DefaultBookFactory(self._ids)
+        self._genres = list(GENRE_WEIGHTS)
+        self._genre_weights = list(accumulate(GENRE_WEIGHTS.values()))
+
+    def authors(self) -> Iterator[Author]:
+        rng = self._rng
+        pairs = len(FIRST_NAMES) * len(LAST_NAMES)
+        for i in range(self.spec.authors):
+            first = FIRST_NAMES[i % len(FIRST_NAMES)]
+            last = LAST_NAMES[(i // len(FIRST_NAMES)) % len(LAST_NAMES)]
+            if i >= pairs:
+                last = f"{last}-{i // pairs + 1}"
+            yield self._author_factory.create(
+                name=AuthorName(first, last),
+                biography=AuthorBiography(self._text(rng, 400, AuthorBiography.MAX_LENGTH)),
+            )
+
+    def books(self, author_ids: list[AuthorId]) -> Iterator[Book]:
+        rng = self._rng
+        author_weights = self._zipf_cumulative(len(author_ids))
+        review_counts = self._review_counts()
+        for i in range(self.spec.books):
+            author_id = rng.choices(author_ids, cum_weights=author_weights)[0]
+            book = self._book_factory.create(
+                author_id=author_id,
+                title=BookTitle(self._text(rng, 24, BookTitle.MAX_LENGTH).title()),
+                isbn=ISBN(isbn13(i)),
+                summary=Summary(self._text(rng, 300, Summary.MAX_LENGTH)),
+                published_year=PublishedYear(rng.randint(1850, 2025)),
+                page_count=PageCount(min(int(rng.lognormvariate(5.6, 0.5)) + 16, 10_000)),
+                genres=self._pick_genres(rng),
+            )
+            book.add_reviews(
+                [
+                    Review(
+                        _id=ReviewId(self._ids.generate()),
+                        _rating=Rating(rng.choices(range(1, 6), cum_weights=RATING_WEIGHTS)[0]),
+                        _comment=ReviewComment(self._text(rng, 180, ReviewComment.MAX_LENGTH)),
+                        _created_at=EPOCH + timedelta(seconds=rng.randrange(REVIEW_WINDOW)),
+                    )
+                    for _ in range(review_counts[i])
+                ]
+            )
+            yield book
+
+    def _review_counts(self) -> list[int]:
+        counts = [0] * self.spec.books
+        if not counts:
+            return counts
+        popularity = list(range(self.spec.books))
+        self._rng.shuffle(popularity)
+        weights = self._zipf_cumulative(self.spec.books)
+        remaining = self.spec.reviews
+        while remaining:
+            batch = min(remaining, 100_000)
+            for rank in self._rng.choices(range(self.spec.books), cum_weights=weights, k=batch):
+                counts[popularity[rank]] += 1
+            remaining -= batch
+        return counts
+
+    def _zipf_cumulative(self, n: int) -> list[float]:
+        return list(accumulate(1 / (rank**self.spec.zipf_exponent) for rank in range(1, n + 1)))
+
+    def _pick_genres(self, rng: random.Random) -> list[Genre]:
+        count = rng.choices((1, 2, 3), weights=(50, 35, 15))[0]
+        genres: list[Genre] = []
+        while len(genres) < count:
+            genre = rng.choices(self._genres, cum_weights=self._genre_weights)[0]
+            if genre not in genres:
+                genres.append(genre)
+        return genres
+
+    @staticmethod
+    def _text(rng: random.Random, median: int, max_length: int) -> str:
+        length = min(max(int(rng.lognormvariate(math.log(median), 0.6)), 3), max_length)
+        words: list[str] = []
+        size = -1
+        while size < length:
+            word = rng.choice(WORDS)
+            words.append(word)
+            size += len(word) + 1
+        text = " ".join(words)[:length].strip()
+        return text[0].upper() + text[1:]
+
+
+async def load_synthetic_catalog(
+    spec: CatalogSpec,
+    *,
+    author_repository: AuthorRepository,
+    book_repository: BookRepository,
+    event_publisher: EventPublisher,
+    chunk_size: int = 1_000,
+) -> None:
+    """Generate the catalog for `spec` and write it through the bulk repository paths."""
+    catalog = SyntheticCatalog(spec)
+    author_ids: list[AuthorId] = []
+    authors = catalog.authors()
+    while chunk := list(islice(authors, chunk_size)):
+        await author_repository.save_all(chunk)
+        await event_publisher.publish([e for a in chunk for e in a.collect_events()])
+        author_ids.extend(a.id for a in chunk)
+
+    books = catalog.books(author_ids)
+    while chunk := list(islice(books, chunk_size)):
+        await book_repository.save_all(chunk)
+        await event_publisher.publish([e for b in chunk for e in b.collect_events()])
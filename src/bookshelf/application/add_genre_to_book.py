@@ -1,4 +1,5 @@
 from bookshelf.application.exception import BookNotFoundError
+from bookshelf.application.read_models import BookReadModel, book_to_read_model
 from bookshelf.domain.exception.exceptions import InvalidGenreError
 from bookshelf.domain.model.identifiers import BookId
 from bookshelf.domain.model.value_objects import Genre
@@ -15,7 +16,7 @@ class AddGenreToBook:
         self._book_repository = book_repository
         self._event_publisher = event_publisher
 
-    async def __call__(self, book_id: str, genre_name: str) -> None:
+    async def __call__(self, book_id: str, genre_name: str) -> BookReadModel:
         book = await self._book_repository.find_by_id(BookId(book_id))
         if book is None:
             raise BookNotFoundError(book_id)
@@ -28,3 +29,4 @@ class AddGenreToBook:
         book.add_genre(genre)
         await self._book_repository.save(book)
         await self._event_publisher.publish(book.collect_events())
+        return book_to_read_model(book)
@@ -1,4 +1,5 @@
 from bookshelf.application.exception import AuthorNotFoundError
+from bookshelf.application.read_models import AuthorReadModel, author_to_read_model
 from bookshelf.domain.model.identifiers import AuthorId
 from bookshelf.domain.model.value_objects import AuthorBiography
 from bookshelf.domain.port.author_repository import AuthorRepository
@@ -14,7 +15,7 @@ class ChangeAuthorBiography:
         self._author_repository = author_repository
         self._event_publisher = event_publisher
 
-    async def __call__(self, author_id: str, new_biography: str) -> None:
+    async def __call__(self, author_id: str, new_biography: str) -> AuthorReadModel:
         author = await self._author_repository.find_by_id(AuthorId(author_id))
         if author is None:
             raise AuthorNotFoundError(author_id)
@@ -22,3 +23,4 @@ class ChangeAuthorBiography:
         author.change_biography(AuthorBiography(new_biography))
         await self._author_repository.save(author)
         await self._event_publisher.publish(author.collect_events())
+        return author_to_read_model(author)
@@ -1,4 +1,5 @@
 from bookshelf.application.exception import AuthorNotFoundError
+from bookshelf.application.read_models import AuthorReadModel, author_to_read_model
 from bookshelf.domain.model.identifiers import AuthorId
 from bookshelf.domain.model.value_objects import AuthorName
 from bookshelf.domain.port.author_repository import AuthorRepository
@@ -17,7 +18,7 @@ class ChangeAuthorName:
         self._change_author_name_service = change_author_name_service
         self._event_publisher = event_publisher
 
-    async def __call__(self, author_id: str, first_name: str, last_name: str) -> None:
+    async def __call__(self, author_id: str, first_name: str, last_name: str) -> AuthorReadModel:
         author = await self._author_repository.find_by_id(AuthorId(author_id))
         if author is None:
             raise AuthorNotFoundError(author_id)
@@ -25,3 +26,4 @@ class ChangeAuthorName:
         await self._change_author_name_service.change_name(author, AuthorName(first_name, last_name))
         await self._author_repository.save(author)
         await self._event_publisher.publish(author.collect_events())
+        return author_to_read_model(author)
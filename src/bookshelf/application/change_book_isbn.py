@@ -1,4 +1,5 @@
 from bookshelf.application.exception import BookNotFoundError
+from bookshelf.application.read_models import BookReadModel, book_to_read_model
 from bookshelf.domain.model.identifiers import BookId
 from bookshelf.domain.model.value_objects import ISBN
 from bookshelf.domain.port.book_repository import BookRepository
@@ -17,7 +18,7 @@ class ChangeBookIsbn:
         self._change_isbn_service = change_isbn_service
         self._event_publisher = event_publisher
 
-    async def __call__(self, book_id: str, new_isbn: str) -> None:
+    async def __call__(self, book_id: str, new_isbn: str) -> BookReadModel:
         bid = BookId(book_id)
         book = await self._book_repository.find_by_id(bid)
         if book is None:
@@ -26,3 +27,4 @@ class ChangeBookIsbn:
         await self._change_isbn_service.change_isbn(book, ISBN(new_isbn))
         await self._book_repository.save(book)
         await self._event_publisher.publish(book.collect_events())
+        return book_to_read_model(book)
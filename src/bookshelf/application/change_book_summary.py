@@ -1,4 +1,5 @@
 from bookshelf.application.exception import BookNotFoundError
+from bookshelf.application.read_models import BookReadModel, book_to_read_model
 from bookshelf.domain.model.identifiers import BookId
 from bookshelf.domain.model.value_objects import Summary
 from bookshelf.domain.port.book_repository import BookRepository
@@ -14,7 +15,7 @@ class ChangeBookSummary:
         self._book_repository = book_repository
         self._event_publisher = event_publisher
 
-    async def __call__(self, book_id: str, new_summary: str) -> None:
+    async def __call__(self, book_id: str, new_summary: str) -> BookReadModel:
         book = await self._book_repository.find_by_id(BookId(book_id))
         if book is None:
             raise BookNotFoundError(book_id)
@@ -22,3 +23,4 @@ class ChangeBookSummary:
         book.change_summary(Summary(new_summary))
         await self._book_repository.save(book)
         await self._event_publisher.publish(book.collect_events())
+        return book_to_read_model(book)
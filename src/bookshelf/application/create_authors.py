@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+from typing import cast
+
+from bookshelf.application.exception import ApplicationError
+from bookshelf.domain.exception.exceptions import DomainException
+from bookshelf.domain.model.author import Author
+from bookshelf.domain.model.identifiers import AuthorId
+from bookshelf.domain.model.value_objects import AuthorBiography, AuthorName
+from bookshelf.domain.port.author_repository import AuthorRepository
+from bookshelf.domain.port.event_publisher import EventPublisher
+from bookshelf.domain.service.create_author_service import CreateAuthorService
+
+
+@dataclass(frozen=True, slots=True)
+class AuthorDraft:
+    first_name: str
+    last_name: str
+    biography: str
+
+
+type AuthorDraftResult = AuthorId | DomainException | ApplicationError
+
+
+class CreateAuthors:
+    """Creates many authors at once; each result is the new ID or the error for that draft."""
+
+    def __init__(
+        self,
+        author_repository: AuthorRepository,
+        create_author_service: CreateAuthorService,
+        event_publisher: EventPublisher,
+    ) -> None:
+        self._author_repository = author_repository
+        self._create_author_service = create_author_service
+        self._event_publisher = event_publisher
+
+    async def __call__(self, drafts: list[AuthorDraft]) -> list[AuthorDraftResult]:
+        results: list[AuthorDraftResult | None] = [None] * len(drafts)
+        valid: list[tuple[int, tuple[AuthorName, AuthorBiography]]] = []
+        for index, draft in enumerate(drafts):
+            try:
+                name = AuthorName(draft.first_name, draft.last_name)
+                valid.append((index, (name, AuthorBiography(draft.biography))))
+            except DomainException as exc:
+                results[index] = exc
+
+        created = await self._create_author_service.create_many([a for _, a in valid])
+        authors: list[Author] = []
+        for (index, _), outcome in zip(valid, created):
+            if isinstance(outcome, Author):
+                authors.append(outcome)
+                results[index] = outcome.id
+            else:
+                results[index] = outcome
+
+        if authors:
+            await self._author_repository.save_all(authors)
+            await self._event_publisher.publish(
+                [event for author in authors for event in author.collect_events()]
+            )
+        return cast(list[AuthorDraftResult], results)
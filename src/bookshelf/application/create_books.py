@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+from typing import cast
+
+from bookshelf.application.exception import ApplicationError, AuthorNotFoundError
+from bookshelf.domain.exception.exceptions import DomainException, InvalidGenreError
+from bookshelf.domain.model.book import Book
+from bookshelf.domain.model.identifiers import AuthorId, BookId
+from bookshelf.domain.model.value_objects import (
+    BookTitle,
+    Genre,
+    ISBN,
+    PageCount,
+    PublishedYear,
+    Summary,
+)
+from bookshelf.domain.port.author_repository import AuthorRepository
+from bookshelf.domain.port.book_repository import BookRepository
+from bookshelf.domain.port.event_publisher import EventPublisher
+from bookshelf.domain.service.create_book_service import CreateBookService, NewBook
+
+
+@dataclass(frozen=True, slots=True)
+class BookDraft:
+    author_id: str
+    title: str
+    isbn: str
+    summary: str
+    published_year: int
+    page_count: int
+    genres: list[str]
+
+
+type BookDraftResult = BookId | DomainException | ApplicationError
+
+
+def _to_new_book(draft: BookDraft) -> NewBook:
+    genres: list[Genre] = []
+    for genre_name in draft.genres:
+        try:
+            genres.append(Genre(genre_name))
+        except ValueError:
+            raise InvalidGenreError(genre_name)
+    return NewBook(
+        author_id=AuthorId(draft.author_id),
+        title=BookTitle(draft.title),
+        isbn=ISBN(draft.isbn),
+        summary=Summary(draft.summary),
+        published_year=PublishedYear(draft.published_year),
+        page_count=PageCount(draft.page_count),
+        genres=genres,
+    )
+
+
+class CreateBooks:
+    """Creates many books at once; each result is the new ID or the error for that draft."""
+
+    def __init__(
+        self,
+        book_repository: BookRepository,
+        author_repository: AuthorRepository,
+        create_book_service: CreateBookService,
+        event_publisher: EventPublisher,
+    ) -> None:
+        self._book_repository = book_repository
+        self._author_repository = author_repository
+        self._create_book_service = create_book_service
+        self._event_publisher = event_publisher
+
+    async def __call__(self, drafts: list[BookDraft]) -> list[BookDraftResult]:
+        results: list[BookDraftResult | None] = [None] * len(drafts)
+        pending: list[tuple[int, NewBook]] = []
+        for index, draft in enumerate(drafts):
+            try:
+                pending.append((index, _to_new_book(draft)))
+            except DomainException as exc:
+                results[index] = exc
+
+        author_ids = list({new_book.author_id for _, new_book in pending})
+        authors = await self._author_repository.find_by_ids(author_ids)
+        known = {author_id for author_id, author in zip(author_ids, authors) if author is not None}
+        valid: list[tuple[int, NewBook]] = []
+        for index, new_book in pending:
+            if new_book.author_id in known:
+                valid.append((index, new_book))
+            else:
+                results[index] = AuthorNotFoundError(str(new_book.author_id))
+
+        created = await self._create_book_service.create_many([b for _, b in valid])
+        books: list[Book] = []
+        for (index, _), outcome in zip(valid, created):
+            if isinstance(outcome, Book):
+                books.append(outcome)
+                results[index] = outcome.id
+            else:
+                results[index] = outcome
+
+        if books:
+            await self._book_repository.save_all(books)
+            await self._event_publisher.publish(
+                [event for book in books for event in book.collect_events()]
+            )
+        return cast(list[BookDraftResult], results)
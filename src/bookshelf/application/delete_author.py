@@ -1,6 +1,7 @@
 from bookshelf.application.exception import AuthorNotFoundError
 from bookshelf.domain.model.identifiers import AuthorId
 from bookshelf.domain.port.author_repository import AuthorRepository
+from bookshelf.domain.port.event_publisher import EventPublisher
 from bookshelf.domain.service.delete_author_service import DeleteAuthorService
 
 
@@ -9,9 +10,11 @@ class DeleteAuthor:
         self,
         author_repository: AuthorRepository,
         delete_author_service: DeleteAuthorService,
+        event_publisher: EventPublisher,
     ) -> None:
         self._author_repository = author_repository
         self._delete_author_service = delete_author_service
+        self._event_publisher = event_publisher
 
     async def __call__(self, author_id: str) -> None:
         aid = AuthorId(author_id)
@@ -19,4 +22,5 @@ class DeleteAuthor:
         if author is None:
             raise AuthorNotFoundError(author_id)
 
-        await self._delete_author_service.delete(aid)
+        await self._delete_author_service.delete(author)
+        await self._event_publisher.publish(author.collect_events())
@@ -1,11 +1,17 @@
 from bookshelf.application.exception import BookNotFoundError
 from bookshelf.domain.model.identifiers import BookId
 from bookshelf.domain.port.book_repository import BookRepository
+from bookshelf.domain.port.event_publisher import EventPublisher
 
 
 class DeleteBook:
-    def __init__(self, book_repository: BookRepository) -> None:
+    def __init__(
+        self,
+        book_repository: BookRepository,
+        event_publisher: EventPublisher,
+    ) -> None:
         self._book_repository = book_repository
+        self._event_publisher = event_publisher
 
     async def __call__(self, book_id: str) -> None:
         bid = BookId(book_id)
@@ -13,4 +19,6 @@ class DeleteBook:
         if book is None:
             raise BookNotFoundError(book_id)
 
-        await self._book_repository.delete(bid)
+        book.mark_deleted()
+        await self._book_repository.delete(book)
+        await self._event_publisher.publish(book.collect_events())
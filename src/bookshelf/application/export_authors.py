@@ -0,0 +1,13 @@
+from collections.abc import AsyncIterator
+
+from bookshelf.application.read_models import AuthorReadModel, author_to_read_model
+from bookshelf.domain.port.author_repository import AuthorRepository
+
+
+class ExportAuthors:
+    def __init__(self, author_repository: AuthorRepository) -> None:
+        self._author_repository = author_repository
+
+    async def __call__(self, chunk_size: int = 500) -> AsyncIterator[list[AuthorReadModel]]:
+        async for authors in self._author_repository.iter_all(chunk_size):
+            yield [author_to_read_model(a) for a in authors]
@@ -0,0 +1,13 @@
+from collections.abc import AsyncIterator
+
+from bookshelf.application.read_models import BookReadModel, book_to_read_model
+from bookshelf.domain.port.book_repository import BookRepository
+
+
+class ExportBooks:
+    def __init__(self, book_repository: BookRepository) -> None:
+        self._book_repository = book_repository
+
+    async def __call__(self, chunk_size: int = 500) -> AsyncIterator[list[BookReadModel]]:
+        async for books in self._book_repository.iter_all(chunk_size):
+            yield [book_to_read_model(b) for b in books]
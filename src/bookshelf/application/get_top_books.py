@@ -0,0 +1,26 @@
+from bookshelf.application.read_models import BookReadModel, book_to_read_model
+from bookshelf.domain.exception.exceptions import InvalidGenreError
+from bookshelf.domain.model.value_objects import Genre
+from bookshelf.domain.port.book_ranking import BookRanking
+from bookshelf.domain.port.book_repository import BookRepository
+
+
+class GetTopBooks:
+    def __init__(self, book_repository: BookRepository, book_ranking: BookRanking) -> None:
+        self._book_repository = book_repository
+        self._book_ranking = book_ranking
+
+    async def __call__(self, limit: int, genre_name: str | None = None) -> list[BookReadModel]:
+        genre: Genre | None = None
+        if genre_name is not None:
+            try:
+                genre = Genre(genre_name)
+            except ValueError:
+                raise InvalidGenreError(genre_name)
+
+        result: list[BookReadModel] = []
+        for book_id in await self._book_ranking.top(limit, genre):
+            book = await self._book_repository.find_by_id(book_id)
+            if book is not None:
+                result.append(book_to_read_model(book))
+        return result
@@ -0,0 +1,84 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from bookshelf.domain.model.entity import AggregateRoot
+from bookshelf.domain.model.identifiers import Id
+
+
+class IdentityMap:
+    """Aggregates loaded while serving one request, and their read models.
+
+    Every lookup of an ID returns the instance loaded first, so an aggregate
+    is read from storage at most once per request, and each instance is
+    projected to a read model at most once until it is saved again. Misses
+    are remembered too. An instance with unpublished events was changed by
+    a command that failed before saving it and is never handed out again.
+    """
+
+    def __init__(self) -> None:
+        self._aggregates: dict[Id[Any], AggregateRoot[Any] | None] = {}
+        self._read_models: dict[int, tuple[AggregateRoot[Any], object]] = {}
+        self.hits = 0
+
+    def get[A: AggregateRoot[Any]](self, aggregate_id: Id[Any]) -> tuple[bool, A | None]:
+        """Return (known, aggregate); `aggregate` is None for a known miss."""
+        if aggregate_id not in self._aggregates:
+            return False, None
+        aggregate = self._aggregates[aggregate_id]
+        if aggregate is not None and aggregate.pending_events:
+            self._forget(aggregate_id)
+            return False, None
+        self.hits += 1
+        return True, aggregate  # type: ignore[return-value]
+
+    def add[A: AggregateRoot[Any]](self, aggregate_id: Id[Any], aggregate: A | None) -> A | None:
+        """Map a freshly loaded aggregate, or a miss; an already mapped instance wins."""
+        mapped = self._aggregates.get(aggregate_id)
+        if mapped is not None and not mapped.pending_events:
+            return mapped  # type: ignore[return-value]
+        self._aggregates[aggregate_id] = aggregate
+        return aggregate
+
+    def add_all[A: AggregateRoot[Any]](self, aggregates: list[A]) -> list[A]:
+        return [self.add(aggregate.id, aggregate) or aggregate for aggregate in aggregates]
+
+    def saved(self, aggregate: AggregateRoot[Any]) -> None:
+        self._forget(aggregate.id)
+        self._aggregates[aggregate.id] = aggregate
+
+    def deleted(self, aggregate_id: Id[Any]) -> None:
+        self._forget(aggregate_id)
+        self._aggregates[aggregate_id] = None
+
+    def project[A: AggregateRoot[Any], R](self, aggregate: A, convert: Callable[[A], R]) -> R:
+        """`convert(aggregate)`, computed once per mapped instance."""
+        if self._aggregates.get(aggregate.id) is not aggregate:
+            # Bulk reads are not mapped; memoizing them would only cost memory.
+            return convert(aggregate)
+        entry = self._read_models.get(id(aggregate))
+        if entry is None:
+            entry = (aggregate, convert(aggregate))
+            self._read_models[id(aggregate)] = entry
+        return entry[1]  # type: ignore[return-value]
+
+    def _forget(self, aggregate_id: Id[Any]) -> None:
+        aggregate = self._aggregates.pop(aggregate_id, None)
+        if aggregate is not None:
+            self._read_models.pop(id(aggregate), None)
+
+
+# The identity map of the request being served, if any.
+current_identity_map: ContextVar[IdentityMap | None] = ContextVar(
+    "current_identity_map", default=None
+)
+
+
+@contextmanager
+def use_identity_map(identity_map: IdentityMap) -> Iterator[IdentityMap]:
+    token = current_identity_map.set(identity_map)
+    try:
+        yield identity_map
+    finally:
+        current_identity_map.reset(token)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from typing import Any
 
+from bookshelf.application.identity_map import current_identity_map
 from bookshelf.domain.model.author import Author
 from bookshelf.domain.model.book import Book, Review
 from bookshelf.domain.model.value_objects import Genre
@@ -21,8 +23,15 @@ class ReviewReadModel:
     created_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BookReadModel:
+    """A book as read by queries.
+
+    Genres and reviews are captured from the aggregate as it was when the
+    model was built, and converted only when first read, so a page that
+    selects titles allocates no genre or review models.
+    """
+
     id: str
     author_id: str
     title: str
@@ -30,10 +39,53 @@ class BookReadModel:
     summary: str
     published_year: int
     page_count: int
-    genres: tuple[GenreReadModel, ...]
-    reviews: tuple[ReviewReadModel, ...]
-    review_count: int
-    average_rating: float | None
+    _genres: tuple[Genre, ...] = field(repr=False)
+    _reviews: tuple[Review, ...] = field(repr=False)
+    _genre_models: tuple[GenreReadModel, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _review_models: tuple[ReviewReadModel, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def genres(self) -> tuple[GenreReadModel, ...]:
+        if self._genre_models is None:
+            object.__setattr__(self, "_genre_models", tuple(map(_genre_to_read_model, self._genres)))
+        return self._genre_models  # type: ignore[return-value]
+
+    @property
+    def reviews(self) -> tuple[ReviewReadModel, ...]:
+        if self._review_models is None:
+            object.__setattr__(
+                self, "_review_models", tuple(map(_review_to_read_model, self._reviews))
+            )
+        return self._review_models  # type: ignore[return-value]
+
+    @property
+    def review_count(self) -> int:
+        return len(self._reviews)
+
+    @property
+    def average_rating(self) -> float | None:
+        if not self._reviews:
+            return None
+        return sum(review.rating for review in self._reviews) / len(self._reviews)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "author_id": self.author_id,
+            "title": self.title,
+            "isbn": self.isbn,
+            "summary": self.summary,
+            "published_year": self.published_year,
+            "page_count": self.page_count,
+            "genres": [asdict(genre) for genre in self.genres],
+            "reviews": [asdict(review) for review in self.reviews],
+            "review_count": self.review_count,
+            "average_rating": self.average_rating,
+        }
 
 
 @dataclass(frozen=True)
@@ -49,6 +101,9 @@ class AuthorReadModel:
     name: AuthorNameReadModel
     biography: str
 
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
 
 def _genre_to_read_model(genre: Genre) -> GenreReadModel:
     return GenreReadModel(name=genre.value)
@@ -64,6 +119,13 @@ def _review_to_read_model(review: Review) -> ReviewReadModel:
 
 
 def book_to_read_model(book: Book) -> BookReadModel:
+    identity_map = current_identity_map.get()
+    if identity_map is not None:
+        return identity_map.project(book, _book_to_read_model)
+    return _book_to_read_model(book)
+
+
+def _book_to_read_model(book: Book) -> BookReadModel:
     return BookReadModel(
         id=str(book.id),
         author_id=str(book.author_id),
@@ -72,14 +134,19 @@ def book_to_read_model(book: Book) -> BookReadModel:
         summary=book.summary.value,
         published_year=book.published_year.value,
         page_count=book.page_count.value,
-        genres=tuple(_genre_to_read_model(g) for g in book.genres),
-        reviews=tuple(_review_to_read_model(r) for r in book.reviews),
-        review_count=book.review_count,
-        average_rating=book.average_rating,
+        _genres=book.genres,
+        _reviews=book.reviews,
     )
 
 
 def author_to_read_model(author: Author) -> AuthorReadModel:
+    identity_map = current_identity_map.get()
+    if identity_map is not None:
+        return identity_map.project(author, _author_to_read_model)
+    return _author_to_read_model(author)
+
+
+def _author_to_read_model(author: Author) -> AuthorReadModel:
     return AuthorReadModel(
         id=str(author.id),
         name=AuthorNameReadModel(
@@ -1,4 +1,5 @@
 from bookshelf.application.exception import BookNotFoundError
+from bookshelf.application.read_models import BookReadModel, book_to_read_model
 from bookshelf.domain.model.identifiers import BookId, ReviewId
 from bookshelf.domain.port.book_repository import BookRepository
 from bookshelf.domain.port.event_publisher import EventPublisher
@@ -13,7 +14,7 @@ class RemoveReviewFromBook:
         self._book_repository = book_repository
         self._event_publisher = event_publisher
 
-    async def __call__(self, book_id: str, review_id: str) -> None:
+    async def __call__(self, book_id: str, review_id: str) -> BookReadModel:
         book = await self._book_repository.find_by_id(BookId(book_id))
         if book is None:
             raise BookNotFoundError(book_id)
@@ -21,3 +22,4 @@ class RemoveReviewFromBook:
         book.remove_review(ReviewId(review_id))
         await self._book_repository.save(book)
         await self._event_publisher.publish(book.collect_events())
+        return book_to_read_model(book)
@@ -64,6 +64,12 @@ class ReviewRemoved(DomainEvent):
     review_id: ReviewId
 
 
+@dataclass(frozen=True)
+class BookDeleted(DomainEvent):
+    book_id: BookId
+    author_id: AuthorId
+
+
 # ── Author Events ─────────────────────────────────────────────
 
 
@@ -83,3 +89,8 @@ class AuthorNameChanged(DomainEvent):
 class AuthorBiographyChanged(DomainEvent):
     author_id: AuthorId
     new_biography: AuthorBiography
+
+
+@dataclass(frozen=True)
+class AuthorDeleted(DomainEvent):
+    author_id: AuthorId
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 from bookshelf.domain.event.events import (
     AuthorBiographyChanged,
+    AuthorDeleted,
     AuthorNameChanged,
 )
 from bookshelf.domain.exception.exceptions import RequiredFieldError
@@ -10,7 +11,7 @@ from bookshelf.domain.model.identifiers import AuthorId
 from bookshelf.domain.model.value_objects import AuthorBiography, AuthorName
 
 
-@dataclass
+@dataclass(slots=True)
 class Author(AggregateRoot[AuthorId]):
     _name: AuthorName
     _biography: AuthorBiography
@@ -52,3 +53,6 @@ class Author(AggregateRoot[AuthorId]):
                 new_biography=new_biography,
             )
         )
+
+    def mark_deleted(self) -> None:
+        self._record_event(AuthorDeleted(author_id=self._id))
@@ -2,6 +2,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 from bookshelf.domain.event.events import (
+    BookDeleted,
     BookIsbnChanged,
     BookSummaryChanged,
     BookTitleChanged,
@@ -32,7 +33,7 @@ from bookshelf.domain.model.value_objects import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Review(Entity[ReviewId]):
     _rating: Rating
     _comment: ReviewComment
@@ -61,7 +62,7 @@ class Review(Entity[ReviewId]):
         return self._created_at
 
 
-@dataclass
+@dataclass(slots=True)
 class Book(AggregateRoot[BookId]):
     _author_id: AuthorId
     _title: BookTitle
@@ -115,12 +116,12 @@ class Book(AggregateRoot[BookId]):
         return self._page_count
 
     @property
-    def genres(self) -> list[Genre]:
-        return list(self._genres)
+    def genres(self) -> tuple[Genre, ...]:
+        return tuple(self._genres)
 
     @property
-    def reviews(self) -> list[Review]:
-        return list(self._reviews)
+    def reviews(self) -> tuple[Review, ...]:
+        return tuple(self._reviews)
 
     @property
     def review_count(self) -> int:
@@ -216,6 +217,17 @@ class Book(AggregateRoot[BookId]):
             )
         )
 
+    def add_reviews(self, reviews: list[Review]) -> None:
+        """Add many reviews at once; the duplicate check is a single pass over a set."""
+        seen = {review.id for review in self._reviews}
+        for review in reviews:
+            if review.id in seen:
+                raise DuplicateReviewError(review_id=str(review.id))
+            seen.add(review.id)
+        self._reviews.extend(reviews)
+        for review in reviews:
+            self._record_event(ReviewAdded(book_id=self._id, review_id=review.id))
+
     def remove_review(self, review_id: ReviewId) -> None:
         for i, review in enumerate(self._reviews):
             if review.id == review_id:
@@ -228,3 +240,11 @@ class Book(AggregateRoot[BookId]):
                 )
                 return
         raise ReviewNotFoundError(review_id=str(review_id))
+
+    def mark_deleted(self) -> None:
+        self._record_event(
+            BookDeleted(
+                book_id=self._id,
+                author_id=self._author_id,
+            )
+        )
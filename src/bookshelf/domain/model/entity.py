@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from bookshelf.domain.event.domain_event import DomainEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity[IdT]:
     _id: IdT
 
@@ -20,14 +20,22 @@ class Entity[IdT]:
         return hash(self._id)
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregateRoot[IdT](Entity[IdT]):
-    _events: list[DomainEvent] = field(default_factory=list, init=False, repr=False)
+    # Most loaded aggregates never record an event; the list is created on the first.
+    _events: list[DomainEvent] | None = field(default=None, init=False, repr=False)
 
     def _record_event(self, event: DomainEvent) -> None:
+        if self._events is None:
+            self._events = []
         self._events.append(event)
 
+    @property
+    def pending_events(self) -> tuple[DomainEvent, ...]:
+        """Events recorded since the last `collect_events`, without clearing them."""
+        return tuple(self._events) if self._events else ()
+
     def collect_events(self) -> list[DomainEvent]:
-        events = self._events.copy()
-        self._events.clear()
+        events = self._events or []
+        self._events = None
         return events
@@ -26,16 +26,21 @@ class Id[T]:
         return self.value == other.value
 
     def __hash__(self) -> int:
-        return hash((type(self), self.value))
+        # Strings cache their own hash; IDs of different types that share a
+        # value only collide, they never compare equal.
+        return hash(self.value)
 
     def __bool__(self) -> bool:
         return bool(self.value)
 
 
-class BookId(Id[str]): ...
+class BookId(Id[str]):
+    __slots__ = ()
 
 
-class AuthorId(Id[str]): ...
+class AuthorId(Id[str]):
+    __slots__ = ()
 
 
-class ReviewId(Id[str]): ...
+class ReviewId(Id[str]):
+    __slots__ = ()
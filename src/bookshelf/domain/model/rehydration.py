@@ -0,0 +1,40 @@
+"""Rebuild domain objects from storage without validating them again.
+
+Repository adapters use these for rows they wrote themselves: every value
+was validated when its aggregate was saved. Anything else (requests,
+imports, events from other systems) goes through the regular constructors.
+"""
+
+from collections.abc import Callable
+from dataclasses import MISSING, fields
+from typing import Any
+
+
+def trusted[T](cls: type[T]) -> Callable[..., T]:
+    """A constructor for the slotted dataclass `cls` taking its init fields positionally.
+
+    It assigns the slots directly, skipping __init__, __post_init__ and the
+    frozen-instance guard; fields excluded from __init__ get their defaults.
+    Like dataclasses' own __init__, it is generated once per class, so build
+    it at import time and reuse it.
+    """
+    namespace: dict[str, Any] = {"_new": object.__new__, "_cls": cls}
+    params: list[str] = []
+    body: list[str] = []
+    for i, f in enumerate(fields(cls)):  # type: ignore[arg-type]
+        namespace[f"_set_{i}"] = getattr(cls, f.name).__set__
+        if f.init:
+            params.append(f"v{i}")
+            body.append(f"    _set_{i}(instance, v{i})")
+        elif f.default is not MISSING:
+            namespace[f"_default_{i}"] = f.default
+            body.append(f"    _set_{i}(instance, _default_{i})")
+        else:
+            raise TypeError(f"{cls.__name__}.{f.name} needs a default to be rehydrated")
+    source = "\n".join(
+        [f"def trusted_{cls.__name__}({', '.join(params)}):", "    instance = _new(_cls)"]
+        + body
+        + ["    return instance"]
+    )
+    exec(source, namespace)
+    return namespace[f"trusted_{cls.__name__}"]
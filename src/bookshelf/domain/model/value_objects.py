@@ -19,7 +19,7 @@ from bookshelf.domain.exception.exceptions import (
     SummaryTooLongError,
 )
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BookTitle:
     MAX_LENGTH: ClassVar[int] = 200
 
@@ -32,7 +32,7 @@ class BookTitle:
             raise BookTitleTooLongError(max_length=self.MAX_LENGTH)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ISBN:
     value: str
 
@@ -49,7 +49,7 @@ class ISBN:
             raise InvalidISBNError()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Summary:
     MAX_LENGTH: ClassVar[int] = 1000
 
@@ -62,7 +62,7 @@ class Summary:
             raise SummaryTooLongError(max_length=self.MAX_LENGTH)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PublishedYear:
     MIN_VALUE: ClassVar[int] = 0
     MAX_VALUE: ClassVar[int] = 9999
@@ -74,7 +74,7 @@ class PublishedYear:
             raise InvalidPublishedYearError()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PageCount:
     MAX_VALUE: ClassVar[int] = 10000
 
@@ -116,7 +116,7 @@ class Rating(IntEnum):
     FIVE = 5
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewComment:
     MAX_LENGTH: ClassVar[int] = 2000
 
@@ -129,7 +129,7 @@ class ReviewComment:
             raise ReviewCommentTooLongError(max_length=self.MAX_LENGTH)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuthorName:
     MAX_LENGTH: ClassVar[int] = 100
 
@@ -149,7 +149,7 @@ class AuthorName:
         return f"{self.first_name} {self.last_name}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuthorBiography:
     MAX_LENGTH: ClassVar[int] = 5000
 
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from bookshelf.domain.model.author import Author
 from bookshelf.domain.model.identifiers import AuthorId
@@ -11,16 +12,41 @@ class AuthorRepository(ABC):
         """Persist an author. Raises DuplicateAuthorNameError if another author has the same name."""
         ...
 
+    @abstractmethod
+    async def save_all(self, authors: list[Author]) -> None:
+        """Persist several authors at once. Raises DuplicateAuthorNameError like `save`."""
+        ...
+
     @abstractmethod
     async def author_name_exists(
         self, name: AuthorName, exclude_author_id: AuthorId | None = None
     ) -> bool: ...
 
+    @abstractmethod
+    async def existing_names(self, names: list[AuthorName]) -> set[AuthorName]:
+        """Return the subset of `names` already used by stored authors."""
+        ...
+
     @abstractmethod
     async def find_by_id(self, id: AuthorId) -> Author | None: ...
 
+    @abstractmethod
+    async def find_by_ids(self, ids: list[AuthorId]) -> list[Author | None]:
+        """Look up several authors; the result lines up with `ids`."""
+        ...
+
+    @abstractmethod
+    async def find_by_names(self, names: list[AuthorName]) -> list[Author | None]:
+        """Look up several authors by name; the result lines up with `names`."""
+        ...
+
     @abstractmethod
     async def find_all(self) -> list[Author]: ...
 
     @abstractmethod
-    async def delete(self, author_id: AuthorId) -> None: ...
+    def iter_all(self, chunk_size: int = 500) -> AsyncIterator[list[Author]]:
+        """Yield every author in storage order, `chunk_size` at a time."""
+        ...
+
+    @abstractmethod
+    async def delete(self, author: Author) -> None: ...
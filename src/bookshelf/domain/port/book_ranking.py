@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+from bookshelf.domain.model.book import Book
+from bookshelf.domain.model.identifiers import BookId
+from bookshelf.domain.model.value_objects import Genre
+
+
+class BookRanking(ABC):
+    @abstractmethod
+    async def update(self, book: Book) -> None:
+        """Insert or re-rank a book from its current reviews and genres."""
+        ...
+
+    @abstractmethod
+    async def remove(self, book_id: BookId) -> None: ...
+
+    @abstractmethod
+    async def top(self, limit: int, genre: Genre | None = None) -> list[BookId]:
+        """Return up to `limit` book IDs, best ranked first."""
+        ...
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from bookshelf.domain.model.book import Book
 from bookshelf.domain.model.identifiers import AuthorId, BookId
@@ -11,6 +12,11 @@ class BookRepository(ABC):
         """Persist a book. Raises DuplicateIsbnError if another book has the same ISBN."""
         ...
 
+    @abstractmethod
+    async def save_all(self, books: list[Book]) -> None:
+        """Persist several books at once. Raises DuplicateIsbnError like `save`."""
+        ...
+
     @abstractmethod
     async def find_by_id(self, id: BookId) -> Book | None: ...
 
@@ -24,9 +30,19 @@ class BookRepository(ABC):
     async def find_all(self) -> list[Book]: ...
 
     @abstractmethod
-    async def delete(self, book_id: BookId) -> None: ...
+    def iter_all(self, chunk_size: int = 500) -> AsyncIterator[list[Book]]:
+        """Yield every book in storage order, `chunk_size` at a time."""
+        ...
+
+    @abstractmethod
+    async def delete(self, book: Book) -> None: ...
 
     @abstractmethod
     async def isbn_exists(
         self, isbn: ISBN, exclude_book_id: BookId | None = None
     ) -> bool: ...
+
+    @abstractmethod
+    async def existing_isbns(self, isbns: list[ISBN]) -> set[ISBN]:
+        """Return the subset of `isbns` already used by stored books."""
+        ...
@@ -14,3 +14,17 @@ class CreateAuthorService:
         if await self._author_repository.author_name_exists(name):
             raise DuplicateAuthorNameError(author_name=name.full_name)
         return self._author_factory.create(name=name, biography=biography)
+
+    async def create_many(
+        self, new_authors: list[tuple[AuthorName, AuthorBiography]]
+    ) -> list[Author | DuplicateAuthorNameError]:
+        """Create authors whose names are unique across the batch and the store, in one lookup."""
+        taken = await self._author_repository.existing_names([name for name, _ in new_authors])
+        results: list[Author | DuplicateAuthorNameError] = []
+        for name, biography in new_authors:
+            if name in taken:
+                results.append(DuplicateAuthorNameError(author_name=name.full_name))
+                continue
+            taken.add(name)
+            results.append(self._author_factory.create(name=name, biography=biography))
+        return results
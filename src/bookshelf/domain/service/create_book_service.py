@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 from bookshelf.domain.exception.exceptions import DuplicateIsbnError
 from bookshelf.domain.model.book import Book
 from bookshelf.domain.model.identifiers import AuthorId
@@ -13,6 +15,17 @@ from bookshelf.domain.port.book_factory import BookFactory
 from bookshelf.domain.port.book_repository import BookRepository
 
 
+@dataclass(frozen=True, slots=True)
+class NewBook:
+    author_id: AuthorId
+    title: BookTitle
+    isbn: ISBN
+    summary: Summary
+    published_year: PublishedYear
+    page_count: PageCount
+    genres: list[Genre]
+
+
 class CreateBookService:
     def __init__(self, book_repository: BookRepository, book_factory: BookFactory) -> None:
         self._book_repository = book_repository
@@ -40,3 +53,25 @@ class CreateBookService:
             page_count=page_count,
             genres=genres,
         )
+
+    async def create_many(self, new_books: list[NewBook]) -> list[Book | DuplicateIsbnError]:
+        """Create books whose ISBNs are unique across the batch and the store, in one lookup."""
+        taken = await self._book_repository.existing_isbns([b.isbn for b in new_books])
+        results: list[Book | DuplicateIsbnError] = []
+        for new_book in new_books:
+            if new_book.isbn in taken:
+                results.append(DuplicateIsbnError(isbn=new_book.isbn.value))
+                continue
+            taken.add(new_book.isbn)
+            results.append(
+                self._book_factory.create(
+                    author_id=new_book.author_id,
+                    title=new_book.title,
+                    isbn=new_book.isbn,
+                    summary=new_book.summary,
+                    published_year=new_book.published_year,
+                    page_count=new_book.page_count,
+                    genres=new_book.genres,
+                )
+            )
+        return results
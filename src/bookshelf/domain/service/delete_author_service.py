@@ -1,5 +1,5 @@
 from bookshelf.domain.exception.exceptions import AuthorHasBooksError
-from bookshelf.domain.model.identifiers import AuthorId
+from bookshelf.domain.model.author import Author
 from bookshelf.domain.port.author_repository import AuthorRepository
 from bookshelf.domain.port.book_repository import BookRepository
 
@@ -9,7 +9,8 @@ class DeleteAuthorService:
         self._book_repository = book_repository
         self._author_repository = author_repository
 
-    async def delete(self, author_id: AuthorId) -> None:
-        if await self._book_repository.has_books_by_author(author_id):
-            raise AuthorHasBooksError(author_id=str(author_id))
-        await self._author_repository.delete(author_id)
+    async def delete(self, author: Author) -> None:
+        if await self._book_repository.has_books_by_author(author.id):
+            raise AuthorHasBooksError(author_id=str(author.id))
+        author.mark_deleted()
+        await self._author_repository.delete(author)
@@ -0,0 +1,82 @@
+import asyncio
+from pathlib import Path, PosixPath
+
+from bookshelf.adapters.outbound.async_batching_event_publisher import (
+    AsyncBatchingEventPublisher,
+    OverflowPolicy,
+)
+from bookshelf.domain.event.domain_event import DomainEvent
+from bookshelf.domain.event.events import BookDeleted
+from bookshelf.domain.model.identifiers import AuthorId, BookId
+from bookshelf.domain.port.event_publisher import EventPublisher
+
+
+class _RecordingSink(EventPublisher):
+    def __init__(self) -> None:
+        self.events: list[DomainEvent] = []
+
+    async def publish(self, events: list[DomainEvent]) -> None:
+        self.events.extend(events)
+
+
+class _FailingSink(EventPublisher):
+    async def publish(self, events: list[DomainEvent]) -> None:
+        raise RuntimeError("sink down")
+
+
+class _AppendCountingPath(PosixPath):
+    appends = 0
+
+    def open(self, mode="r", *args, **kwargs):  # type: ignore[no-untyped-def, override]
+        if mode.startswith("a"):
+            type(self).appends += 1
+        return super().open(mode, *args, **kwargs)
+
+
+def _events(count: int) -> list[DomainEvent]:
+    return [
+        BookDeleted(book_id=BookId(f"book-{i}"), author_id=AuthorId("author"))
+        for i in range(count)
+    ]
+
+
+def test_failed_sinks_are_not_counted_as_delivered() -> None:
+    recording = _RecordingSink()
+    publisher = AsyncBatchingEventPublisher([recording, _FailingSink()])
+
+    async def run() -> None:
+        await publisher.start()
+        await publisher.publish(_events(3))
+        await publisher.stop()
+
+    asyncio.run(run())
+
+    assert len(recording.events) == 3
+    assert publisher.delivered == 3
+    assert publisher.failed == 3
+
+
+def test_overflow_is_spilled_in_one_write_and_delivered_in_order(tmp_path: Path) -> None:
+    recording = _RecordingSink()
+    spill_path = _AppendCountingPath(tmp_path / "spill.jsonl")
+    publisher = AsyncBatchingEventPublisher(
+        [recording],
+        max_queue_size=2,
+        overflow=OverflowPolicy.SPILL,
+        spill_path=spill_path,
+    )
+    events = _events(6)
+
+    async def run() -> None:
+        await publisher.start()
+        # Nothing yields between enqueues, so the workers cannot drain the queue.
+        await publisher.publish(events)
+        assert publisher.queue_depth == 6
+        assert len(spill_path.read_text().splitlines()) == 4
+        await publisher.stop()
+
+    asyncio.run(run())
+
+    assert _AppendCountingPath.appends == 1
+    assert recording.events == events
+    assert not spill_path.exists()
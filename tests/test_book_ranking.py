@@ -0,0 +1,58 @@
+import asyncio
+from datetime import UTC, datetime
+
+from bookshelf.adapters.outbound.persistence.in_memory_book_ranking import InMemoryBookRanking
+from bookshelf.domain.model.book import Book
+from bookshelf.domain.model.identifiers import AuthorId, BookId, ReviewId
+from bookshelf.domain.model.value_objects import (
+    ISBN,
+    BookTitle,
+    Genre,
+    PageCount,
+    PublishedYear,
+    Rating,
+    ReviewComment,
+    Summary,
+)
+
+
+def _book(book_id: str, ratings: list[int]) -> Book:
+    book = Book(
+        _id=BookId(book_id),
+        _author_id=AuthorId("author"),
+        _title=BookTitle("Title"),
+        _isbn=ISBN("978-0-452-28423-4"),
+        _summary=Summary("Summary."),
+        _published_year=PublishedYear(1949),
+        _page_count=PageCount(328),
+        _genres=[Genre.FICTION],
+    )
+    for i, rating in enumerate(ratings):
+        book.add_review(
+            ReviewId(f"{book_id}-{i}"), Rating(rating), ReviewComment("Fine."), datetime.now(UTC)
+        )
+    return book
+
+
+def test_updates_after_a_removal_do_not_revive_stale_entries() -> None:
+    async def scenario() -> list[BookId]:
+        ranking = InMemoryBookRanking()
+        await ranking.update(_book("b1", []))
+        await ranking.update(_book("b1", [5] * 5))
+        await ranking.remove(BookId("b1"))
+        await ranking.update(_book("b1", [1]))
+        return await ranking.top(5)
+
+    assert asyncio.run(scenario()) == [BookId("b1")]
+
+
+def test_top_reflects_the_latest_update_in_each_genre() -> None:
+    async def scenario() -> tuple[list[BookId], list[BookId]]:
+        ranking = InMemoryBookRanking()
+        await ranking.update(_book("b1", [5, 5]))
+        await ranking.update(_book("b2", [3]))
+        await ranking.update(_book("b1", [1, 1]))
+        return await ranking.top(5), await ranking.top(5, Genre.FICTION)
+
+    overall, fiction = asyncio.run(scenario())
+    assert overall == fiction == [BookId("b2"), BookId("b1")]
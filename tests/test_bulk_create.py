@@ -0,0 +1,138 @@
+import asyncio
+from typing import Any
+
+from bookshelf.adapters.bootstrap import Container
+from bookshelf.adapters.inbound.graphql.resolvers.mutations import MAX_BATCH_SIZE
+from bookshelf.adapters.inbound.graphql.schema import get_schema
+from bookshelf.adapters.seeder import seed_if_empty
+from bookshelf.adapters.settings import Settings
+
+_CREATE_BOOKS = """
+mutation CreateBooks($inputs: [CreateBookInput!]!) {
+  createBooks(inputs: $inputs) {
+    ... on CreateBookResponse { bookId }
+    ... on ErrorType { code }
+  }
+}
+"""
+_CREATE_AUTHORS = """
+mutation CreateAuthors($inputs: [CreateAuthorInput!]!) {
+  createAuthors(inputs: $inputs) {
+    ... on CreateAuthorResponse { authorId }
+    ... on ErrorType { code }
+  }
+}
+"""
+
+
+def _container() -> Container:
+    container = Container(settings=Settings())
+    asyncio.run(seed_if_empty(container))
+    return container
+
+
+def _execute(container: Container, query: str, variables: dict[str, Any]) -> Any:
+    return asyncio.run(
+        get_schema().execute(
+            query, variable_values=variables, context_value=container.graphql_context()
+        )
+    )
+
+
+def _isbn(n: int) -> str:
+    digits = f"978{n:09d}"
+    check = -sum(int(d) * (1 if i % 2 == 0 else 3) for i, d in enumerate(digits)) % 10
+    return f"{digits}{check}"
+
+
+def _book_input(author_id: str, isbn: str) -> dict[str, Any]:
+    return {
+        "authorId": author_id,
+        "title": "A Bulk Book",
+        "isbn": isbn,
+        "summary": "Created in a batch.",
+        "publishedYear": 2000,
+        "pageCount": 100,
+        "genres": ["FICTION"],
+    }
+
+
+def test_create_books_reports_each_error_in_its_inputs_position() -> None:
+    container = _container()
+    existing = asyncio.run(container.book_repository.find_all())[0]
+    author_id = str(existing.author_id)
+    books_before = len(asyncio.run(container.book_repository.find_all()))
+
+    result = _execute(
+        container,
+        _CREATE_BOOKS,
+        {
+            "inputs": [
+                _book_input(author_id, _isbn(1)),
+                _book_input(author_id, _isbn(1)),
+                _book_input(author_id, existing.isbn.value),
+                _book_input(author_id, "not an isbn"),
+                _book_input("no-such-author", _isbn(2)),
+                _book_input(author_id, _isbn(3)),
+            ]
+        },
+    )
+
+    assert result.errors is None
+    results = result.data["createBooks"]
+    assert [item.get("code") for item in results] == [
+        None,
+        "DUPLICATE_ISBN",
+        "DUPLICATE_ISBN",
+        "INVALID_ISBN",
+        "AUTHOR_NOT_FOUND",
+        None,
+    ]
+    for position, isbn in ((0, _isbn(1)), (5, _isbn(3))):
+        book = asyncio.run(container.get_book_by_id_handler(book_id=results[position]["bookId"]))
+        assert book.isbn == isbn
+    assert len(asyncio.run(container.book_repository.find_all())) == books_before + 2
+
+
+def test_create_authors_reports_each_error_in_its_inputs_position() -> None:
+    container = _container()
+    existing = asyncio.run(container.author_repository.find_all())[0]
+
+    result = _execute(
+        container,
+        _CREATE_AUTHORS,
+        {
+            "inputs": [
+                {"firstName": "Ursula", "lastName": "Le Guin", "biography": "Novelist."},
+                {
+                    "firstName": existing.name.first_name,
+                    "lastName": existing.name.last_name,
+                    "biography": "Already stored.",
+                },
+                {"firstName": "Ursula", "lastName": "Le Guin", "biography": "Twice in the batch."},
+                {"firstName": "", "lastName": "Nameless", "biography": "Invalid."},
+            ]
+        },
+    )
+
+    assert result.errors is None
+    results = result.data["createAuthors"]
+    assert "authorId" in results[0]
+    assert [item.get("code") for item in results[1:]] == [
+        "DUPLICATE_AUTHOR_NAME",
+        "DUPLICATE_AUTHOR_NAME",
+        "EMPTY_AUTHOR_NAME",
+    ]
+
+
+def test_a_batch_over_the_limit_is_rejected_whole() -> None:
+    container = _container()
+    author_id = str(asyncio.run(container.author_repository.find_all())[0].id)
+    books_before = len(asyncio.run(container.book_repository.find_all()))
+    inputs = [_book_input(author_id, _isbn(n)) for n in range(MAX_BATCH_SIZE + 1)]
+
+    result = _execute(container, _CREATE_BOOKS, {"inputs": inputs})
+
+    assert result.errors is not None
+    assert f"exceeds the maximum of {MAX_BATCH_SIZE}" in result.errors[0].message
+    assert len(asyncio.run(container.book_repository.find_all())) == books_before
@@ -0,0 +1,115 @@
+import asyncio
+from typing import Any
+
+from bookshelf.adapters.bootstrap import Container
+from bookshelf.adapters.inbound.graphql.schema import get_schema
+from bookshelf.adapters.outbound.event_broadcaster import EventBroadcaster, EventSubscription
+from bookshelf.adapters.seeder import seed_if_empty
+from bookshelf.adapters.settings import Settings
+from bookshelf.domain.event.domain_event import DomainEvent
+from bookshelf.domain.event.events import BookDeleted, BookTitleChanged, GenreAdded
+from bookshelf.domain.model.identifiers import AuthorId, BookId
+from bookshelf.domain.model.value_objects import BookTitle, Genre
+
+
+def _title_changed(book_id: str) -> BookTitleChanged:
+    return BookTitleChanged(book_id=BookId(book_id), new_title=BookTitle("New"))
+
+
+def _genre_added(book_id: str) -> GenreAdded:
+    return GenreAdded(book_id=BookId(book_id), genre=Genre.FICTION)
+
+
+def _deleted(book_id: str, author_id: str) -> BookDeleted:
+    return BookDeleted(book_id=BookId(book_id), author_id=AuthorId(author_id))
+
+
+def _received(subscription: EventSubscription) -> list[DomainEvent]:
+    """The events waiting in the subscription's mailbox."""
+
+    async def drain() -> list[DomainEvent]:
+        events: list[DomainEvent] = []
+        iterator = aiter(subscription)
+        while True:
+            try:
+                events.append(await asyncio.wait_for(anext(iterator), timeout=0.01))
+            except TimeoutError:
+                return events
+
+    return asyncio.run(drain())
+
+
+def test_each_subscriber_receives_only_the_events_its_filters_match() -> None:
+    broadcaster = EventBroadcaster()
+    by_book = broadcaster.subscribe(book_ids=["b1"])
+    by_author_and_type = broadcaster.subscribe(author_ids=["a1"], event_types=["BookDeleted"])
+    by_type = broadcaster.subscribe(event_types=["GenreAdded"])
+    everything = broadcaster.subscribe()
+    events = [
+        _title_changed("b1"),
+        _title_changed("b2"),
+        _genre_added("b2"),
+        _deleted("b1", "a1"),
+        _deleted("b3", "a2"),
+    ]
+
+    asyncio.run(broadcaster.publish(events))
+
+    assert _received(by_book) == [events[0], events[3]]
+    assert _received(by_author_and_type) == [events[3]]
+    assert _received(by_type) == [events[2]]
+    assert _received(everything) == events
+
+
+def test_a_full_mailbox_drops_the_oldest_event() -> None:
+    broadcaster = EventBroadcaster(max_queue_size=2)
+    subscription = broadcaster.subscribe()
+    events = [_title_changed(f"b{i}") for i in range(5)]
+
+    asyncio.run(broadcaster.publish(events))
+
+    assert _received(subscription) == events[-2:]
+    assert subscription.dropped == broadcaster.dropped == 3
+
+
+def test_closed_subscriptions_are_removed_from_the_index() -> None:
+    broadcaster = EventBroadcaster()
+    with broadcaster.subscribe(book_ids=["b1"]), broadcaster.subscribe():
+        assert broadcaster.subscriber_count == 2
+
+    assert broadcaster.subscriber_count == 0
+    asyncio.run(broadcaster.publish([_title_changed("b1")]))
+
+
+def test_catalog_changes_streams_matching_mutations() -> None:
+    container = Container(settings=Settings())
+
+    async def run() -> Any:
+        await seed_if_empty(container)
+        book, other = (await container.book_repository.find_all())[:2]
+        stream = await get_schema().subscribe(
+            "subscription Changes($ids: [ID!]) {"
+            " catalogChanges(bookIds: $ids) { eventType bookId } }",
+            variable_values={"ids": [str(book.id)]},
+            context_value=container.graphql_context(),
+        )
+
+        async def first_change() -> Any:
+            # Like the WebSocket transport, iterate and close within one task.
+            try:
+                return await anext(stream)
+            finally:
+                await stream.aclose()
+
+        first = asyncio.create_task(first_change())
+        while not container.event_broadcaster.subscriber_count:
+            await asyncio.sleep(0)
+        await container.change_book_title_handler(str(other.id), "Not Streamed")
+        await container.change_book_title_handler(str(book.id), "Streamed")
+        return str(book.id), await asyncio.wait_for(first, timeout=1)
+
+    book_id, result = asyncio.run(run())
+
+    assert result.errors is None
+    assert result.data == {"catalogChanges": {"eventType": "BookTitleChanged", "bookId": book_id}}
+    assert container.event_broadcaster.subscriber_count == 0
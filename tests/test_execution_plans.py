@@ -0,0 +1,94 @@
+import asyncio
+import json
+from typing import Any
+
+import pytest
+
+from bookshelf.adapters.bootstrap import Container
+from bookshelf.adapters.inbound.graphql.execution_plans import ExecutionPlans
+from bookshelf.adapters.inbound.graphql.fragments import encode_json
+from bookshelf.adapters.inbound.graphql.schema import get_schema
+from bookshelf.adapters.seeder import seed_if_empty
+from bookshelf.adapters.settings import Settings
+
+_QUERIES = {
+    "books": """
+        query BooksPage($first: Int!, $after: String) {
+          books(first: $first, after: $after) {
+            totalCount
+            pageInfo { hasNextPage endCursor }
+            edges {
+              cursor
+              node { id title averageRating genres { name } author { name { fullName } } }
+            }
+          }
+        }
+    """,
+    "book": """
+        query Book($id: String!) {
+          book(bookId: $id) {
+            ... on BookType { id title isbn reviewCount reviews { rating comment } }
+            ... on ErrorType { code }
+          }
+        }
+    """,
+    "topBooks": """
+        query TopBooks { topBooks(first: 5) { id title averageRating reviewCount } }
+    """,
+    "author": """
+        query Author($id: String!) {
+          author(authorId: $id) {
+            ...AuthorFields
+            ... on ErrorType { code }
+          }
+        }
+        fragment AuthorFields on AuthorType { id name { fullName } books { id title } }
+    """,
+    "aliases": """
+        query Aliases { first: topBooks(first: 1) { __typename id heading: title } }
+    """,
+}
+
+
+def _container() -> Container:
+    container = Container(settings=Settings())
+    asyncio.run(seed_if_empty(container))
+    return container
+
+
+def _variables(container: Container, case: str) -> dict[str, Any]:
+    books = asyncio.run(container.book_repository.find_all())
+    return {
+        "books": {"first": 3},
+        "book": {"id": str(books[0].id)},
+        "missingBook": {"id": "missing"},
+        "author": {"id": str(books[0].author_id)},
+    }.get(case, {})
+
+
+@pytest.mark.parametrize("case", [*sorted(_QUERIES), "missingBook"])
+def test_a_plan_answers_like_the_generic_executor(case: str) -> None:
+    container = _container()
+    query = _QUERIES.get(case, _QUERIES["book"])
+    variables = _variables(container, case)
+    plan = ExecutionPlans(get_schema()).register(query)
+
+    compiled = asyncio.run(plan.execute(container.graphql_context(), variables))
+    generic = asyncio.run(
+        get_schema().execute(
+            query, variable_values=variables, context_value=container.graphql_context()
+        )
+    )
+
+    assert compiled is not None
+    assert generic.errors is None
+    # Compared as serialized text, so key order counts too.
+    assert encode_json(compiled) == json.dumps(generic.data)
+
+
+def test_variables_that_do_not_coerce_fall_back_to_the_generic_executor() -> None:
+    container = _container()
+    plan = ExecutionPlans(get_schema()).register(_QUERIES["book"])
+
+    assert asyncio.run(plan.execute(container.graphql_context(), {"id": 1})) is None
+    assert asyncio.run(plan.execute(container.graphql_context(), {})) is None
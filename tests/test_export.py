@@ -0,0 +1,135 @@
+import asyncio
+import json
+from typing import Any
+
+import pytest
+
+import bookshelf.adapters.app as app_module
+from bookshelf.adapters.app import app, container
+from bookshelf.adapters.seeder import seed_if_empty
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _seeded() -> None:
+    asyncio.run(seed_if_empty(container))
+
+
+def _get(path: str, query_string: str = "") -> tuple[int, dict[str, str], list[dict[str, Any]]]:
+    """Request `path` from the app; return the status, headers and body messages."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query_string.encode(),
+        "root_path": "",
+        "headers": [],
+        "client": ("127.0.0.1", 0),
+        "server": ("testserver", 80),
+    }
+    start: dict[str, Any] = {}
+    bodies: list[dict[str, Any]] = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive() -> dict[str, Any]:
+        if requests:
+            return requests.pop()
+        # The client stays connected until the response ends.
+        await asyncio.Event().wait()
+        raise AssertionError("unreachable")
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            start.update(message)
+        else:
+            bodies.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    headers = {key.decode(): value.decode() for key, value in start["headers"]}
+    return start["status"], headers, bodies
+
+
+def _lines(bodies: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    text = b"".join(body.get("body", b"") for body in bodies).decode()
+    assert text == "" or text.endswith("\n")
+    return [json.loads(line) for line in text.splitlines()]
+
+
+def _all_books() -> list[Any]:
+    return asyncio.run(container.get_all_books_handler())
+
+
+def test_books_stream_one_json_object_per_line() -> None:
+    status, headers, bodies = _get("/export/books.ndjson")
+    books = _lines(bodies)
+
+    assert status == 200
+    assert headers["content-type"].startswith("application/x-ndjson")
+    assert sorted(book["id"] for book in books) == sorted(book.id for book in _all_books())
+    assert {"id", "title", "isbn", "genres", "reviews", "average_rating"} <= books[0].keys()
+
+
+def test_books_filter_by_genre_name_as_in_graphql() -> None:
+    status, _, bodies = _get("/export/books.ndjson", "genre=FANTASY&genre=SCI_FI")
+    books = _lines(bodies)
+
+    expected = {
+        book.id
+        for book in _all_books()
+        if {genre.name for genre in book.genres} & {"Fantasy", "Sci-Fi"}
+    }
+    assert status == 200
+    assert expected
+    assert {book["id"] for book in books} == expected
+
+
+def test_books_reject_unknown_genre_names() -> None:
+    status, _, _ = _get("/export/books.ndjson", "genre=Fantasy")
+
+    assert status == 422
+
+
+def test_books_combine_filters() -> None:
+    status, _, bodies = _get(
+        "/export/books.ndjson", "published_year_from=1930&page_count_to=400"
+    )
+    books = _lines(bodies)
+
+    expected = {
+        book.id
+        for book in _all_books()
+        if book.published_year >= 1930 and book.page_count <= 400
+    }
+    assert status == 200
+    assert {book["id"] for book in books} == expected
+
+
+def test_authors_filter_by_name() -> None:
+    status, _, bodies = _get("/export/authors.ndjson", "name=orwell")
+
+    assert status == 200
+    assert [author["name"]["full_name"] for author in _lines(bodies)] == ["George Orwell"]
+
+
+def test_the_stream_sends_each_chunk_and_then_ends(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(app_module, "EXPORT_CHUNK_SIZE", 3)
+
+    _, _, bodies = _get("/export/books.ndjson")
+
+    count = len(_all_books())
+    chunks = [body for body in bodies if body.get("body")]
+    assert len(chunks) == -(-count // 3)
+    assert all(body.get("more_body") for body in bodies[:-1])
+    assert bodies[-1].get("more_body", False) is False
+    assert len(_lines(bodies)) == count
+
+
+def test_an_empty_result_ends_the_stream_without_lines() -> None:
+    status, _, bodies = _get("/export/books.ndjson", "title=no-such-title")
+
+    assert status == 200
+    assert _lines(bodies) == []
+    assert bodies[-1].get("more_body", False) is False
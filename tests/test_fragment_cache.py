@@ -0,0 +1,88 @@
+import asyncio
+import json
+from typing import Any
+
+from bookshelf.adapters.bootstrap import Container
+from bookshelf.adapters.inbound.graphql.execution_plans import ExecutionPlans
+from bookshelf.adapters.inbound.graphql.fragments import Fragment, encode_json
+from bookshelf.adapters.inbound.graphql.schema import get_schema
+from bookshelf.adapters.seeder import seed_if_empty
+from bookshelf.adapters.settings import Settings
+
+_BOOKS = """
+query BooksPage($first: Int!) {
+  books(first: $first) {
+    edges { node { id title reviewCount genres { name } author { id name { fullName } } } }
+  }
+}
+"""
+_AUTHOR = """
+query Author($id: String!) {
+  author(authorId: $id) { ... on AuthorType { id biography books { id title } } }
+}
+"""
+
+
+def _container() -> Container:
+    # Whole responses are cached too; turned off so every request runs the plan.
+    container = Container(settings=Settings(response_cache_max_bytes=0))
+    asyncio.run(seed_if_empty(container))
+    return container
+
+
+def _answers(container: Container, query: str, variables: dict[str, Any]) -> tuple[str, str]:
+    """A plan's response with fragments, and the generic executor's, both encoded."""
+    context = container.graphql_context()
+    context.fragment_cache = container.fragment_cache
+    compiled = asyncio.run(ExecutionPlans(get_schema()).register(query).execute(context, variables))
+    generic = asyncio.run(
+        get_schema().execute(
+            query, variable_values=variables, context_value=container.graphql_context()
+        )
+    )
+    assert compiled is not None
+    assert generic.errors is None
+    return encode_json(compiled), json.dumps(generic.data)
+
+
+def test_warm_responses_are_spliced_from_cached_fragments() -> None:
+    container = _container()
+    cache = container.fragment_cache
+    author_id = str(asyncio.run(container.author_repository.find_all())[0].id)
+
+    for query, variables in ((_BOOKS, {"first": 5}), (_AUTHOR, {"id": author_id})):
+        cold, generic = _answers(container, query, variables)
+        misses, hits = cache.misses, cache.hits
+        warm, _ = _answers(container, query, variables)
+
+        assert cold == warm == generic
+        assert cache.misses == misses
+        assert cache.hits > hits
+
+
+def test_a_change_drops_the_fragments_built_from_the_changed_entity() -> None:
+    container = _container()
+    book = asyncio.run(container.book_repository.find_all())[0]
+    _answers(container, _BOOKS, {"first": 8})
+    _answers(container, _AUTHOR, {"id": str(book.author_id)})
+
+    asyncio.run(container.change_author_name_handler(str(book.author_id), "Renamed", "Author"))
+    asyncio.run(container.change_book_title_handler(str(book.id), "Retitled"))
+    books, generic_books = _answers(container, _BOOKS, {"first": 8})
+    author, generic_author = _answers(container, _AUTHOR, {"id": str(book.author_id)})
+
+    assert books == generic_books
+    assert author == generic_author
+    assert '"fullName": "Renamed Author"' in books
+    assert '"title": "Retitled"' in books and '"title": "Retitled"' in author
+
+
+def test_encode_json_splices_fragments_where_json_dumps_would_write_their_value() -> None:
+    book = {"id": "1", "title": "Café", "genres": [{"name": "Fiction"}]}
+    fragment = Fragment(json.dumps(book), frozenset({"Book:1"}))
+    data = {"books": {"edges": [{"node": fragment}, {"node": None}]}, "total": 2}
+
+    assert encode_json(data) == json.dumps(
+        {"books": {"edges": [{"node": book}, {"node": None}]}, "total": 2}
+    )
+    assert encode_json({"plain": [1, "two"]}) == json.dumps({"plain": [1, "two"]})
@@ -0,0 +1,79 @@
+import asyncio
+from typing import Any
+
+from bookshelf.adapters.bootstrap import Container
+from bookshelf.adapters.inbound.graphql.context import GraphQLContext
+from bookshelf.adapters.inbound.graphql.schema import get_schema
+from bookshelf.adapters.seeder import seed_if_empty
+from bookshelf.adapters.settings import Settings
+from bookshelf.application.identity_map import current_identity_map
+
+_TITLE = "query Title($id: String!) { book(bookId: $id) { ... on BookType { title } } }"
+
+
+def _container() -> Container:
+    # The response cache would answer repeated queries before the map is consulted.
+    container = Container(settings=Settings(response_cache_max_bytes=0))
+    asyncio.run(seed_if_empty(container))
+    return container
+
+
+def _execute(context: GraphQLContext, query: str, variables: dict[str, Any]) -> Any:
+    result = asyncio.run(
+        get_schema().execute(query, variable_values=variables, context_value=context)
+    )
+    assert result.errors is None
+    return result.data
+
+
+def _first_book_id(container: Container) -> str:
+    return str(asyncio.run(container.book_repository.find_all())[0].id)
+
+
+def test_one_request_loads_each_aggregate_once() -> None:
+    container = _container()
+    context = container.graphql_context()
+
+    data = _execute(
+        context,
+        """
+        mutation Edit($id: String!) {
+          title: changeBookTitle(input: {bookId: $id, newTitle: "Mapped"}) {
+            ... on BookType { title }
+          }
+          summary: changeBookSummary(input: {bookId: $id, newSummary: "Mapped too."}) {
+            ... on BookType { title summary }
+          }
+        }
+        """,
+        {"id": _first_book_id(container)},
+    )
+
+    # The second mutation edits the instance the first one saved.
+    assert data["summary"] == {"title": "Mapped", "summary": "Mapped too."}
+    assert context.identity_map is not None
+    assert context.identity_map.hits == 1
+
+
+def test_requests_do_not_share_loaded_aggregates() -> None:
+    container = _container()
+    book_id = _first_book_id(container)
+    first = container.graphql_context()
+    _execute(first, _TITLE, {"id": book_id})
+
+    # Saved outside any request, so no identity map hears about it.
+    asyncio.run(container.change_book_title_handler(book_id, "Changed Meanwhile"))
+    second = container.graphql_context()
+    data = _execute(second, _TITLE, {"id": book_id})
+
+    assert second.identity_map is not first.identity_map
+    assert data["book"] == {"title": "Changed Meanwhile"}
+
+
+def test_the_map_is_only_active_while_an_operation_executes() -> None:
+    container = _container()
+    context = container.graphql_context()
+
+    _execute(context, _TITLE, {"id": _first_book_id(container)})
+
+    assert current_identity_map.get() is None
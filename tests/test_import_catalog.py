@@ -0,0 +1,140 @@
+import asyncio
+import csv
+import io
+import json
+from pathlib import Path
+from typing import Any
+
+from bookshelf.adapters.bootstrap import Container
+from bookshelf.adapters.inbound.cli.import_catalog import ImportStats, import_catalog
+from bookshelf.adapters.seeder import seed_if_empty
+from bookshelf.adapters.settings import Settings
+
+_FIELDS = [
+    "title",
+    "isbn",
+    "summary",
+    "published_year",
+    "page_count",
+    "genres",
+    "author_first_name",
+    "author_last_name",
+]
+
+
+def _isbn(n: int) -> str:
+    digits = f"978{n:09d}"
+    check = -sum(int(d) * (1 if i % 2 == 0 else 3) for i, d in enumerate(digits)) % 10
+    return f"{digits}{check}"
+
+
+def _row(n: int, **overrides: Any) -> dict[str, Any]:
+    row = {
+        "title": f"Imported {n}",
+        "isbn": _isbn(n),
+        "summary": "From a dump.",
+        "published_year": 1999,
+        "page_count": 321,
+        "genres": "Fiction|Mystery",
+        "author_first_name": "Imported",
+        "author_last_name": "Author",
+    }
+    return row | overrides
+
+
+def _write_csv(path: Path, rows: list[dict[str, Any]]) -> None:
+    with path.open("w", newline="", encoding="utf-8") as stream:
+        writer = csv.DictWriter(stream, fieldnames=_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _import(
+    container: Container, source: Path, rejects: io.StringIO | None = None
+) -> ImportStats:
+    return asyncio.run(
+        import_catalog(source, container=container, chunk_size=2, workers=1, rejects=rejects)
+    )
+
+
+def _container() -> Container:
+    container = Container(settings=Settings())
+    asyncio.run(seed_if_empty(container))
+    return container
+
+
+def _titles_by_author(container: Container) -> dict[str, set[str]]:
+    authors = {
+        author.id: author.name.full_name
+        for author in asyncio.run(container.author_repository.find_all())
+    }
+    titles: dict[str, set[str]] = {}
+    for book in asyncio.run(container.book_repository.find_all()):
+        titles.setdefault(authors[book.author_id], set()).add(book.title.value)
+    return titles
+
+
+def test_a_csv_dump_is_imported_and_bad_rows_are_reported_by_line(tmp_path: Path) -> None:
+    container = _container()
+    source = tmp_path / "catalog.csv"
+    _write_csv(
+        source,
+        [
+            _row(1),
+            _row(2, isbn="not an isbn"),
+            _row(3, author_first_name="George", author_last_name="Orwell"),
+            _row(4, isbn=_isbn(1)),
+            _row(5, genres="Fiction|Cookery"),
+            _row(6),
+        ],
+    )
+    rejects = io.StringIO()
+
+    stats = _import(container, source, rejects)
+
+    assert (stats.rows, stats.imported, stats.rejected) == (6, 3, 3)
+    reported = [json.loads(line) for line in rejects.getvalue().splitlines()]
+    # Line 1 is the header.
+    assert [(row["line"], row["code"]) for row in reported] == [
+        (3, "INVALID_ISBN"),
+        (5, "DUPLICATE_ISBN"),
+        (6, "INVALID_GENRE"),
+    ]
+    titles = _titles_by_author(container)
+    assert titles["Imported Author"] == {"Imported 1", "Imported 6"}
+    assert "Imported 3" in titles["George Orwell"]
+
+
+def test_a_jsonl_dump_accepts_genre_arrays(tmp_path: Path) -> None:
+    container = _container()
+    source = tmp_path / "catalog.jsonl"
+    source.write_text(
+        json.dumps(_row(1, genres=["Fantasy", "Horror"]))
+        + "\n\n"
+        + json.dumps(_row(2, page_count="many"))
+        + "\n"
+    )
+    rejects = io.StringIO()
+
+    stats = _import(container, source, rejects)
+
+    assert (stats.imported, stats.rejected) == (1, 1)
+    assert json.loads(rejects.getvalue())["line"] == 3
+    books = asyncio.run(container.book_repository.find_all())
+    imported = next(book for book in books if book.title.value == "Imported 1")
+    assert [genre.value for genre in imported.genres] == ["Fantasy", "Horror"]
+
+
+def test_a_rerun_resumes_after_the_checkpoint(tmp_path: Path) -> None:
+    source = tmp_path / "catalog.csv"
+    _write_csv(source, [_row(n) for n in range(1, 6)])
+    first = _container()
+    assert _import(first, source).imported == 5
+
+    # The dump grew; only the new rows are read on the next run.
+    _write_csv(source, [_row(n) for n in range(1, 8)])
+    second = _container()
+    stats = _import(second, source)
+
+    assert (stats.resumed_at, stats.rows, stats.imported) == (5, 7, 2)
+    assert _titles_by_author(second)["Imported Author"] == {"Imported 6", "Imported 7"}
@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from bookshelf.adapters.outbound.persistence.in_memory_book_repository import (
+    InMemoryBookRepository,
+)
+from bookshelf.domain.exception.exceptions import DuplicateIsbnError
+from bookshelf.domain.model.book import Book
+from bookshelf.domain.model.identifiers import AuthorId, BookId
+from bookshelf.domain.model.value_objects import (
+    ISBN,
+    BookTitle,
+    Genre,
+    PageCount,
+    PublishedYear,
+    Summary,
+)
+
+
+def _isbn(n: int) -> ISBN:
+    digits = f"978{n:09d}"
+    check = -sum(int(d) * (1 if i % 2 == 0 else 3) for i, d in enumerate(digits)) % 10
+    return ISBN(f"{digits}{check}")
+
+
+def _book(book_id: str, isbn: ISBN) -> Book:
+    return Book(
+        _id=BookId(book_id),
+        _author_id=AuthorId("author"),
+        _title=BookTitle("Title"),
+        _isbn=isbn,
+        _summary=Summary("Summary."),
+        _published_year=PublishedYear(1949),
+        _page_count=PageCount(328),
+        _genres=[Genre.FICTION],
+    )
+
+
+def test_save_rejects_an_isbn_held_by_another_book() -> None:
+    repository = InMemoryBookRepository()
+    asyncio.run(repository.save(_book("b1", _isbn(1))))
+
+    asyncio.run(repository.save(_book("b1", _isbn(1))))
+    with pytest.raises(DuplicateIsbnError):
+        asyncio.run(repository.save(_book("b2", _isbn(1))))
+
+
+def test_save_all_writes_nothing_on_a_clash() -> None:
+    repository = InMemoryBookRepository()
+    asyncio.run(repository.save(_book("b1", _isbn(1))))
+
+    for batch in (
+        [_book("b2", _isbn(2)), _book("b3", _isbn(1))],
+        [_book("b2", _isbn(2)), _book("b3", _isbn(2))],
+    ):
+        with pytest.raises(DuplicateIsbnError):
+            asyncio.run(repository.save_all(batch))
+
+    assert asyncio.run(repository.find_by_id(BookId("b2"))) is None
+    assert asyncio.run(repository.existing_isbns([_isbn(1), _isbn(2)])) == {_isbn(1)}
+
+
+def test_a_changed_isbn_frees_the_old_one() -> None:
+    repository = InMemoryBookRepository()
+    asyncio.run(repository.save(_book("b1", _isbn(1))))
+
+    asyncio.run(repository.save(_book("b1", _isbn(2))))
+
+    assert not asyncio.run(repository.isbn_exists(_isbn(1)))
+    assert asyncio.run(repository.isbn_exists(_isbn(2)))
+    assert not asyncio.run(repository.isbn_exists(_isbn(2), exclude_book_id=BookId("b1")))
+    asyncio.run(repository.save(_book("b2", _isbn(1))))
+
+
+def test_a_deleted_book_frees_its_isbn() -> None:
+    repository = InMemoryBookRepository()
+    book = _book("b1", _isbn(1))
+    asyncio.run(repository.save(book))
+
+    asyncio.run(repository.delete(book))
+
+    assert asyncio.run(repository.existing_isbns([_isbn(1)])) == set()
+    asyncio.run(repository.save_all([_book("b2", _isbn(1))]))
+
+
+def test_existing_isbns_reports_only_stored_ones() -> None:
+    repository = InMemoryBookRepository()
+    asyncio.run(repository.save_all([_book(f"b{n}", _isbn(n)) for n in range(5)]))
+
+    found = asyncio.run(repository.existing_isbns([_isbn(3), _isbn(4), _isbn(9)]))
+
+    assert found == {_isbn(3), _isbn(4)}
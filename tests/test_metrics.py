@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from bookshelf.adapters.bootstrap import Container
+from bookshelf.adapters.inbound.graphql.middleware.tracing import (
+    OPERATION_DURATION,
+    RESOLVER_DURATION,
+)
+from bookshelf.adapters.inbound.graphql.schema import get_schema
+from bookshelf.adapters.metrics import HdrHistogram, MetricsRegistry
+from bookshelf.adapters.seeder import seed_if_empty
+from bookshelf.adapters.settings import Settings
+
+
+@pytest.mark.parametrize("value", [0, 1, 63, 64, 1000, 123_456, 10**9])
+def test_a_histogram_reproduces_values_within_its_relative_error(value: int) -> None:
+    histogram = HdrHistogram()
+    for _ in range(10):
+        histogram.record(value)
+
+    assert histogram.value_at_quantile(0.5) == pytest.approx(value, rel=0.032)
+    assert histogram.value_at_quantile(0.999) <= value
+
+
+def test_histogram_quantiles_follow_the_recorded_distribution() -> None:
+    histogram = HdrHistogram()
+    for value in range(1, 10_001):
+        histogram.record(value)
+
+    assert histogram.count == 10_000
+    assert histogram.value_at_quantile(0.5) == pytest.approx(5_000, rel=0.032)
+    assert histogram.value_at_quantile(0.99) == pytest.approx(9_900, rel=0.032)
+    assert histogram.value_at_quantile(1.0) == 10_000
+
+
+def test_histograms_render_as_prometheus_summaries() -> None:
+    registry = MetricsRegistry()
+    registry.histogram("latency_seconds", "Latency.", scale=1e6, field="Query.book").record(
+        2_000
+    )
+    registry.gauge("queue_depth", "Depth.", lambda: 3)
+
+    text = registry.render()
+
+    assert "# TYPE latency_seconds summary" in text
+    assert 'latency_seconds{field="Query.book",quantile="0.5"} 0.002' in text
+    assert 'latency_seconds_count{field="Query.book"} 1' in text
+    assert "# TYPE queue_depth gauge\nqueue_depth 3" in text
+
+
+def _run_book_query(sample_rate: float) -> MetricsRegistry:
+    container = Container(settings=Settings(trace_sample_rate=sample_rate))
+    asyncio.run(seed_if_empty(container))
+    book = asyncio.run(container.book_repository.find_all())[0]
+    result = asyncio.run(
+        get_schema().execute(
+            "query Title($id: String!) { book(bookId: $id) { ... on BookType { title } } }",
+            variable_values={"id": str(book.id)},
+            context_value=container.graphql_context(),
+        )
+    )
+    assert result.errors is None
+    return container.metrics
+
+
+def test_sampled_operations_record_resolver_and_operation_latency() -> None:
+    text = _run_book_query(sample_rate=1.0).render()
+
+    assert f'{RESOLVER_DURATION}_count{{field="Query.book"}} 1' in text
+    assert f'{RESOLVER_DURATION}_count{{field="BookType.title"}} 1' in text
+    assert f'{OPERATION_DURATION}_count{{operation="Title"}} 1' in text
+
+
+def test_unsampled_operations_record_nothing() -> None:
+    text = _run_book_query(sample_rate=0.0).render()
+
+    assert RESOLVER_DURATION not in text
+    assert OPERATION_DURATION not in text
@@ -0,0 +1,133 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+
+from bookshelf.adapters.bootstrap import Container
+from bookshelf.adapters.inbound.graphql.schema import get_schema
+from bookshelf.adapters.outbound.book_ranking_projector import BookRankingProjector
+from bookshelf.adapters.outbound.persistence.in_memory_author_repository import (
+    InMemoryAuthorRepository,
+)
+from bookshelf.adapters.outbound.persistence.in_memory_book_repository import (
+    InMemoryBookRepository,
+)
+from bookshelf.adapters.seeder import seed_if_empty
+from bookshelf.adapters.settings import Settings
+from bookshelf.domain.model.book import Book
+
+
+def _isbn(n: int) -> str:
+    digits = f"978{n:09d}"
+    check = -sum(int(d) * (1 if i % 2 == 0 else 3) for i, d in enumerate(digits)) % 10
+    return f"{digits}{check}"
+
+
+def _container() -> Container:
+    container = Container(settings=Settings())
+    asyncio.run(seed_if_empty(container))
+    return container
+
+
+def _count_finds(monkeypatch: pytest.MonkeyPatch, repository: type) -> list[object]:
+    """Record every id the handlers look up through the repository class's find_by_id."""
+    ids: list[object] = []
+    find_by_id = repository.find_by_id
+
+    async def counting(self: Any, id: Any) -> Any:
+        ids.append(id)
+        return await find_by_id(self, id)
+
+    async def unranked(self: Any, events: Any) -> None:
+        pass
+
+    # The ranking projector re-reads every book whose rank may have changed.
+    monkeypatch.setattr(BookRankingProjector, "publish", unranked)
+    monkeypatch.setattr(repository, "find_by_id", counting)
+    return ids
+
+
+def _missing_genre(book: Book) -> str:
+    held = {genre.value for genre in book.genres}
+    return next(name for name in ("Fiction", "Mystery", "Fantasy", "Horror") if name not in held)
+
+
+_BOOK_EDITS: dict[str, Callable[[Container, Book], Awaitable[Any]]] = {
+    "title": lambda c, book: c.change_book_title_handler(str(book.id), "Returned"),
+    "isbn": lambda c, book: c.change_book_isbn_handler(str(book.id), _isbn(42)),
+    "summary": lambda c, book: c.change_book_summary_handler(str(book.id), "Returned."),
+    "add genre": lambda c, book: c.add_genre_to_book_handler(str(book.id), _missing_genre(book)),
+    "remove genre": lambda c, book: c.remove_genre_from_book_handler(
+        str(book.id), book.genres[0].value
+    ),
+    "add review": lambda c, book: c.add_review_to_book_handler(str(book.id), 4, "Returned."),
+}
+
+
+@pytest.mark.parametrize("edit", _BOOK_EDITS.values(), ids=_BOOK_EDITS.keys())
+def test_book_edits_return_the_saved_book_after_one_lookup(
+    monkeypatch: pytest.MonkeyPatch, edit: Callable[[Container, Book], Awaitable[Any]]
+) -> None:
+    container = _container()
+    book = asyncio.run(container.book_repository.find_all())[0]
+    finds = _count_finds(monkeypatch, InMemoryBookRepository)
+
+    returned = asyncio.run(edit(container, book))
+
+    assert finds == [book.id]
+    stored = asyncio.run(container.get_book_by_id_handler(str(book.id)))
+    assert returned.as_dict() == stored.as_dict()
+
+
+def test_removing_a_review_returns_the_book_without_it(monkeypatch: pytest.MonkeyPatch) -> None:
+    container = _container()
+    book_id = str(asyncio.run(container.book_repository.find_all())[0].id)
+    added = asyncio.run(container.add_review_to_book_handler(book_id, 5, "Short-lived."))
+    review = added.reviews[-1]
+    finds = _count_finds(monkeypatch, InMemoryBookRepository)
+
+    returned = asyncio.run(container.remove_review_from_book_handler(book_id, review.id))
+
+    assert len(finds) == 1
+    assert review.id not in {kept.id for kept in returned.reviews}
+
+
+def test_author_edits_return_the_saved_author_after_one_lookup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    container = _container()
+    author_id = str(asyncio.run(container.author_repository.find_all())[0].id)
+    finds = _count_finds(monkeypatch, InMemoryAuthorRepository)
+
+    renamed = asyncio.run(container.change_author_name_handler(author_id, "Returned", "Name"))
+    described = asyncio.run(container.change_author_biography_handler(author_id, "Returned."))
+
+    assert len(finds) == 2
+    assert renamed.name.full_name == "Returned Name"
+    stored = asyncio.run(container.get_author_by_id_handler(author_id))
+    assert described.as_dict() == stored.as_dict()
+
+
+def test_add_review_mutation_selects_the_new_review() -> None:
+    container = _container()
+    book_id = str(asyncio.run(container.book_repository.find_all())[0].id)
+
+    result = asyncio.run(
+        get_schema().execute(
+            """
+            mutation Review($id: String!) {
+              addReviewToBook(input: {bookId: $id, rating: 3, comment: "Fresh."}) {
+                ... on BookType { reviewCount reviews { rating comment } }
+              }
+            }
+            """,
+            variable_values={"id": book_id},
+            context_value=container.graphql_context(),
+        )
+    )
+
+    assert result.errors is None
+    book = result.data["addReviewToBook"]
+    assert book["reviews"][-1] == {"rating": 3, "comment": "Fresh."}
+    assert book["reviewCount"] == len(book["reviews"])
@@ -0,0 +1,131 @@
+import asyncio
+import sqlite3
+from pathlib import Path
+
+from bookshelf.adapters.bootstrap import Container
+from bookshelf.adapters.outbound.outbox_relay import OutboxRelay
+from bookshelf.adapters.outbound.persistence.sqlite_author_repository import (
+    SqliteAuthorRepository,
+)
+from bookshelf.adapters.outbound.persistence.sqlite_database import SqliteDatabase
+from bookshelf.adapters.seeder import seed_if_empty
+from bookshelf.adapters.settings import Settings
+from bookshelf.domain.event.domain_event import DomainEvent
+from bookshelf.domain.event.events import AuthorCreated
+from bookshelf.domain.model.author import Author
+from bookshelf.domain.model.identifiers import AuthorId
+from bookshelf.domain.model.value_objects import AuthorBiography, AuthorName
+from bookshelf.domain.port.event_publisher import EventPublisher
+
+
+class _RecordingPublisher(EventPublisher):
+    def __init__(self) -> None:
+        self.events: list[DomainEvent] = []
+
+    async def publish(self, events: list[DomainEvent]) -> None:
+        self.events.extend(events)
+
+
+def _outbox_size(path: Path) -> int:
+    database = SqliteDatabase(path)
+    try:
+        return database.query("SELECT COUNT(*) FROM outbox")[0][0]
+    finally:
+        database.close()
+
+
+def test_events_seeded_before_the_first_start_are_all_relayed(tmp_path: Path) -> None:
+    settings = Settings(database_path=tmp_path / "bookshelf.db")
+
+    async def seed() -> None:
+        # As `serve` prepares the store: seeded, never started.
+        container = Container(settings=settings)
+        try:
+            await seed_if_empty(container)
+        finally:
+            await container.stop()
+
+    async def serve() -> int:
+        container = Container(settings=settings)
+        await container.start()
+        await container.stop()
+        assert container.outbox_relay is not None
+        return container.outbox_relay.relayed
+
+    asyncio.run(seed())
+    seeded = _outbox_size(settings.database_path)
+    assert seeded > 0
+
+    assert asyncio.run(serve()) == seeded
+
+
+def test_feed_checkpoints_alone_do_not_prune(tmp_path: Path) -> None:
+    database = SqliteDatabase(tmp_path / "bookshelf.db")
+    with database.transaction() as connection:
+        connection.executemany(
+            "INSERT INTO outbox (payload) VALUES (?)", [("{}",), ("{}",), ("{}",)]
+        )
+
+    database.save_checkpoint("feed:1", database.outbox_head())
+    assert database.outbox_backlog(0) == 3
+
+    database.open_checkpoint("default")
+    database.save_checkpoint("default", 2)
+    assert database.outbox_backlog(0) == 1
+    database.close()
+
+
+def test_a_write_waiting_on_another_process_does_not_stall_the_event_loop(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "bookshelf.db"
+    database = SqliteDatabase(path)
+    repository = SqliteAuthorRepository(database)
+    author = Author(AuthorId("author-1"), AuthorName("Ada", "Lovelace"), AuthorBiography("Mathematician."))
+    other_process = sqlite3.connect(path, isolation_level=None)
+    other_process.execute("BEGIN IMMEDIATE")
+
+    async def run() -> None:
+        save = asyncio.create_task(repository.save(author))
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+        assert not save.done()
+        other_process.execute("COMMIT")
+        await save
+
+    asyncio.run(run())
+
+    assert database.query("SELECT id FROM authors") == [("author-1",)]
+    other_process.close()
+    database.close()
+
+
+def test_a_relay_stopping_while_another_process_writes_leaves_the_loop_free(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "bookshelf.db"
+    database = SqliteDatabase(path)
+    with database.transaction():
+        database.append_to_outbox(
+            [AuthorCreated(author_id=AuthorId("author-1"), name=AuthorName("Ada", "Lovelace"))]
+        )
+    publisher = _RecordingPublisher()
+    relay = OutboxRelay(database, publisher, exclusive=True)
+    other_process = sqlite3.connect(path, isolation_level=None)
+
+    async def run() -> None:
+        await relay.start()
+        other_process.execute("BEGIN IMMEDIATE")
+        stop = asyncio.create_task(relay.stop())
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+        assert not stop.done()
+        other_process.execute("COMMIT")
+        await stop
+
+    asyncio.run(run())
+
+    assert [event.event_name for event in publisher.events] == ["AuthorCreated"]
+    assert database.load_checkpoint("default") == 1
+    other_process.close()
+    database.close()
@@ -0,0 +1,91 @@
+import asyncio
+from typing import Any
+
+from bookshelf.adapters.bootstrap import Container
+from bookshelf.adapters.inbound.graphql.middleware.persisted_queries import query_hash
+from bookshelf.adapters.inbound.graphql.schema import get_schema
+from bookshelf.adapters.seeder import seed_if_empty
+from bookshelf.adapters.settings import Settings
+
+
+def _container() -> Container:
+    container = Container(settings=Settings())
+    asyncio.run(seed_if_empty(container))
+    return container
+
+
+def _execute(
+    container: Container,
+    query: str | None,
+    digest: str | None = None,
+    variables: dict[str, Any] | None = None,
+) -> Any:
+    extensions = (
+        {"persistedQuery": {"version": 1, "sha256Hash": digest}} if digest is not None else None
+    )
+    return asyncio.run(
+        get_schema().execute(
+            query,
+            variable_values=variables,
+            context_value=container.graphql_context(),
+            operation_extensions=extensions,
+        )
+    )
+
+
+def _codes(result: Any) -> list[str | None]:
+    return [(error.extensions or {}).get("code") for error in result.errors or ()]
+
+
+def test_an_unknown_hash_without_a_query_is_not_found() -> None:
+    container = _container()
+
+    result = _execute(container, None, query_hash("{ authors { id } } # unknown"))
+
+    assert _codes(result) == ["PERSISTED_QUERY_NOT_FOUND"]
+
+
+def test_a_hash_that_does_not_match_the_query_is_rejected() -> None:
+    container = _container()
+
+    result = _execute(container, "{ authors { id } }", query_hash("{ books { totalCount } }"))
+
+    assert _codes(result) == ["PERSISTED_QUERY_HASH_MISMATCH"]
+    assert result.data is None
+
+
+def test_a_registered_query_is_served_by_hash() -> None:
+    container = _container()
+    query = "query Registered { authors { edges { node { name { lastName } } } } }"
+
+    first = _execute(container, query, query_hash(query))
+    second = _execute(container, None, query_hash(query))
+
+    assert first.errors is None
+    assert second.errors is None
+    assert second.data == first.data
+
+
+def test_an_invalid_document_is_never_cached() -> None:
+    container = _container()
+    query = "query Invalid { authors { edges { node { name { middleName } } } } }"
+
+    first = _execute(container, query, query_hash(query))
+    replay = _execute(container, query, query_hash(query))
+    by_hash = _execute(container, None, query_hash(query))
+
+    assert first.errors and first.data is None
+    assert replay.errors and replay.data is None
+    assert "middleName" in replay.errors[0].message
+    assert _codes(by_hash) == ["PERSISTED_QUERY_NOT_FOUND"]
+
+
+def test_a_document_over_the_depth_limit_is_rejected_on_every_request() -> None:
+    container = _container()
+    nested = "author { books { " * 5
+    query = "query Deep { books(first: 1) { edges { node { " + nested + "id" + " } }" * 5 + " } } } }"
+
+    for _ in range(2):
+        result = _execute(container, query)
+        assert result.data is None
+        assert "depth" in result.errors[0].message
@@ -0,0 +1,87 @@
+import asyncio
+from typing import Any
+
+from bookshelf.adapters.bootstrap import Container
+from bookshelf.adapters.inbound.graphql.schema import get_schema
+from bookshelf.adapters.seeder import seed_if_empty
+from bookshelf.adapters.settings import Settings
+
+
+def _container() -> Container:
+    container = Container(settings=Settings())
+    asyncio.run(seed_if_empty(container))
+    return container
+
+
+def _execute(container: Container, query: str, variables: dict[str, Any] | None = None) -> Any:
+    return asyncio.run(
+        get_schema().execute(
+            query, variable_values=variables, context_value=container.graphql_context()
+        )
+    )
+
+
+def _cost(result: Any) -> int:
+    return result.extensions["cost"]["requested"]
+
+
+def test_each_list_item_costs_at_least_one() -> None:
+    container = _container()
+
+    result = _execute(container, "{ topBooks(first: 3) { title isbn } }")
+
+    # topBooks weighs 2, and each of its 3 items selects only scalars.
+    assert result.errors is None
+    assert _cost(result) == 2 + 3
+
+
+def test_a_variable_first_sets_the_list_size() -> None:
+    container = _container()
+    query = "query Top($first: Int!) { topBooks(first: $first) { title } }"
+
+    assert _cost(_execute(container, query, {"first": 4})) == 2 + 4
+    assert _cost(_execute(container, query, {"first": 40})) == 2 + 40
+
+
+def test_lists_without_first_use_their_assumed_size() -> None:
+    container = _container()
+
+    result = _execute(container, "{ topBooks { title } }")
+
+    assert _cost(result) == 2 + 10
+
+
+def test_fragments_cost_the_same_as_inline_selections() -> None:
+    container = _container()
+    inline = "{ books(first: 7) { edges { node { title author { id } } } } }"
+    named = (
+        "query { books(first: 7) { edges { node { ...BookFields } } } } "
+        "fragment BookFields on BookType { title author { id } }"
+    )
+    typed = "{ books(first: 7) { edges { node { ... on BookType { title author { id } } } } } }"
+
+    costs = {_cost(_execute(container, query)) for query in (inline, named, typed)}
+
+    # books weighs 5; each of its 7 edges holds a node (1) with an author (1).
+    assert costs == {5 + 7 * (1 + 1 + 1)}
+
+
+def test_a_huge_list_of_scalars_is_rejected() -> None:
+    container = _container()
+
+    result = _execute(container, "{ topBooks(first: 100000000) { title isbn } }")
+
+    assert result.data is None
+    assert "exceeds maximum allowed cost" in result.errors[0].message
+
+
+def test_a_huge_page_requested_through_a_variable_is_rejected() -> None:
+    container = _container()
+    query = "query Page($first: Int!) { books(first: $first) { edges { node { title } } } }"
+
+    within = _execute(container, query, {"first": 10})
+    over = _execute(container, query, {"first": 10_000_000})
+
+    assert within.errors is None
+    assert over.data is None
+    assert "exceeds maximum allowed cost" in over.errors[0].message
@@ -0,0 +1,100 @@
+import asyncio
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from bookshelf.adapters.bootstrap import Container
+from bookshelf.adapters.inbound.graphql.schema import get_schema
+from bookshelf.adapters.seeder import seed_if_empty
+from bookshelf.adapters.settings import Settings
+from bookshelf.application import read_models
+from bookshelf.application.read_models import book_to_read_model
+from bookshelf.domain.model.identifiers import ReviewId
+from bookshelf.domain.model.value_objects import Genre, Rating, ReviewComment
+
+
+def _container() -> Container:
+    # A cached response would be served without building any read models.
+    container = Container(settings=Settings(response_cache_max_bytes=0))
+    asyncio.run(seed_if_empty(container))
+    return container
+
+
+def _count_conversions(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    """Count the genre and review read models built from here on."""
+    counts = {"genres": 0, "reviews": 0}
+    converters = {
+        "genres": read_models._genre_to_read_model,
+        "reviews": read_models._review_to_read_model,
+    }
+    for kind, converter in converters.items():
+
+        def counting(value: Any, kind: str = kind, converter: Any = converter) -> Any:
+            counts[kind] += 1
+            return converter(value)
+
+        monkeypatch.setattr(read_models, converter.__name__, counting)
+    return counts
+
+
+def test_genres_and_reviews_are_converted_once_when_first_read(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    container = _container()
+    book_id = str(asyncio.run(container.book_repository.find_all())[0].id)
+    asyncio.run(container.add_review_to_book_handler(book_id, 4, "Read twice."))
+    counts = _count_conversions(monkeypatch)
+
+    books = asyncio.run(container.get_all_books_handler())
+    assert all(book.title for book in books)
+    assert counts == {"genres": 0, "reviews": 0}
+
+    book = next(book for book in books if book.id == book_id)
+    genres, reviews = book.genres, book.reviews
+    expected = {"genres": len(genres), "reviews": len(reviews)}
+
+    assert counts == expected and expected["reviews"] > 0
+    assert book.genres is genres and book.reviews is reviews
+    assert counts == expected
+
+
+def test_a_read_model_keeps_the_book_as_it_was_built() -> None:
+    container = _container()
+    book = asyncio.run(container.book_repository.find_all())[0]
+    genres = [genre.value for genre in book.genres]
+    review_ids = [str(review.id) for review in book.reviews]
+    model = book_to_read_model(book)
+
+    # Changed before the model converts anything.
+    book.add_genre(next(genre for genre in Genre if genre.value not in genres))
+    book.add_review(ReviewId("late"), Rating.ONE, ReviewComment("Late."), datetime.now(UTC))
+
+    assert [genre.name for genre in model.genres] == genres
+    assert [review.id for review in model.reviews] == review_ids
+    assert model.review_count == len(review_ids)
+
+
+def test_a_query_for_scalar_fields_converts_no_genres_or_reviews(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    container = _container()
+    counts = _count_conversions(monkeypatch)
+
+    def books(selection: str) -> Any:
+        result = asyncio.run(
+            get_schema().execute(
+                f"{{ books(first: 20) {{ edges {{ node {{ {selection} }} }} }} }}",
+                context_value=container.graphql_context(),
+            )
+        )
+        assert result.errors is None
+        return [edge["node"] for edge in result.data["books"]["edges"]]
+
+    titled = books("title isbn")
+    assert counts == {"genres": 0, "reviews": 0}
+
+    with_genres = books("title genres { name }")
+    assert counts["genres"] == sum(len(book["genres"]) for book in with_genres) > 0
+    assert counts["reviews"] == 0
+    assert [book["title"] for book in with_genres] == [book["title"] for book in titled]
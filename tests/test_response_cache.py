@@ -0,0 +1,154 @@
+import asyncio
+from typing import Any
+
+from bookshelf.adapters.bootstrap import Container
+from bookshelf.adapters.inbound.graphql.schema import get_schema
+from bookshelf.adapters.outbound.response_cache import ResponseCache, ResponseCacheInvalidator
+from bookshelf.adapters.seeder import seed_if_empty
+from bookshelf.adapters.settings import Settings
+from bookshelf.domain.event.events import BookCreated, BookTitleChanged
+from bookshelf.domain.model.identifiers import AuthorId, BookId
+from bookshelf.domain.model.value_objects import ISBN, BookTitle
+
+BOOK = "query Book($id: String!) { book(bookId: $id) { ... on BookType { title } } }"
+
+
+def _cache_with_entries() -> ResponseCache:
+    cache = ResponseCache()
+    cache.put("book-1", {"title": "One"}, {"Book:1"}, cache.version)
+    cache.put("book-2", {"title": "Two"}, {"Book:2"}, cache.version)
+    cache.put("books", [{"title": "One"}, {"title": "Two"}], {"Book:*"}, cache.version)
+    cache.put("author-a", {"books": [{"title": "One"}]}, {"Author:a", "AuthorBooks:a"}, 0)
+    return cache
+
+
+def test_a_book_change_invalidates_that_book_and_the_book_lists() -> None:
+    cache = _cache_with_entries()
+    event = BookTitleChanged(book_id=BookId("1"), new_title=BookTitle("Uno"))
+
+    asyncio.run(ResponseCacheInvalidator(cache).publish([event]))
+
+    assert cache.get("book-1") is None
+    assert cache.get("books") is None
+    assert cache.get("book-2") == {"title": "Two"}
+    assert cache.get("author-a") is not None
+
+
+def test_a_new_book_invalidates_its_authors_books() -> None:
+    cache = _cache_with_entries()
+    event = BookCreated(
+        book_id=BookId("3"),
+        author_id=AuthorId("a"),
+        title=BookTitle("Three"),
+        isbn=ISBN("978-0-452-28423-4"),
+    )
+
+    asyncio.run(ResponseCacheInvalidator(cache).publish([event]))
+
+    assert cache.get("author-a") is None
+    assert cache.get("books") is None
+    assert cache.get("book-1") is not None
+
+
+def test_a_result_computed_during_a_write_to_its_dependencies_is_not_stored() -> None:
+    cache = ResponseCache()
+    since_version = cache.version
+    cache.invalidate(["Book:1", "Book:*"])
+
+    cache.put("book-1", {"title": "One"}, {"Book:1"}, since_version)
+    cache.put("book-2", {"title": "Two"}, {"Book:2"}, since_version)
+
+    assert cache.get("book-1") is None
+    assert cache.get("book-2") == {"title": "Two"}
+
+
+def test_a_result_older_than_the_change_log_is_not_stored() -> None:
+    cache = ResponseCache(change_log_size=2)
+    since_version = cache.version
+    for i in range(3):
+        cache.invalidate([f"Book:{i}"])
+
+    cache.put("author-a", {"name": "A"}, {"Author:a"}, since_version)
+
+    assert cache.get("author-a") is None
+
+
+def test_eviction_keeps_the_cache_within_its_byte_bound() -> None:
+    cache = ResponseCache(max_bytes=100)
+    # Each entry counts 40 bytes: its size plus the length of its key.
+    cache.put("a", "x", {"Book:a"}, cache.version, size=39)
+    cache.put("b", "x", {"Book:b"}, cache.version, size=39)
+    cache.get("a")
+    cache.put("c", "x", {"Book:c"}, cache.version, size=39)
+
+    assert cache.get("a") == "x"
+    assert cache.get("b") is None
+    assert cache.get("c") == "x"
+    assert cache.stats()["bytes"] == 80
+    assert cache.stats()["evictions"] == 1
+
+
+def test_an_entry_larger_than_the_bound_is_not_stored() -> None:
+    cache = ResponseCache(max_bytes=100)
+
+    cache.put("big", "x" * 200, {"Book:1"}, cache.version)
+
+    assert cache.get("big") is None
+    assert cache.stats()["bytes"] == 0
+
+
+def _container() -> Container:
+    container = Container(settings=Settings())
+    asyncio.run(seed_if_empty(container))
+    return container
+
+
+async def _query(container: Container, query: str, variables: dict[str, Any]) -> Any:
+    return await get_schema().execute(
+        query, variable_values=variables, context_value=container.graphql_context()
+    )
+
+
+def test_a_mutation_invalidates_cached_responses() -> None:
+    container = _container()
+
+    async def scenario() -> None:
+        book = (await container.get_all_books_handler())[0]
+        first = await _query(container, BOOK, {"id": book.id})
+        second = await _query(container, BOOK, {"id": book.id})
+        assert first.extensions["responseCache"] == {"hit": False}
+        assert second.extensions["responseCache"] == {"hit": True}
+
+        await container.change_book_title_handler(book_id=book.id, new_title="Renamed")
+
+        third = await _query(container, BOOK, {"id": book.id})
+        assert third.extensions["responseCache"] == {"hit": False}
+        assert third.data == {"book": {"title": "Renamed"}}
+
+    asyncio.run(scenario())
+
+
+def test_a_response_read_before_a_concurrent_write_is_not_cached() -> None:
+    container = _container()
+
+    async def scenario() -> None:
+        book = (await container.get_all_books_handler())[0]
+        context = container.graphql_context()
+        read = context.get_book_by_id_handler
+
+        async def read_then_write(book_id: str) -> Any:
+            stale = await read(book_id=book_id)
+            await container.change_book_title_handler(book_id=book_id, new_title="Renamed")
+            return stale
+
+        context.get_book_by_id_handler = read_then_write  # type: ignore[assignment]
+        raced = await get_schema().execute(
+            BOOK, variable_values={"id": book.id}, context_value=context
+        )
+        assert raced.data == {"book": {"title": book.title}}
+
+        after = await _query(container, BOOK, {"id": book.id})
+        assert after.extensions["responseCache"] == {"hit": False}
+        assert after.data == {"book": {"title": "Renamed"}}
+
+    asyncio.run(scenario())
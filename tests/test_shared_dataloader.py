@@ -0,0 +1,82 @@
+import asyncio
+from typing import Any
+
+from bookshelf.adapters.bootstrap import Container
+from bookshelf.adapters.inbound.graphql.schema import get_schema
+from bookshelf.adapters.seeder import seed_if_empty
+from bookshelf.adapters.settings import Settings
+
+_BOOK = """
+query Book($id: String!) {
+  book(bookId: $id) {
+    ... on BookType { author { name { fullName } books { title } } }
+  }
+}
+"""
+
+
+def _container() -> Container:
+    # Only the DataLoader cache is on, so nothing else can answer from memory.
+    container = Container(
+        settings=Settings(response_cache_max_bytes=0, fragment_cache_max_bytes=0)
+    )
+    asyncio.run(seed_if_empty(container))
+    return container
+
+
+def _execute(container: Container, query: str, variables: dict[str, Any]) -> Any:
+    result = asyncio.run(
+        get_schema().execute(
+            query, variable_values=variables, context_value=container.graphql_context()
+        )
+    )
+    assert result.errors is None
+    return result.data
+
+
+def _author(container: Container, book_id: str) -> dict[str, Any]:
+    return _execute(container, _BOOK, {"id": book_id})["book"]["author"]
+
+
+def _first_book(container: Container) -> Any:
+    return asyncio.run(container.book_repository.find_all())[0]
+
+
+def test_later_requests_reuse_loaded_authors_and_books() -> None:
+    container = _container()
+    book = _first_book(container)
+
+    first = _author(container, str(book.id))
+    hits = container.loader_cache.stats()["hits"]
+    second = _author(container, str(book.id))
+
+    assert second == first
+    assert container.loader_cache.stats()["hits"] == hits + 2
+
+
+def test_an_author_renamed_by_a_mutation_is_not_served_from_the_cache() -> None:
+    container = _container()
+    book = _first_book(container)
+    _author(container, str(book.id))
+
+    _execute(
+        container,
+        "mutation($i: ChangeAuthorNameInput!) { changeAuthorName(input: $i) { __typename } }",
+        {"i": {"authorId": str(book.author_id), "firstName": "Renamed", "lastName": "Author"}},
+    )
+
+    assert _author(container, str(book.id))["name"] == {"fullName": "Renamed Author"}
+
+
+def test_a_book_changed_by_a_mutation_is_not_served_from_its_authors_list() -> None:
+    container = _container()
+    book = _first_book(container)
+    _author(container, str(book.id))
+
+    _execute(
+        container,
+        "mutation($i: ChangeBookTitleInput!) { changeBookTitle(input: $i) { __typename } }",
+        {"i": {"bookId": str(book.id), "newTitle": "A New Title"}},
+    )
+
+    assert {"title": "A New Title"} in _author(container, str(book.id))["books"]
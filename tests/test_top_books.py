@@ -0,0 +1,39 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from bookshelf.adapters.bootstrap import Container
+from bookshelf.adapters.inbound.graphql.resolvers.queries import MAX_TOP_BOOKS
+from bookshelf.adapters.inbound.graphql.schema import get_schema
+from bookshelf.adapters.seeder import seed_if_empty
+from bookshelf.adapters.settings import Settings
+
+TOP_BOOKS = "query Top($first: Int!) { topBooks(first: $first) { title } }"
+
+
+def _top_books(first: int) -> tuple[Any, int]:
+    container = Container(settings=Settings())
+    asyncio.run(seed_if_empty(container))
+    result = asyncio.run(
+        get_schema().execute(
+            TOP_BOOKS, variable_values={"first": first}, context_value=container.graphql_context()
+        )
+    )
+    return result, len(asyncio.run(container.get_all_books_handler()))
+
+
+@pytest.mark.parametrize("first", [0, 3, MAX_TOP_BOOKS])
+def test_first_within_bounds_limits_the_ranking(first: int) -> None:
+    result, catalog_size = _top_books(first)
+
+    assert result.errors is None
+    assert len(result.data["topBooks"]) == min(first, catalog_size)
+
+
+@pytest.mark.parametrize("first", [-1, MAX_TOP_BOOKS + 1, 1000])
+def test_first_out_of_bounds_is_rejected(first: int) -> None:
+    result, _ = _top_books(first)
+
+    assert result.data is None
+    assert f"must be between 0 and {MAX_TOP_BOOKS}" in result.errors[0].message